@@ -0,0 +1,377 @@
+'''
+(*)~----------------------------------------------------------------------------------
+ Gaze-based playback control for the Gaze-Controlled VLC Plugin
+----------------------------------------------------------------------------------~(*)
+'''
+
+import collections
+import numpy as np
+
+PLAY = 'play'
+PAUSE = 'pause'
+
+# all gaze samples mapped onto a surface in one frame as arrays of length n (norm_pos: n x 2)
+Gaze_Samples = collections.namedtuple('Gaze_Samples', 'on_srf norm_pos confidence timestamp')
+
+
+def _confidence(gaze):
+    # depending on the Pupil version the confidence is stored in the surface gaze datum or in its base datum
+    try:
+        return gaze['confidence']
+    except KeyError:
+        return gaze['base_data']['confidence']
+
+
+def gaze_samples(gaze_on_srf):
+    """Load the 'gaze_on_srf' list of a surface event into a Gaze_Samples tuple of arrays
+    """
+    n = len(gaze_on_srf)
+    norm_pos = np.fromiter((c for g in gaze_on_srf for c in g['norm_pos']), np.float64, 2 * n).reshape(n, 2)
+    return Gaze_Samples(on_srf=np.fromiter((g['on_srf'] for g in gaze_on_srf), np.bool_, n),
+                        norm_pos=norm_pos,
+                        confidence=np.fromiter((_confidence(g) for g in gaze_on_srf), np.float64, n),
+                        timestamp=np.fromiter((g['timestamp'] for g in gaze_on_srf), np.float64, n))
+
+
+class One_Euro_Filter(object):
+    """One Euro filter (Casiez et al. 2012) for 2D gaze positions.
+
+    Slow gaze is smoothed strongly (min_cutoff [Hz]) and the cutoff frequency rises with the
+    gaze speed (beta), so saccades are followed with little lag.
+    """
+    def __init__(self, min_cutoff=1.0, beta=0.5, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self._x = None
+        self._dx = np.zeros(2)
+        self._t = None
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        return 1. / (1. + 1. / (2. * np.pi * cutoff * dt))
+
+    def filter(self, timestamps, norm_pos):
+        """Filter a batch of samples (n timestamps, n x 2 positions) and return the filtered positions
+        """
+        out = np.empty_like(norm_pos)
+        for i in range(len(timestamps)):
+            x, t = norm_pos[i], timestamps[i]
+            if self._x is None:
+                self._x = x.copy()
+            elif t > self._t:
+                dt = t - self._t
+                self._dx += self._alpha(self.d_cutoff, dt) * ((x - self._x) / dt - self._dx)
+                cutoff = self.min_cutoff + self.beta * np.abs(self._dx)
+                self._x += self._alpha(cutoff, dt) * (x - self._x)
+            self._t = t
+            out[i] = self._x
+        return out
+
+
+class Kalman_Filter(object):
+    """Constant-velocity Kalman filter for 2D gaze positions.
+
+    Both axes share the same motion model, so a single 2x2 covariance is kept for them.
+    process_noise is the spectral density of the acceleration, measurement_noise the variance
+    of a gaze sample (both in normalized surface units).
+    """
+    def __init__(self, process_noise=10., measurement_noise=4e-4):
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self.reset()
+
+    def reset(self):
+        # state (position, velocity) of both axes and covariance (p00, p01, p11)
+        self._x = None
+        self._v = np.zeros(2)
+        self._p = None
+        self._t = None
+
+    def filter(self, timestamps, norm_pos):
+        """Filter a batch of samples (n timestamps, n x 2 positions) and return the filtered positions
+        """
+        out = np.empty_like(norm_pos)
+        q, r = self.process_noise, self.measurement_noise
+        for i in range(len(timestamps)):
+            z, t = norm_pos[i], timestamps[i]
+            if self._x is None:
+                self._x = z.copy()
+                self._p = (r, 0., 1.)
+            else:
+                # predict
+                dt = max(t - self._t, 0.)
+                p00, p01, p11 = self._p
+                self._x += self._v * dt
+                p00 += dt * (2. * p01 + dt * p11) + q * dt ** 4 / 4.
+                p01 += dt * p11 + q * dt ** 3 / 2.
+                p11 += q * dt ** 2
+                # update with the measured position
+                s = p00 + r
+                k0, k1 = p00 / s, p01 / s
+                innovation = z - self._x
+                self._x += k0 * innovation
+                self._v += k1 * innovation
+                self._p = (p00 - k0 * p00, p01 - k0 * p01, p11 - k1 * p01)
+            self._t = t
+            out[i] = self._x
+        return out
+
+
+class Look_Away_Predictor(object):
+    """Predicts from saccades in the gaze stream that the gaze is about to leave the surface.
+
+    Two consecutive gaze movements faster than saccade_speed [surface units/s] in the same
+    direction are taken as a saccade. If its extrapolation over horizon seconds leaves the
+    surface, a look-away is predicted. Samples with a confidence below blink_confidence mark a
+    blink; the pupil detector produces fast spurious gaze movements around blinks, so no
+    prediction is made until blink_hold seconds after the blink.
+    """
+    def __init__(self, saccade_speed=2., horizon=0.05, blink_confidence=0.3, blink_hold=0.15):
+        self.saccade_speed = saccade_speed
+        self.horizon = horizon
+        self.blink_confidence = blink_confidence
+        self.blink_hold = blink_hold
+        self.reset()
+
+    def reset(self):
+        # the last three confident samples and the time of the last blink
+        self._t = np.empty(0)
+        self._pos = np.empty((0, 2))
+        self._last_blink = -np.inf
+        self.blinking = False
+
+    def update(self, samples, min_confidence, margin):
+        """Feed the gaze samples (Gaze_Samples) of one frame and return whether a look-away is predicted
+
+        margin is the distance outside the surface border where the gaze counts as off the surface.
+        """
+        if not len(samples.timestamp):
+            return False
+        blink = samples.confidence < self.blink_confidence
+        if blink.any():
+            self._last_blink = samples.timestamp[blink].max()
+        self.blinking = samples.timestamp.max() - self._last_blink < self.blink_hold
+
+        use = (samples.confidence >= min_confidence) & (samples.timestamp > self._last_blink)
+        t = np.concatenate((self._t, samples.timestamp[use]))[-3:]
+        pos = np.concatenate((self._pos, samples.norm_pos[use]))[-3:]
+        keep = t > self._last_blink
+        self._t, self._pos = t[keep], pos[keep]
+        if self.blinking or len(self._t) < 3:
+            return False
+
+        dt = np.diff(self._t)
+        if (dt <= 0.).any():
+            return False
+        velocity = np.diff(self._pos, axis=0) / dt[:, None]
+        if (np.hypot(velocity[:, 0], velocity[:, 1]) < self.saccade_speed).any() or velocity[0].dot(velocity[1]) <= 0.:
+            return False
+        predicted = self._pos[-1] + velocity[1] * self.horizon
+        return bool(((predicted < -margin) | (predicted > 1. + margin)).any())
+
+
+# gaze filters selectable in the plugin menu
+GAZE_FILTERS = {'none': None, 'one_euro': One_Euro_Filter, 'kalman': Kalman_Filter}
+
+
+class Playback_Control(object):
+    """State machine that decides when the player is played or paused.
+
+    The gaze has to stay on the surface for enter_dwell seconds to start the video and off the
+    surface for exit_dwell seconds to pause it. The surface boundary has hysteresis: gaze enters
+    the surface enter_margin inside of its border and leaves it exit_margin outside of it (both
+    in normalized surface coordinates). If the surface is not tracked, the current state is kept
+    for grace_period seconds before the video is paused.
+
+    All gaze samples of a frame are used: the gaze is on the surface if the confidence-weighted
+    fraction of samples on the surface is at least on_fraction. Samples with a confidence below
+    min_confidence are ignored. The positions are smoothed by the chosen filter of GAZE_FILTERS
+    before they are compared with the surface border.
+
+    Blinks do not change the state: without confident gaze on a tracked surface the state is kept
+    for max_blink seconds, after that the gaze counts as lost and grace_period applies. If
+    predict_look_away is set, the video is paused as soon as
+    a saccade leaving the surface is detected instead of waiting for exit_dwell. The time gained
+    is measured once the normal path confirms the look-away (see prediction_stats).
+    """
+    def __init__(self, enter_dwell=0.2, exit_dwell=0.3, grace_period=0.5, enter_margin=0.02, exit_margin=0.05,
+                 min_confidence=0.6, on_fraction=0.5, gaze_filter='one_euro', predict_look_away=True,
+                 max_blink=0.5):
+        self.predictor = Look_Away_Predictor()
+        self.predict_look_away = predict_look_away
+        # predicted pauses, mispredictions, and summed latency gain [s] of the confirmed predictions
+        self.n_predicted = 0
+        self.n_mispredicted = 0
+        self.n_confirmed = 0
+        self.latency_gain = 0.
+        self.gaze_filter = gaze_filter
+        self.min_confidence = min_confidence
+        self.on_fraction = on_fraction
+        self.enter_dwell = enter_dwell
+        self.exit_dwell = exit_dwell
+        self.grace_period = grace_period
+        self.max_blink = max_blink
+        self.enter_margin = enter_margin
+        self.exit_margin = exit_margin
+        self.reset()
+
+    @property
+    def gaze_filter(self):
+        return self._gaze_filter
+
+    @gaze_filter.setter
+    def gaze_filter(self, name):
+        filter_class = GAZE_FILTERS[name]
+        self._gaze_filter = name
+        self._filter = filter_class() if filter_class else None
+
+    def reset(self, playing=False):
+        # state the player is in
+        self.playing = playing
+        # whether the gaze was classified to be on the surface the last time
+        self.gaze_on = playing
+        # timestamps since when the gaze disagrees with the state and since when the surface is lost
+        self._pending_since = None
+        self._lost_since = None
+        # timestamp since when the surface is tracked without confident gaze (blink)
+        self._unreliable_since = None
+        # timestamp of the earliest gaze sample of the current frame on the side it is classified as 
+        # (on or off the surface), of the sample that started the pending transition, and of the 
+        # sample that caused the last command (Pupil clock)
+        self._frame_source = None
+        self._pending_source = None
+        self.source_timestamp = None
+        # time of the last predicted pause and since when the gaze is off the surface after it
+        self._predicted_at = None
+        self._off_since = None
+        self.predictor.reset()
+        if self._filter:
+            self._filter.reset()
+
+    def get_settings(self):
+        return {'enter_dwell': self.enter_dwell, 'exit_dwell': self.exit_dwell, 'grace_period': self.grace_period,
+                'enter_margin': self.enter_margin, 'exit_margin': self.exit_margin,
+                'min_confidence': self.min_confidence, 'on_fraction': self.on_fraction,
+                'gaze_filter': self.gaze_filter, 'predict_look_away': self.predict_look_away,
+                'max_blink': self.max_blink}
+
+    @property
+    def prediction_stats(self):
+        # summary of the look-away prediction for the plugin menu
+        if not self.n_confirmed:
+            gain = 'n/a'
+        else:
+            gain = '{:.0f} ms'.format(1000. * self.latency_gain / self.n_confirmed)
+        return '{} gained, {} predicted, {} wrong'.format(gain, self.n_predicted, self.n_mispredicted)
+
+    def is_on_surface(self, samples):
+        """Classify the gaze samples (Gaze_Samples) of one frame with hysteresis on the surface border
+
+        Returns None if there is no sample with sufficient confidence. The timestamp of the 
+        earliest sample on the side the frame is classified as is kept as source of a transition.
+        """
+        confident = samples.confidence >= self.min_confidence
+        if not confident.any():
+            return None
+        weights = samples.confidence[confident]
+        norm_pos = samples.norm_pos[confident]
+        if self._filter:
+            norm_pos = self._filter.filter(samples.timestamp[confident], norm_pos)
+        margin = -self.exit_margin if self.gaze_on else self.enter_margin
+        inside = ((norm_pos >= margin) & (norm_pos <= 1. - margin)).all(axis=1)
+        self.gaze_on = bool(weights.dot(inside) >= self.on_fraction * weights.sum())
+        agree = inside if self.gaze_on else ~inside
+        if agree.any():
+            self._frame_source = samples.timestamp[confident][agree].min()
+        return self.gaze_on
+
+    def process(self, timestamp, samples):
+        """Feed one frame and return the resulting command (PLAY, PAUSE, or None)
+
+        samples are the Gaze_Samples on the surface, or None if the surface is not tracked.
+        """
+        if samples is None:
+            self._frame_source = None
+            return self.update(timestamp, None)
+        newest = samples.timestamp.max() if len(samples.timestamp) else None
+        self._frame_source = newest
+        look_away = (self.predict_look_away and 
+                     self.predictor.update(samples, self.min_confidence, self.exit_margin))
+        on_surface = self.is_on_surface(samples) if len(samples.timestamp) else None
+        if on_surface is None or self.predictor.blinking:
+            # the surface is tracked but the eyes are closed: keep the current state for a blink,
+            # a longer gap is handled like a lost surface
+            if self._unreliable_since is None:
+                self._unreliable_since = timestamp
+            if timestamp - self._unreliable_since < self.max_blink:
+                self._lost_since = None
+                return None
+            return self.update(timestamp, None)
+        self._unreliable_since = None
+        self._measure_prediction(timestamp, on_surface)
+
+        if look_away and self.playing:
+            self.n_predicted += 1
+            self._predicted_at = timestamp
+            self._off_since = None
+            self.gaze_on = False
+            # the look-away is predicted from the newest samples
+            self._pending_source = newest
+            return self._switch(False)
+        return self.update(timestamp, on_surface)
+
+    def _measure_prediction(self, timestamp, on_surface):
+        # compare a predicted pause with the time the look-away is confirmed by the dwell time
+        if self._predicted_at is None:
+            return
+        if on_surface:
+            self.n_mispredicted += 1
+            self._predicted_at = None
+            return
+        if self._off_since is None:
+            self._off_since = timestamp
+        if timestamp - self._off_since >= self.exit_dwell:
+            self.n_confirmed += 1
+            self.latency_gain += timestamp - self._predicted_at
+            self._predicted_at = None
+
+    def update(self, timestamp, on_surface):
+        """Feed the gaze state of one frame and return the resulting command (PLAY, PAUSE, or None)
+
+        source_timestamp holds the timestamp of the gaze sample the returned command is based on.
+
+        on_surface is None if the surface is not tracked or there is no confident gaze in this frame.
+        """
+        if on_surface is None:
+            if self._lost_since is None:
+                self._lost_since = timestamp
+                self._pending_source = timestamp
+            if timestamp - self._lost_since < self.grace_period:
+                return None
+            # the grace period replaces the exit dwell time
+            return self._switch(False)
+        self._lost_since = None
+
+        if on_surface == self.playing:
+            self._pending_since = None
+            return None
+        if self._pending_since is None:
+            self._pending_since = timestamp
+            self._pending_source = self._frame_source or timestamp
+        dwell = self.enter_dwell if on_surface else self.exit_dwell
+        if timestamp - self._pending_since < dwell:
+            return None
+        return self._switch(on_surface)
+
+    def _switch(self, playing):
+        # change the state and return the command for this transition, if there is one
+        self._pending_since = None
+        if playing == self.playing:
+            return None
+        self.playing = playing
+        self.source_timestamp = self._pending_source
+        return PLAY if playing else PAUSE
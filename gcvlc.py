@@ -8,12 +8,15 @@
 '''
 
 import numpy as np
+import os
 import sys
+import time
+import ctypes
 from pyglui import ui
-from pyglui.cygl.utils import Named_Texture
 from glfw import *
 from gl_utils import *
 import OpenGL.GL as gl
+from OpenGL.GL import shaders
 from platform import system
 from plugin import Plugin
 
@@ -22,6 +25,15 @@ import logging
 logger = logging.getLogger(__name__)
 
 import myvlc
+# the libvlc binding used by myvlc, it is only loaded once the player is started
+vlc = myvlc.vlc
+import marker_family
+import gaze_control
+import instrumentation
+
+
+# stages of recent_events and gl_display_in_window that are timed by the profiler
+PROFILED_STAGES = ('gl_context', 'video_texture', 'markers', 'swap', 'surface_lookup', 'decision', 'libvlc')
 
 
 def on_resize(window, w, h):
@@ -31,37 +43,431 @@ def on_resize(window, w, h):
     adjust_gl_view(w,h)
     glfwMakeContextCurrent(active_window)
     
-def generate_marker(marker):
-    # generate marker matrix by upscaling a black-and-white pixel matrix using the Kronecker tensor product
-    #       0 -> black pixel
-    #     255 -> white pixel
-    n = 10
-    if marker == 'first':
-        mat = np.array([[0, 0, 0, 0, 0], [0, 255, 255, 255, 0], [0, 0, 0, 0, 0], [0, 0, 0, 255, 0], 
-                        [0, 0, 0, 0, 0]], np.uint8)
-        res = np.kron(mat, np.ones((n, n)))
-        return res.astype(np.uint8)
-    elif marker == 'second':
-        mat = np.array([[0, 0, 0, 0, 0], [0, 255, 255, 255, 0], [0, 0, 0, 255, 0], [0, 0, 0, 255, 0], 
-                        [0, 0, 0, 0, 0]], np.uint8)
-        res = np.kron(mat, np.ones((n, n)))
-        return res.astype(np.uint8)
-    elif marker == 'third':
-        mat = np.array([[0, 0, 0, 0, 0], [0, 255, 255, 255, 0], [0, 0, 0, 0, 0], [0, 0, 255, 255, 0], 
-                        [0, 0, 0, 0, 0]], np.uint8)
-        res = np.kron(mat, np.ones((n, n)))
-        return res.astype(np.uint8)
-    elif marker == 'fourth':
-        mat = np.array([[0, 0, 0, 0, 0], [0, 255, 255, 255, 0], [0, 0, 0, 255, 0], [0, 0, 255, 255, 0], 
-                        [0, 0, 0, 0, 0]], np.uint8)
-        res = np.kron(mat, np.ones((n, n)))
-        return res.astype(np.uint8)
- 
+class Marker_Atlas(object):
+    """Packs the four markers into one texture and draws them with a single vertex buffer draw call.
+    
+    The texture is only uploaded when a marker bitmap is replaced and the vertex data is only
+    rebuilt when the framebuffer size or the marker size changes. All GL calls have to be made
+    with the marker window being the current context.
+    """
+    # distance between the markers and the window border [pixels]
+    border = 10.0
+    
+    def __init__(self):
+        self._texture = None
+        self._vbo = None
+        # marker bitmaps the texture was built from
+        self._sources = None
+        # texture coordinates (u0, v0, u1, v1) of each marker inside the atlas
+        self._tiles = None
+        # (width, height, marker size) the vertex data was built for
+        self._geometry = None
+        
+    def update(self, markers):
+        """Upload the markers into the atlas texture if any of the bitmaps changed
+        
+        Markers are tiled in a 2x2 grid in the order top left, top right, bottom left, bottom right.
+        """
+        if self._sources is not None and all(a is b for a, b in zip(self._sources, markers)):
+            return
+        tile_h = max(m.shape[0] for m in markers)
+        tile_w = max(m.shape[1] for m in markers)
+        atlas = np.zeros((2 * tile_h, 2 * tile_w), np.uint8)
+        tiles = []
+        for i, m in enumerate(markers):
+            y, x = (i // 2) * tile_h, (i % 2) * tile_w
+            atlas[y:y + m.shape[0], x:x + m.shape[1]] = m
+            tiles.append((x / atlas.shape[1], y / atlas.shape[0], 
+                          (x + m.shape[1]) / atlas.shape[1], (y + m.shape[0]) / atlas.shape[0]))
+        
+        if self._texture is None:
+            self._texture = gl.glGenTextures(1)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self._texture)
+        gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
+        # nearest filtering keeps the marker edges sharp and prevents bleeding between tiles
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_NEAREST)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_NEAREST)
+        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_LUMINANCE, atlas.shape[1], atlas.shape[0], 0, 
+                        gl.GL_LUMINANCE, gl.GL_UNSIGNED_BYTE, atlas)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+        
+        self._sources = tuple(markers)
+        self._tiles = tiles
+        # texture coordinates are part of the vertex data
+        self._geometry = None
+        
+    def _update_vertices(self, window_size, m_size):
+        # rebuild the interleaved (x, y, u, v) vertex data of all four quads
+        geometry = (window_size[0], window_size[1], m_size)
+        if geometry == self._geometry:
+            return
+        w, h, b = float(window_size[0]), float(window_size[1]), self.border
+        rects = ((b, b, m_size, m_size), 
+                 (w - m_size, b, w - b, m_size), 
+                 (b, h - m_size, m_size, h - b), 
+                 (w - m_size, h - m_size, w - b, h - b))
+        vertices = np.empty((16, 4), np.float32)
+        for i, ((x0, y0, x1, y1), (u0, v0, u1, v1)) in enumerate(zip(rects, self._tiles)):
+            vertices[4 * i:4 * i + 4] = ((x0, y1, u0, v1), (x1, y1, u1, v1), (x1, y0, u1, v0), (x0, y0, u0, v0))
+        
+        if self._vbo is None:
+            self._vbo = gl.glGenBuffers(1)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._vbo)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, vertices.nbytes, vertices, gl.GL_STATIC_DRAW)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+        self._geometry = geometry
+        
+    def draw(self, window_size, m_size):
+        """Draw all markers for the given framebuffer size and marker size
+        """
+        if self._texture is None:
+            return
+        self._update_vertices(window_size, m_size)
+        
+        stride = 4 * ctypes.sizeof(ctypes.c_float)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._vbo)
+        gl.glEnableClientState(gl.GL_VERTEX_ARRAY)
+        gl.glEnableClientState(gl.GL_TEXTURE_COORD_ARRAY)
+        gl.glVertexPointer(2, gl.GL_FLOAT, stride, ctypes.c_void_p(0))
+        gl.glTexCoordPointer(2, gl.GL_FLOAT, stride, ctypes.c_void_p(2 * ctypes.sizeof(ctypes.c_float)))
+        gl.glEnable(gl.GL_TEXTURE_2D)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self._texture)
+        gl.glColor4f(1.0, 1.0, 1.0, 1.0)
+        
+        gl.glDrawArrays(gl.GL_QUADS, 0, 16)
+        
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+        gl.glDisable(gl.GL_TEXTURE_2D)
+        gl.glDisableClientState(gl.GL_TEXTURE_COORD_ARRAY)
+        gl.glDisableClientState(gl.GL_VERTEX_ARRAY)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+        
+    def free(self):
+        """Delete the GL texture and vertex buffer
+        """
+        if self._texture is not None:
+            gl.glDeleteTextures([self._texture])
+        if self._vbo is not None:
+            gl.glDeleteBuffers(1, [self._vbo])
+        self._texture = None
+        self._vbo = None
+        self._sources = None
+        self._tiles = None
+        self._geometry = None
+        
+
+def marker_frame_rect(window_size, m_size, border=Marker_Atlas.border):
+    # area between the left and the right markers (x0, y0, x1, y1) that is used to display the video
+    return (m_size, border, window_size[0] - m_size, window_size[1] - border)
+
+def fit_rect(rect, size):
+    # largest rectangle (x0, y0, x1, y1) with the aspect ratio of size that is centered inside rect
+    x0, y0, x1, y1 = rect
+    scale = min((x1 - x0) / size[0], (y1 - y0) / size[1])
+    w, h = size[0] * scale, size[1] * scale
+    x, y = (x0 + x1 - w) / 2., (y0 + y1 - h) / 2.
+    return (x, y, x + w, y + h)
+
+
+# GL texture formats (internal format, format) used for the planes of each chroma of myvlc.CHROMA_PLANES
+VIDEO_PLANE_FORMATS = {
+    'RV32': ((gl.GL_RGBA8, gl.GL_BGRA),),
+    'I420': ((gl.GL_LUMINANCE8, gl.GL_LUMINANCE),) * 3,
+    'NV12': ((gl.GL_LUMINANCE8, gl.GL_LUMINANCE), (gl.GL_LUMINANCE8_ALPHA8, gl.GL_LUMINANCE_ALPHA)),
+}
+
+VIDEO_VERTEX_SHADER = """
+void main() {
+    gl_TexCoord[0] = gl_MultiTexCoord0;
+    gl_Position = ftransform();
+}
+"""
+
+# fragment shaders converting the planes of a YUV frame (BT.601, limited range) to RGB
+VIDEO_FRAGMENT_SHADERS = {
+    'I420': """
+uniform sampler2D plane0, plane1, plane2;
+void main() {
+    vec2 t = gl_TexCoord[0].st;
+    float y = 1.164 * (texture2D(plane0, t).r - 0.0625);
+    float u = texture2D(plane1, t).r - 0.5;
+    float v = texture2D(plane2, t).r - 0.5;
+    gl_FragColor = vec4(y + 1.596 * v, y - 0.392 * u - 0.813 * v, y + 2.017 * u, 1.0);
+}
+""",
+    'NV12': """
+uniform sampler2D plane0, plane1;
+void main() {
+    vec2 t = gl_TexCoord[0].st;
+    float y = 1.164 * (texture2D(plane0, t).r - 0.0625);
+    vec4 uv = texture2D(plane1, t);
+    float u = uv.r - 0.5;
+    float v = uv.a - 0.5;
+    gl_FragColor = vec4(y + 1.596 * v, y - 0.392 * u - 0.813 * v, y + 2.017 * u, 1.0);
+}
+""",
+}
+
+
+class Video_Texture(object):
+    """Streams the frames decoded by a myvlc.VLC player into textures.
+    
+    Each plane of a frame is uploaded into its own texture, YUV frames are converted to RGB 
+    by a fragment shader while drawing. Frames are written into a ring of pixel buffer 
+    objects and uploaded from there, so copying a frame never waits for GL to finish reading 
+    a previous one. All GL calls have to be made with the marker window being the current context.
+    """
+    def __init__(self, n_buffers=3):
+        self.n_buffers = n_buffers
+        # frame ring of the player and number of the frame that was uploaded last
+        self.frame_count = 0
+        self._ring = None
+        self._textures = None
+        self._pbos = None
+        self._program = None
+        self._index = 0
+        self._format = None
+        
+    def has_new_frame(self, player):
+        # cheap check that does not need a GL context
+        ring = player.frame_ring
+        if ring is None:
+            return False
+        uploaded = self.frame_count if ring is self._ring else 0
+        return ring.sequence > uploaded
+        
+    def _allocate(self, frame_format):
+        # (re-)allocate textures, pixel buffers and shader for frames of the given format
+        self.free()
+        plane_formats = VIDEO_PLANE_FORMATS[frame_format.chroma]
+        self._textures = [gl.glGenTextures(1) for _ in frame_format.planes]
+        for texture, plane, (internal_format, pixel_format) in zip(self._textures, frame_format.planes, plane_formats):
+            gl.glBindTexture(gl.GL_TEXTURE_2D, texture)
+            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR)
+            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
+            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, gl.GL_CLAMP_TO_EDGE)
+            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, gl.GL_CLAMP_TO_EDGE)
+            gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, internal_format, plane[2], plane[3], 0, 
+                            pixel_format, gl.GL_UNSIGNED_BYTE, None)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+        self._pbos = gl.glGenBuffers(self.n_buffers)
+        if self.n_buffers == 1:
+            self._pbos = [self._pbos]
+        
+        if frame_format.chroma in VIDEO_FRAGMENT_SHADERS:
+            self._program = shaders.compileProgram(
+                shaders.compileShader(VIDEO_VERTEX_SHADER, gl.GL_VERTEX_SHADER),
+                shaders.compileShader(VIDEO_FRAGMENT_SHADERS[frame_format.chroma], gl.GL_FRAGMENT_SHADER))
+            gl.glUseProgram(self._program)
+            for i in range(len(frame_format.planes)):
+                gl.glUniform1i(gl.glGetUniformLocation(self._program, 'plane{}'.format(i)), i)
+            gl.glUseProgram(0)
+        self._format = frame_format
+        
+    def update(self, player):
+        """Upload the newest frame of the player if there is one
+        """
+        if not self.has_new_frame(player):
+            return
+        ring = player.frame_ring
+        if ring is not self._ring:
+            if ring.frame_format != self._format:
+                self._allocate(ring.frame_format)
+            self._ring = ring
+            self.frame_count = 0
+        frame_format = self._format
+        
+        # write the frame into the next buffer of the ring. Re-specifying the buffer storage 
+        # before mapping it means we never have to wait for a pending upload from that buffer
+        pbo = self._pbos[self._index]
+        self._index = (self._index + 1) % self.n_buffers
+        gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, pbo)
+        gl.glBufferData(gl.GL_PIXEL_UNPACK_BUFFER, frame_format.frame_bytes, None, gl.GL_STREAM_DRAW)
+        address = gl.glMapBuffer(gl.GL_PIXEL_UNPACK_BUFFER, gl.GL_WRITE_ONLY)
+        frame_count = ring.copy_newest(address) if address else None
+        gl.glUnmapBuffer(gl.GL_PIXEL_UNPACK_BUFFER)
+        
+        # the upload of each plane from the pixel buffer into its texture runs asynchronously
+        if frame_count is not None:
+            plane_formats = VIDEO_PLANE_FORMATS[frame_format.chroma]
+            for texture, plane, (_, pixel_format) in zip(self._textures, frame_format.planes, plane_formats):
+                offset, pitch, width, height, bpp = plane[:5]
+                gl.glBindTexture(gl.GL_TEXTURE_2D, texture)
+                gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
+                gl.glPixelStorei(gl.GL_UNPACK_ROW_LENGTH, pitch // bpp)
+                gl.glTexSubImage2D(gl.GL_TEXTURE_2D, 0, 0, 0, width, height, 
+                                   pixel_format, gl.GL_UNSIGNED_BYTE, ctypes.c_void_p(offset))
+            gl.glPixelStorei(gl.GL_UNPACK_ROW_LENGTH, 0)
+            gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+            self.frame_count = frame_count
+        gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, 0)
+        
+    def draw(self, rect):
+        """Draw the video scaled to fit into rect (x0, y0, x1, y1)
+        """
+        if self._textures is None:
+            return
+        x0, y0, x1, y1 = fit_rect(rect, (self._format.width, self._format.height))
+        for i, texture in enumerate(self._textures):
+            gl.glActiveTexture(gl.GL_TEXTURE0 + i)
+            gl.glBindTexture(gl.GL_TEXTURE_2D, texture)
+        gl.glActiveTexture(gl.GL_TEXTURE0)
+        gl.glEnable(gl.GL_TEXTURE_2D)
+        if self._program is not None:
+            gl.glUseProgram(self._program)
+        gl.glColor4f(1.0, 1.0, 1.0, 1.0)
+        gl.glBegin(gl.GL_QUADS)
+        gl.glTexCoord2f(0.0, 0.0)
+        gl.glVertex2f(x0, y0)
+        gl.glTexCoord2f(1.0, 0.0)
+        gl.glVertex2f(x1, y0)
+        gl.glTexCoord2f(1.0, 1.0)
+        gl.glVertex2f(x1, y1)
+        gl.glTexCoord2f(0.0, 1.0)
+        gl.glVertex2f(x0, y1)
+        gl.glEnd()
+        if self._program is not None:
+            gl.glUseProgram(0)
+        for i in reversed(range(len(self._textures))):
+            gl.glActiveTexture(gl.GL_TEXTURE0 + i)
+            gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+        gl.glDisable(gl.GL_TEXTURE_2D)
+        
+    def free(self):
+        """Delete the GL textures, pixel buffers and shader
+        """
+        if self._textures is not None:
+            gl.glDeleteTextures(self._textures)
+        if self._pbos is not None:
+            gl.glDeleteBuffers(len(self._pbos), self._pbos)
+        if self._program is not None:
+            gl.glDeleteProgram(self._program)
+        self._textures = None
+        self._pbos = None
+        self._program = None
+        self._index = 0
+        self._format = None
+        self._ring = None
+        self.frame_count = 0
+
+
+class Surface_Lookup(object):
+    """Finds a surface by name in the list of surfaces tracked in a frame.
+    
+    The position of the surface in the list is remembered, so a single comparison is needed as 
+    long as the set of surfaces does not change. Otherwise the list is scanned up to the first match.
+    """
+    def __init__(self):
+        self._index = None
+        
+    def invalidate(self):
+        self._index = None
+        
+    def find(self, surfaces, name):
+        """Return the first surface with the given name or None if it is not tracked
+        """
+        i = self._index
+        if i is not None and i < len(surfaces) and surfaces[i]['name'] == name:
+            return surfaces[i]
+        for i, srf in enumerate(surfaces):
+            if srf['name'] == name:
+                self._index = i
+                return srf
+        self._index = None
+        return None
+
+
+class Error_Budget(object):
+    """Rate-limited, deduplicated logging of the exceptions raised in the stages of the plugin.
+    
+    Exceptions are grouped by stage, type and the line that raised them. The first exception of a 
+    group is logged with its traceback, further ones are only counted and reported at most once every 
+    interval seconds, by the first report() or succeeded() call after the interval. A stage that 
+    fails max_failures times in a row is switched off (circuit breaker) until reset() is called.
+    """
+    def __init__(self, interval=5.0, max_failures=100):
+        self.interval = interval
+        self.max_failures = max_failures
+        # (stage, exception type, file, line) -> [count since last log, time of last log, last exception (repr)]
+        self._groups = {}
+        # time when the first counted but unlogged group is due
+        self._next_flush = float('inf')
+        # stage -> number of consecutive failures
+        self._failures = {}
+        self.tripped = set()
+        
+    def allow(self, stage):
+        # False while the circuit breaker of the stage is open
+        return stage not in self.tripped
+        
+    def succeeded(self, stage):
+        if self._failures.get(stage):
+            self._failures[stage] = 0
+        # counts of exceptions that stopped recurring are logged, too
+        now = time.monotonic()
+        if now >= self._next_flush:
+            self.flush(now)
+            
+    def flush(self, now=None):
+        """Log the counted exceptions of all groups whose interval is over
+        """
+        if now is None:
+            now = time.monotonic()
+        self._next_flush = float('inf')
+        for key, group in self._groups.items():
+            if not group[0]:
+                continue
+            if now - group[1] >= self.interval:
+                self._log_count(key[0], group, now)
+            else:
+                self._next_flush = min(self._next_flush, group[1] + self.interval)
+                
+    def _log_count(self, stage, group, now):
+        logger.error("Unexpected error in {}: {} (raised {} times in the last {:.0f} s)".format(
+                     stage, group[2], group[0], now - group[1]))
+        group[0], group[1] = 0, now
+            
+    def report(self, stage):
+        """Count the exception that is currently handled and log it if its group is due
+        """
+        exc_type, exc, tb = sys.exc_info()
+        while tb.tb_next is not None:
+            tb = tb.tb_next
+        key = (stage, exc_type, tb.tb_frame.f_code.co_filename, tb.tb_lineno)
+        now = time.monotonic()
+        group = self._groups.get(key)
+        if group is None:
+            self._groups[key] = [0, now, repr(exc)]
+            logger.error("Unexpected error in {}: {!r}".format(stage, exc), exc_info=True)
+        else:
+            group[0] += 1
+            group[2] = repr(exc)
+            if now - group[1] >= self.interval:
+                self._log_count(stage, group, now)
+            else:
+                self._next_flush = min(self._next_flush, group[1] + self.interval)
+                
+        failures = self._failures.get(stage, 0) + 1
+        self._failures[stage] = failures
+        if failures >= self.max_failures and stage not in self.tripped:
+            self.tripped.add(stage)
+            logger.error("{} failed {} times in a row and is switched off until it is reset".format(stage, failures))
+            
+    def reset(self):
+        # close all circuit breakers and forget the reported exceptions
+        self._groups.clear()
+        self._next_flush = float('inf')
+        self._failures.clear()
+        self.tripped.clear()
+        
+    def status(self):
+        return ', '.join(sorted(self.tripped)) or 'none'
+
 
 class GCvlc_Player(Plugin):
     """This Plugin creates a gaze-controlled VLC-Player.
     """
-    def __init__(self, g_pool, video_file='/hdd/jonas/Gaze-Controlled_VLC_Player/test_input/test.mp4'):
+    def __init__(self, g_pool, video_file='/hdd/jonas/Gaze-Controlled_VLC_Player/test_input/test.mp4', control_settings=None):
         super().__init__(g_pool)
         # order (0-1) determines if your plugin should run before other plugins or after
         # gcvlc player uses high order since it relies on calculated gaze points
@@ -70,25 +476,48 @@ class GCvlc_Player(Plugin):
         # name of the video file (player is tested with mp4 files!)
         self.video_file = video_file
         
-        # create vlc player object
-        self.vlc = myvlc.VLC()
+        # create vlc player object, the video is decoded into memory and displayed in the marker window.
+        # Commands are run by a worker thread, so opening or starting the video never stalls Pupil
+        self.vlc = myvlc.AsyncVLC(myvlc.VLC(embed_video=True))
         
         # variable to determine whether the player is running
         self.player_running = False
         
-        # name of the marker surface
+        # state machine that decides when to play or pause the video
+        self.control = gaze_control.Playback_Control(**(control_settings or {}))
+        
+        # latency from the gaze sample that caused a play/pause decision until VLC reached the new state
+        self.latency = instrumentation.Latency_Tracker(g_pool.get_timestamp, (gaze_control.PLAY, gaze_control.PAUSE))
+        self.vlc.state_listeners.append(self.on_player_state)
+        
+        # exceptions of the plugin's stages are counted and logged at a limited rate
+        self.errors = Error_Budget()
+        
+        # timers of the stages of the hot path, cheap enough to stay enabled
+        self.profiler = instrumentation.Stage_Profiler(PROFILED_STAGES)
+        
+        # name of the marker surface and where it is found in the surface events
         self.surface_name = "Screen1"
+        self._surface_lookup = Surface_Lookup()
         
         # window to display marker
         self._window = None
         
-        # specify marker and marker size
-        self.marker1 = generate_marker('first')
-        self.marker2 = generate_marker('second')
-        self.marker3 = generate_marker('third')
-        self.marker4 = generate_marker('fourth')
+        # specify marker and marker size. The markers (top left, top right, bottom left, bottom right)
+        # are taken from the marker family of Pupil's surface tracker and drawn rotated by 270 degrees
+        self.marker_ids = (2, 3, 10, 11)
+        self.marker1, self.marker2, self.marker3, self.marker4 = [marker_family.marker_bitmap(i, rotation=270) 
+                                                                  for i in self.marker_ids]
         self.m_size = 200.0
         
+        # all four markers packed into one GL texture, uploaded once and reused on every frame
+        self._marker_atlas = Marker_Atlas()
+        # texture holding the current video frame
+        self._video_texture = Video_Texture()
+        
+        # the marker window is only redrawn if this flag is set (resize, expose, or setting change)
+        self._redraw = True
+        
         self.menu = None
         
         # UI Platform tweaks
@@ -112,9 +541,57 @@ class GCvlc_Player(Plugin):
             # add a text field to specify the surface
             self.menu.append(ui.Text_Input('surface_name', self, setter=self.set_surface_name, label='Surface name:'))
             # add slider to change marker size
-            self.menu.append(ui.Slider('m_size',  self, 
+            self.menu.append(ui.Slider('m_size',  self, setter=self.set_m_size, 
                              label='Marker size [pixels]', 
                              min=1,  max=500, step=1))
+            # add sliders to tune when gaze starts and pauses the video
+            control_menu = ui.Growing_Menu('Gaze control')
+            control_menu.collapsed = True
+            control_menu.append(ui.Slider('enter_dwell', self.control, label='Play after looking at the video [s]', 
+                                          min=0., max=2., step=0.05))
+            control_menu.append(ui.Slider('exit_dwell', self.control, label='Pause after looking away [s]', 
+                                          min=0., max=2., step=0.05))
+            control_menu.append(ui.Slider('grace_period', self.control, label='Pause after losing the surface [s]', 
+                                          min=0., max=5., step=0.1))
+            control_menu.append(ui.Slider('max_blink', self.control, label='Longest blink without gaze [s]', 
+                                          min=0., max=2., step=0.05))
+            control_menu.append(ui.Slider('min_confidence', self.control, label='Minimum gaze confidence', 
+                                          min=0., max=1., step=0.05))
+            control_menu.append(ui.Slider('on_fraction', self.control, label='Gaze fraction on the video', 
+                                          min=0.05, max=1., step=0.05))
+            control_menu.append(ui.Selector('gaze_filter', self.control, label='Gaze filter', 
+                                            selection=['none', 'one_euro', 'kalman'], 
+                                            labels=['None', 'One Euro', 'Kalman']))
+            control_menu.append(ui.Slider('enter_margin', self.control, label='Enter margin [surface]', 
+                                          min=0., max=0.2, step=0.01))
+            control_menu.append(ui.Slider('exit_margin', self.control, label='Exit margin [surface]', 
+                                          min=0., max=0.2, step=0.01))
+            control_menu.append(ui.Switch('predict_look_away', self.control, label='Pause on predicted look-away'))
+            control_menu.append(ui.Text_Input('prediction_stats', self.control, label='Look-away prediction', 
+                                              setter=lambda _: None))
+            self.menu.append(control_menu)
+            # add statistics of the latency from gaze to playback
+            latency_menu = ui.Growing_Menu('Playback latency')
+            latency_menu.collapsed = True
+            latency_menu.append(ui.Text_Input('play', self.latency.histograms[gaze_control.PLAY], label='Play', 
+                                              getter=self.latency.histograms[gaze_control.PLAY].summary, setter=lambda _: None))
+            latency_menu.append(ui.Text_Input('pause', self.latency.histograms[gaze_control.PAUSE], label='Pause', 
+                                              getter=self.latency.histograms[gaze_control.PAUSE].summary, setter=lambda _: None))
+            latency_menu.append(ui.Button('Export latency CSV', self.export_latency))
+            self.menu.append(latency_menu)
+            # add live timings of the hot path stages
+            profiler_menu = ui.Growing_Menu('Profiler')
+            profiler_menu.collapsed = True
+            profiler_menu.append(ui.Switch('enabled', self.profiler, label='Time hot path stages'))
+            for stage in PROFILED_STAGES:
+                profiler_menu.append(ui.Text_Input(stage, self.profiler.timings[stage], label=stage, 
+                                                   getter=self.profiler.timings[stage].summary, setter=lambda _: None))
+            profiler_menu.append(ui.Button('Export trace', self.export_trace))
+            self.menu.append(profiler_menu)
+            # show the stages that were switched off because they failed repeatedly
+            self.menu.append(ui.Text_Input('tripped', self.errors, label='Failed stages', 
+                                           getter=self.errors.status, setter=lambda _: None))
+            self.menu.append(ui.Button('Reset failed stages', self.errors.reset))
             # add button to start the VLC player
             self.menu.append(ui.Button('Start GCvlc Player', self.start_gcvlc_player))
             #self.g_pool.sidebar.append(self.menu)
@@ -122,7 +599,7 @@ class GCvlc_Player(Plugin):
             # open new window for the VLC player
             self.open_window('GCVLC_MarkerScreen')
         except:
-            logger.error("Unexpected error: {}".format(sys.exc_info()))
+            self.errors.report('init_ui')
         
     def deinit_ui(self):
 #        if self.menu:
@@ -137,16 +614,13 @@ class GCvlc_Player(Plugin):
             self._window = glfwCreateWindow(width, height, title, share=glfwGetCurrentContext())
             glfwSetWindowPos(self._window, self.window_position_default[0], self.window_position_default[1])
             
-            # TODO: Bind vlc player to glfw window. Currently this is not working but it would be convenient to automatically
-            #       assign the vlc output to our glfw window and adjust the size of the video regarding the marker size.
-            #if system() == 'Windows':
-            #    self.vlc.mediaplayer.set_hwnd(glfwGetWindowUserPointer(self._window))
-            #else:
-            #    self.vlc.mediaplayer.set_xwindow(glfwGetWindowUserPointer(self._window))
+            # the vlc player is not bound to this window. It decodes the video into memory and 
+            # gl_display_in_window draws the frames inside the marker frame
             
             # Register callbacks
-            glfwSetFramebufferSizeCallback(self._window, on_resize)
-            on_resize(self._window, *glfwGetFramebufferSize(self._window))
+            glfwSetFramebufferSizeCallback(self._window, self.on_window_resize)
+            glfwSetWindowRefreshCallback(self._window, self.on_window_refresh)
+            self.on_window_resize(self._window, *glfwGetFramebufferSize(self._window))
             
             # gl_state settings
             active_window = glfwGetCurrentContext()
@@ -158,25 +632,50 @@ class GCvlc_Player(Plugin):
             # change back to the main window
             glfwMakeContextCurrent(active_window)
         except:
-            logger.error("Unexpected error: {}".format(sys.exc_info()))
+            self.errors.report('open_window')
             
     def close_window(self):
         if self._window:
             # enable mouse display and close the glfw window spawned by this plugin
             active_window = glfwGetCurrentContext()
             glfwSetInputMode(self._window, GLFW_CURSOR, GLFW_CURSOR_NORMAL)
+            # free the marker textures while the plugin window is still alive
+            glfwMakeContextCurrent(self._window)
+            self._marker_atlas.free()
+            self._video_texture.free()
             glfwDestroyWindow(self._window)
             self._window = None
             glfwMakeContextCurrent(active_window)
             
+    def on_window_resize(self, window, w, h):
+        # window callbacks: resize window and redraw its content
+        on_resize(window, w, h)
+        self.request_redraw()
+        
+    def on_window_refresh(self, window):
+        # window callbacks: the window got exposed and its content has to be redrawn
+        self.request_redraw()
+        
+    def request_redraw(self):
+        # schedule a redraw of the marker window for the next call of gl_display_in_window
+        self._redraw = True
+            
     def gl_display_in_window(self):
+        # the window can be closed even if drawing is switched off
+        if glfwWindowShouldClose(self._window):
+            self.close_window()
+            return
+        if not self.errors.allow('gl_display'):
+            return
         try:
-            active_window = glfwGetCurrentContext()
-            if glfwWindowShouldClose(self._window):
-                self.close_window()
+            # nothing changed since the last redraw, keep the current window content
+            if not self._redraw and not self._video_texture.has_new_frame(self.vlc):
                 return
+            self._redraw = False
                 
             # make plugin window current context and clear the screen
+            mark = self.profiler.start()
+            active_window = glfwGetCurrentContext()
             glfwMakeContextCurrent(self._window)
             clear_gl_screen()
             
@@ -187,77 +686,105 @@ class GCvlc_Player(Plugin):
             # Switch back to Model View Matrix
             gl.glMatrixMode(gl.GL_MODELVIEW)
             gl.glLoadIdentity()
+            mark = self.profiler.lap('gl_context', mark)
             
-            # draw markers using the previously generated ndarrays and Named_Texture objects 
-            # (see https://github.com/pupil-labs/pyglui/blob/master/pyglui/cygl/utils.pyx for details)
-            m1 = Named_Texture()
-            m1.update_from_ndarray(self.marker1)
-            m1.draw(True, ((10.0, self.m_size), (self.m_size, self.m_size), (self.m_size, 10.0), (10.0, 10.0)), 10.0)
+            # draw the newest video frame inside the marker frame, libvlc decodes it in the displayed size
+            video_rect = marker_frame_rect(p_window_size, self.m_size)
+            self.vlc.set_display_size(video_rect[2] - video_rect[0], video_rect[3] - video_rect[1])
+            self._video_texture.update(self.vlc)
+            self._video_texture.draw(video_rect)
+            mark = self.profiler.lap('video_texture', mark)
             
-            m2 = Named_Texture()
-            m2.update_from_ndarray(self.marker2)
-            m2.draw(True, ((p_window_size[0]-self.m_size, self.m_size), (p_window_size[0]-10.0, self.m_size), (p_window_size[0]-10.0, 10.0), (p_window_size[0]-self.m_size, 10.0)), 10.0)
-            
-            m3 = Named_Texture()
-            m3.update_from_ndarray(self.marker3)
-            m3.draw(True, ((10.0, p_window_size[1]-10.0), (self.m_size, p_window_size[1]-10.0), (self.m_size, p_window_size[1]-self.m_size), (10.0, p_window_size[1]-self.m_size)), 10.0)
-            
-            m4 = Named_Texture()
-            m4.update_from_ndarray(self.marker4)
-            m4.draw(True, ((p_window_size[0]-self.m_size, p_window_size[1]-10.0), (p_window_size[0]-10.0, p_window_size[1]-10.0), (p_window_size[0]-10.0, p_window_size[1]-self.m_size), (p_window_size[0]-self.m_size, p_window_size[1]-self.m_size)), 10.0)
+            # draw all markers from the atlas texture with a single draw call
+            self._marker_atlas.update((self.marker1, self.marker2, self.marker3, self.marker4))
+            self._marker_atlas.draw(p_window_size, self.m_size)
+            mark = self.profiler.lap('markers', mark)
             
             # swap buffer
             glfwSwapBuffers(self._window)
             glfwMakeContextCurrent(active_window)
+            self.profiler.lap('swap', mark)
+            self.errors.succeeded('gl_display')
         except:
-            logger.error("Unexpected error: {}".format(sys.exc_info()))
+            self.errors.report('gl_display')
 
     def on_notify(self, notification):
         """Handels notifications
         
         Reacts to notification:
-            No reactions to notifications implemented
+            ``surfaces_changed``: Rescan for the plugin's surface in the next frame
+            ``recording.stopped``: Export the playback latency histograms (and the profiler trace if the
+                                   profiler is enabled) into the recording
         """
-        pass
+        if notification['subject'] == 'surfaces_changed':
+            self._surface_lookup.invalidate()
+        elif notification['subject'] == 'recording.stopped':
+            self.export_latency(notification['rec_path'])
+            if self.profiler.enabled:
+                self.export_trace(notification['rec_path'])
+            
+    def on_player_state(self, state):
+        # called from the libvlc event thread whenever the player state changes
+        if state == vlc.State.Playing:
+            self.latency.state_reached(gaze_control.PLAY)
+        elif state == vlc.State.Paused:
+            self.latency.state_reached(gaze_control.PAUSE)
+            
+    def export_latency(self, directory=None):
+        # write the playback latency histograms as CSV files (by default into Pupil's user directory)
+        directory = directory or self.g_pool.user_dir
+        try:
+            self.latency.export_csv(directory)
+            logger.info("Playback latency exported to {}".format(directory))
+        except EnvironmentError:
+            logger.error("Could not export playback latency: {}".format(sys.exc_info()[1]))
+            
+    def export_trace(self, directory=None):
+        # write the recent stage timings as trace file (by default into Pupil's user directory)
+        path = os.path.join(directory or self.g_pool.user_dir, 'gcvlc_trace.json.gz')
+        try:
+            self.profiler.export_trace(path)
+            logger.info("Profiler trace exported to {}".format(path))
+        except EnvironmentError:
+            logger.error("Could not export profiler trace: {}".format(sys.exc_info()[1]))
     
     def recent_events(self, events):
         # call update function for the glfw window if this window is displayed
         if self._window:
             self.gl_display_in_window()
         
-        # if the player is not started yet, do nothing
-        if not self.player_running:
+        # if the player is not started yet (or the gaze control failed repeatedly), do nothing
+        if not self.player_running or not self.errors.allow('gaze_control'):
             return
             
         try:
-            # check all tracked surfaces and pause the player if no surface is currently tracked
-            surfaces = events.get('surfaces')
-            if not surfaces:
-                self.vlc.pause()
-                return
-            
-            # iterate over all detected surfaces
-            aux_not_srf = True
-            for s in surfaces:
-                # check whether the plugin's surface is tracked
-                if s['name'] == self.surface_name:
-                    aux_not_srf = False
-                    # play the video if the gaze lies on the surface, pause otherwise
-                    if s['gaze_on_srf'][0]['on_srf'] == True:
-                        self.vlc.play()
-                    else:
-                        self.vlc.pause()
+            # look up the plugin's surface, the gaze samples stay unknown (None) if it is not tracked
+            mark = self.profiler.start()
+            samples = None
+            srf = self._surface_lookup.find(events.get('surfaces', ()), self.surface_name)
+            mark = self.profiler.lap('surface_lookup', mark)
+            if srf is not None:
+                # use all gaze samples mapped onto the surface since the last frame
+                samples = gaze_control.gaze_samples(srf['gaze_on_srf'])
             
-            # if the needed surface is not tracked, pause the video
-            if aux_not_srf:
-                self.vlc.pause()
+            # play or pause the video only if the state machine decides that the state changes
+            command = self.control.process(self.g_pool.get_timestamp(), samples)
+            mark = self.profiler.lap('decision', mark)
+            if command is not None:
+                self.latency.command_sent(command, self.control.source_timestamp)
+                if command == gaze_control.PLAY:
+                    self.vlc.play()
+                elif command == gaze_control.PAUSE:
+                    self.vlc.pause()
+                self.profiler.lap('libvlc', mark)
+            self.errors.succeeded('gaze_control')
         except:
-            logger.error("Unexpected error: {}".format(sys.exc_info()))
+            self.errors.report('gaze_control')
 
     def get_init_dict(self):
         # anything vars we want to be persistent accross sessions need to show up in the __init__
         # and identically as a dict entry below:
-        return {'video_file': self.video_file}
+        return {'video_file': self.video_file, 'control_settings': self.control.get_settings()}
 
     def cleanup(self):
         """ called when the plugin gets terminated.
@@ -265,6 +792,11 @@ class GCvlc_Player(Plugin):
         if you have a GUI or glfw window destroy it here.
         """
         self.vlc.stop()
+        if self.vlc.close(timeout=2.0):
+            # the worker is done, free the native libvlc objects right away
+            self.vlc.release()
+        else:
+            logger.warning("VLC did not stop in time")
         self.close_window()
         self.deinit_ui()
 
@@ -275,9 +807,17 @@ class GCvlc_Player(Plugin):
     def set_surface_name(self, value):
         # this auxiliary function processes user input of the surface name field
         self.surface_name = value
+        self.request_redraw()
+        
+    def set_m_size(self, value):
+        # this auxiliary function processes user input of the marker size slider
+        self.m_size = value
+        self.request_redraw()
         
     def start_gcvlc_player(self):
         # load the specified video file into the vlc player and start the video
         self.vlc.open_file(self.video_file)
         self.vlc.play()
+        self.control.reset(playing=True)
+        self.errors.reset()
         self.player_running = True
@@ -0,0 +1,177 @@
+'''
+(*)~----------------------------------------------------------------------------------
+ Instrumentation of the Gaze-Controlled VLC Plugin
+----------------------------------------------------------------------------------~(*)
+'''
+
+import csv
+import gzip
+import json
+import os
+import time
+import numpy as np
+
+
+class Latency_Histogram(object):
+    """Streaming histogram of latencies with fixed bins of bin_width seconds up to max_latency.
+
+    Larger latencies are counted in the last bin.
+    """
+    def __init__(self, bin_width=0.001, max_latency=2.0):
+        self.bin_width = bin_width
+        self.counts = np.zeros(int(round(max_latency / bin_width)), np.int64)
+
+    @property
+    def count(self):
+        return int(self.counts.sum())
+
+    def add(self, latency):
+        self.counts[min(max(int(latency / self.bin_width), 0), len(self.counts) - 1)] += 1
+
+    def percentile(self, q):
+        """Return the upper edge of the bin holding the q-th percentile (0-100) or None if empty
+        """
+        cumulative = np.cumsum(self.counts)
+        if not cumulative[-1]:
+            return None
+        i = np.searchsorted(cumulative, q / 100. * cumulative[-1])
+        return (i + 1) * self.bin_width
+
+    def summary(self):
+        # p50/p95/p99 in milliseconds, or 'n/a' if there are no measurements
+        if not self.count:
+            return 'n/a'
+        return 'p50 {:.0f} / p95 {:.0f} / p99 {:.0f} ms (n={})'.format(
+            *[1000. * self.percentile(q) for q in (50, 95, 99)], self.count)
+
+
+class Latency_Tracker(object):
+    """Measures the time from the gaze sample that caused a play or pause command until libvlc
+    reports the new player state.
+
+    Timestamps are taken with get_timestamp, which has to return the Pupil clock. Only the last
+    command is tracked: a command that is replaced before libvlc reports its state is not measured.
+    """
+    def __init__(self, get_timestamp, commands=('play', 'pause')):
+        self.get_timestamp = get_timestamp
+        self.histograms = dict((command, Latency_Histogram()) for command in commands)
+        # (command, source timestamp) waiting for the state change, replaced as a whole
+        self._pending = None
+
+    def command_sent(self, command, source_timestamp):
+        if source_timestamp is not None:
+            self._pending = (command, source_timestamp)
+
+    def state_reached(self, command):
+        """Called (from any thread) when the player reached the state of the given command
+        """
+        pending = self._pending
+        if pending is not None and pending[0] == command:
+            self._pending = None
+            self.histograms[command].add(self.get_timestamp() - pending[1])
+
+    def export_csv(self, directory, prefix='gcvlc_latency'):
+        """Write a summary (count, p50, p95, p99) and the histograms as CSV files into directory
+        """
+        commands = sorted(self.histograms)
+        with open(os.path.join(directory, prefix + '_summary.csv'), 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(('command', 'count', 'p50_ms', 'p95_ms', 'p99_ms'))
+            for command in commands:
+                histogram = self.histograms[command]
+                percentiles = [histogram.percentile(q) for q in (50, 95, 99)]
+                writer.writerow([command, histogram.count] + 
+                                ['' if p is None else 1000. * p for p in percentiles])
+        with open(os.path.join(directory, prefix + '_histogram.csv'), 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['bin_start_ms', 'bin_end_ms'] + commands)
+            bin_ms = 1000. * self.histograms[commands[0]].bin_width
+            counts = [self.histograms[command].counts for command in commands]
+            for i, row in enumerate(zip(*counts)):
+                if any(row):
+                    writer.writerow([i * bin_ms, (i + 1) * bin_ms] + list(row))
+
+
+class Stage_Timings(object):
+    """Ring buffer with the start times and durations (seconds) of the last n_samples runs of a stage
+    """
+    def __init__(self, n_samples=512):
+        self.starts = np.zeros(n_samples)
+        self.durations = np.zeros(n_samples)
+        self.index = 0
+        self.count = 0
+
+    def reset(self):
+        # forget all runs, the ring buffers are kept since the menu holds on to this object
+        self.index = 0
+        self.count = 0
+
+    def add(self, start, duration):
+        i = self.index
+        self.starts[i] = start
+        self.durations[i] = duration
+        self.index = (i + 1) % len(self.durations)
+        self.count += 1
+
+    def recent(self):
+        # durations currently held in the ring (unordered)
+        return self.durations[:min(self.count, len(self.durations))]
+
+    def summary(self):
+        # mean/p95/max of the recent durations in milliseconds, or 'n/a' if the stage never ran
+        durations = self.recent()
+        if not len(durations):
+            return 'n/a'
+        return 'mean {:.3f} / p95 {:.3f} / max {:.3f} ms'.format(
+            1000. * durations.mean(), 1000. * np.percentile(durations, 95), 1000. * durations.max())
+
+
+class Stage_Profiler(object):
+    """Lightweight timers for the stages of the plugin's hot path.
+
+    A stage is timed from a mark returned by start() or by the lap() of the previous stage:
+        mark = profiler.start()
+        ...                                 # work of stage 'a'
+        mark = profiler.lap('a', mark)
+        ...                                 # work of stage 'b'
+        profiler.lap('b', mark)
+    Only the last n_samples runs of every stage are kept. If the profiler is disabled, start() and
+    lap() only return the given mark.
+    """
+    def __init__(self, stages, n_samples=512, enabled=True):
+        self.stages = tuple(stages)
+        self.timings = dict((stage, Stage_Timings(n_samples)) for stage in self.stages)
+        self.enabled = enabled
+
+    def start(self):
+        return time.perf_counter() if self.enabled else 0.
+
+    def lap(self, stage, mark):
+        if not self.enabled:
+            return mark
+        now = time.perf_counter()
+        self.timings[stage].add(mark, now - mark)
+        return now
+
+    def reset(self):
+        for timings in self.timings.values():
+            timings.reset()
+
+    def export_trace(self, path):
+        """Write the recent stage timings as gzip compressed Chrome trace (Trace Event Format) to path
+
+        The file can be opened with chrome://tracing or https://ui.perfetto.dev
+        """
+        events = []
+        for tid, stage in enumerate(self.stages):
+            timings = self.timings[stage]
+            n = min(timings.count, len(timings.durations))
+            for start, duration in zip(timings.starts[:n], timings.durations[:n]):
+                events.append({'name': stage, 'ph': 'X', 'pid': os.getpid(), 'tid': tid, 
+                               'ts': 1e6 * start, 'dur': 1e6 * duration})
+        events.sort(key=lambda event: event['ts'])
+        # name the rows of the trace viewer after the stages
+        events[:0] = [{'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid, 'args': {'name': stage}} 
+                      for tid, stage in enumerate(self.stages)]
+        with gzip.open(path, 'wt') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
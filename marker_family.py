@@ -0,0 +1,60 @@
+'''
+(*)~----------------------------------------------------------------------------------
+ Square marker family of the Pupil Labs surface tracker
+
+ Part of the Gaze-Controlled VLC Plugin for Pupil Labs Capture
+----------------------------------------------------------------------------------~(*)
+'''
+
+import functools
+import numpy as np
+
+# A marker consists of 5x5 cells. The outer cells are black, the inner 3x3 cells carry
+# the message. The four inner corners encode the orientation and the most significant bit:
+#       MSB = 0       MSB = 1
+#       B|*|W         W|*|B
+#       *|*|*         *|*|*
+#       W|*|W         B|*|B
+# The remaining five cells hold the lower bits, MSB first in row-major order.
+GRID = 5
+MARKER_BITS = 6
+N_MARKERS = 2 ** MARKER_BITS
+
+# inner cells (row, column) of the orientation corners and of the data bits
+_CORNERS = ((0, 0), (2, 0), (2, 2), (0, 2))
+_DATA_CELLS = ((0, 1), (1, 0), (1, 1), (1, 2), (2, 1))
+
+
+@functools.lru_cache(maxsize=None)
+def marker_cells(marker_id, rotation=0):
+    """Return the 5x5 cells of a marker as uint8 array (0 -> black, 255 -> white)
+
+    rotation is the clockwise angle (multiple of 90 degrees) the marker is drawn with.
+    """
+    if not 0 <= marker_id < N_MARKERS:
+        raise ValueError('marker id has to be in [0, {})'.format(N_MARKERS))
+    if rotation % 90:
+        raise ValueError('marker rotation has to be a multiple of 90 degrees')
+    msb = marker_id >> (MARKER_BITS - 1)
+    msg = np.zeros((3, 3), np.uint8)
+    for i, cell in enumerate(_CORNERS):
+        msg[cell] = (i > 0) != msb
+    for i, cell in enumerate(_DATA_CELLS):
+        msg[cell] = (marker_id >> (len(_DATA_CELLS) - 1 - i)) & 1
+    cells = np.zeros((GRID, GRID), np.uint8)
+    cells[1:-1, 1:-1] = np.rot90(msg, -(rotation // 90)) * 255
+    cells.flags.writeable = False
+    return cells
+
+
+@functools.lru_cache(maxsize=256)
+def marker_bitmap(marker_id, scale=10, rotation=0):
+    """Return the bitmap of a marker with each cell upscaled to scale x scale pixels
+
+    The result is cached and therefore read-only.
+    """
+    cells = marker_cells(marker_id, rotation)
+    # repeat every cell via a broadcast view, reshaping copies it once into a new uint8 array
+    bitmap = np.broadcast_to(cells[:, None, :, None], (GRID, scale, GRID, scale)).reshape(GRID * scale, GRID * scale)
+    bitmap.flags.writeable = False
+    return bitmap
@@ -7,44 +7,457 @@
 ----------------------------------------------------------------------------------~(*)
 '''
 
-import vlc
+import ctypes
+import collections
+import importlib.util
+import sys
+import threading
+import numpy as np
+
+
+def lazy_import(name):
+    """Import a module that is only executed when one of its attributes is used first
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+# the libvlc binding is large, it is loaded when the first player is created. Without vlc.py
+# the compact binding generated by tools/generate_vlc_compact.py is used
+vlc = lazy_import('vlc' if importlib.util.find_spec('vlc') else 'vlc_compact')
+
+# logging
+import logging
+logger = logging.getLogger(__name__)
+
+
+# plane layout of the chromas supported for embedded videos, each plane is given as
+# (bytes per pixel, horizontal subsampling, vertical subsampling)
+CHROMA_PLANES = {
+    'RV32': ((4, 1, 1),),
+    'I420': ((1, 1, 1), (1, 2, 2), (1, 2, 2)),
+    'NV12': ((1, 1, 1), (2, 2, 2)),
+}
+
+# layout of a decoded frame. planes holds (offset, pitch, width, height, bytes per pixel, lines) 
+# of each plane, frame_bytes is the size of the whole frame including padding
+VideoFormat = collections.namedtuple('VideoFormat', 'chroma width height planes frame_bytes')
+
+def video_format(chroma, width, height, alignment=32):
+    # planes are stored one after another, starting at aligned addresses as libvlc requires
+    planes = []
+    offset = 0
+    for bpp, sub_x, sub_y in CHROMA_PLANES[chroma]:
+        w, h = -(-width // sub_x), -(-height // sub_y)
+        pitch = -(-w * bpp // alignment) * alignment
+        # some decoders write a few lines beyond the visible picture
+        lines = -(-h // 16) * 16
+        planes.append((offset, pitch, w, h, bpp, lines))
+        offset += pitch * lines
+    return VideoFormat(chroma, width, height, tuple(planes), offset)
+
+# libvlc_video_format_cb. The prototype in vlc.py declares a pointer as return type and passes
+# the chroma as an immutable string, which does not allow to negotiate the chroma
+VideoFormatCb = ctypes.CFUNCTYPE(ctypes.c_uint, ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p, 
+                                 ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint), 
+                                 ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint))
+
+
+class FrameRing:
+    """Preallocated ring of frame buffers shared by the libvlc decoder thread and a reader.
+    
+    The decoder always writes into a slot that holds neither the newest complete frame nor
+    the frame that is read at the moment, so neither side ever waits for the other. The 
+    handoff relies on single attribute assignments being atomic, no locks are taken.
+    
+    Besides these two slots the ring holds n_pictures = n_slots - 2 pictures being decoded 
+    or waiting for display, the size of the libvlc picture pool.
+    
+    Counters:
+        dropped: complete frames that were replaced by a newer one before they were read
+        late: decoded frames that were never displayed, or slots recycled before display
+    """
+    FREE, DECODING, DECODED, READY = range(4)
+    
+    def __init__(self, frame_bytes, n_slots=4, alignment=32, frame_format=None):
+        if n_slots < 3:
+            raise ValueError('a frame ring needs at least 3 slots')
+        self.frame_bytes = frame_bytes
+        # layout of the frames (VideoFormat), for the reader
+        self.frame_format = frame_format
+        self.n_slots = n_slots
+        self.n_pictures = n_slots - 2
+        # one allocation for all slots, every slot starts at an aligned address as libvlc requires
+        stride = -(-frame_bytes // alignment) * alignment
+        self._buffer = np.zeros(n_slots * stride + alignment, np.uint8)
+        offset = -self._buffer.ctypes.data % alignment
+        self._addresses = [self._buffer.ctypes.data + offset + i * stride for i in range(n_slots)]
+        self._views = [self._buffer[offset + i * stride:offset + i * stride + frame_bytes] 
+                       for i in range(n_slots)]
+        self._state = [self.FREE] * n_slots
+        self._sequence = [0] * n_slots
+        self._decoded = 0
+        # (slot, sequence number) of the newest complete frame, replaced as a whole
+        self._latest = None
+        # slot the reader copies from at the moment and sequence number of the last frame read
+        self._reading = None
+        self._last_read = 0
+        
+        self.dropped = 0
+        self.late = 0
+        
+    @property
+    def sequence(self):
+        # sequence number of the newest complete frame, 0 if there is none
+        latest = self._latest
+        return latest[1] if latest else 0
+        
+    def address(self, slot):
+        return self._addresses[slot]
+        
+    def view(self, slot):
+        # flat uint8 view of the given slot
+        return self._views[slot]
+        
+    def begin_write(self):
+        """Decoder: return a slot the next frame can be decoded into
+        """
+        latest = self._latest
+        protected = (self._reading, latest[0] if latest else None)
+        # only free slots are handed out, never one that libvlc still decodes into or displays
+        slot = self._free_slot(protected)
+        if slot is None:
+            self._reclaim_dropped()
+            slot = self._free_slot(protected)
+            if slot is None:
+                raise RuntimeError('libvlc locked more pictures than the frame ring holds')
+        self._decoded += 1
+        self._sequence[slot] = self._decoded
+        self._state[slot] = self.DECODING
+        return slot
+        
+    def _free_slot(self, protected):
+        for i in range(self.n_slots):
+            if self._state[i] == self.FREE and i not in protected:
+                return i
+        return None
+        
+    def _reclaim_dropped(self):
+        # libvlc holds at most n_pictures pictures and is about to lock one more, so all frames
+        # waiting for display but the newest n_pictures - 1 were dropped by libvlc
+        pending = [i for i in range(self.n_slots) if self._state[i] in (self.DECODING, self.DECODED)]
+        pending.sort(key=self._sequence.__getitem__)
+        for i in pending[:len(pending) - self.n_pictures + 1]:
+            if self._state[i] == self.DECODED:
+                self._state[i] = self.FREE
+                self.late += 1
+        
+    def end_write(self, slot):
+        """Decoder: the frame in slot is completely decoded
+        """
+        if self._state[slot] == self.DECODING:
+            self._state[slot] = self.DECODED
+        
+    def publish(self, slot):
+        """Decoder: the frame in slot is due to be displayed and becomes the newest complete frame
+        """
+        sequence = self._sequence[slot]
+        # frames decoded before this one that were not displayed will never be
+        for i in range(self.n_slots):
+            if i != slot and self._state[i] == self.DECODED and self._sequence[i] < sequence:
+                self._state[i] = self.FREE
+                self.late += 1
+        previous = self._latest
+        self._state[slot] = self.READY
+        self._latest = (slot, sequence)
+        if previous is not None:
+            if previous[1] > self._last_read:
+                self.dropped += 1
+            self._state[previous[0]] = self.FREE
+        
+    def acquire(self):
+        """Reader: return (slot, sequence number) of the newest complete frame or None if there is no new frame
+        
+        The slot is not written to until release() is called.
+        """
+        while True:
+            latest = self._latest
+            if latest is None or latest[1] <= self._last_read:
+                return None
+            self._reading = latest[0]
+            # the decoder did not replace the frame in the meantime, so it will skip this slot
+            if self._latest is latest:
+                return latest[0], latest[1]
+            self._reading = None
+            
+    def release(self, sequence):
+        """Reader: done with the frame acquired before
+        """
+        self._last_read = sequence
+        self._reading = None
+        
+    def copy_newest(self, address):
+        """Reader: copy the newest complete frame to the given memory address
+        
+        The destination has to hold frame_bytes bytes. Returns the sequence number of the 
+        copied frame, or None if no frame was completed since the last call. The copy releases
+        the GIL, the decoder keeps writing into other slots of the ring in the meantime.
+        """
+        frame = self.acquire()
+        if frame is None:
+            return None
+        slot, sequence = frame
+        try:
+            ctypes.memmove(address, self._addresses[slot], self.frame_bytes)
+        finally:
+            self.release(sequence)
+        return sequence
 
 
 class VLC:
-    def __init__(self):
+    def __init__(self, embed_video=False, chroma='I420', n_frame_buffers=4):
         """A simple Media Player using VLC
+        
+        If embed_video is True, VLC does not open a video window. The video is decoded into
+        a ring of frame buffers instead (n_frame_buffers for libvlc, plus the newest frame and 
+        the frame that is read) and the newest frame can be fetched with copy_frame(). The 
+        frames are requested in the given chroma (see CHROMA_PLANES), planar YUV chromas save 
+        libvlc the colour conversion and need less memory bandwidth.
+        """
+        if chroma not in CHROMA_PLANES:
+            raise ValueError('unsupported chroma {}'.format(chroma))
+        # the vlc instance and the media player are created on first use (see _create_player), 
+        # so an idle player costs neither loading libvlc nor starting its instance
+        self._instance = None
+        self._mediaplayer = None
+        self._create_lock = threading.Lock()
+        # media loaded into the media player, it is released when it is replaced
+        self.media = None
+        
+        # state of the media player, mirrored from libvlc events (None until the media player 
+        # exists), and the state requested by the last command while libvlc did not report it 
+        # yet (None if no command is in flight)
+        self.state = None
+        self.requested_state = None
+        # functions called with the new state whenever libvlc reports a state change
+        self.state_listeners = []
+        
+        # ring of decoded frames, only used if the video is embedded. It is replaced 
+        # whenever libvlc (re-)configures its video output
+        self.embed_video = embed_video
+        self.chroma = chroma
+        self.n_frame_buffers = n_frame_buffers
+        self.frame_ring = None
+        # size the video is displayed in (None to decode in the original size) and the
+        # original size of the video as reported by libvlc
+        self.display_size = None
+        self.source_size = None
+        
+    @property
+    def instance(self):
+        if self._instance is None:
+            self._create_player()
+        return self._instance
+        
+    @property
+    def mediaplayer(self):
+        if self._instance is None:
+            self._create_player()
+        return self._mediaplayer
+        
+    def _create_player(self):
+        # load libvlc, create a basic vlc instance and an empty vlc media player. The instance 
+        # is published last, once the media player is completely set up
+        with self._create_lock:
+            if self._instance is not None:
+                return
+            instance = vlc.Instance("--no-xlib")
+            self._mediaplayer = instance.media_player_new()
+            self.state = vlc.State.NothingSpecial
+            self._attach_state_events()
+            if self.embed_video:
+                self._set_video_callbacks()
+            self._instance = instance
+            
+    @property
+    def frame_count(self):
+        # sequence number of the newest decoded frame
+        ring = self.frame_ring
+        return ring.sequence if ring else 0
+        
+    @property
+    def frame_size(self):
+        # size (width, height) of the decoded frames
+        ring = self.frame_ring
+        return (ring.frame_format.width, ring.frame_format.height) if ring else None
+        
+    def _attach_state_events(self):
+        # keep the state mirror up to date. The callbacks run on the event thread of libvlc 
+        # and must not call libvlc themselves
+        events = self._mediaplayer.event_manager()
+        for event_type, state in ((vlc.EventType.MediaPlayerPlaying, vlc.State.Playing), 
+                                  (vlc.EventType.MediaPlayerPaused, vlc.State.Paused), 
+                                  (vlc.EventType.MediaPlayerStopped, vlc.State.Stopped), 
+                                  (vlc.EventType.MediaPlayerEndReached, vlc.State.Ended), 
+                                  (vlc.EventType.MediaPlayerEncounteredError, vlc.State.Error)):
+            events.event_attach(event_type, self._on_state_event, state)
+            
+    def _on_state_event(self, event, state):
+        # event thread: libvlc reached a new state
+        self.state = state
+        requested = self.requested_state
+        # the requested state was reached, or the media stopped and the request is obsolete
+        if requested is not None and (requested == state or state not in (vlc.State.Playing, vlc.State.Paused)):
+            self.requested_state = None
+        for listener in self.state_listeners:
+            try:
+                listener(state)
+            except Exception:
+                logger.error("State listener {} failed".format(listener), exc_info=True)
+            
+    @property
+    def target_state(self):
+        # state the player is in, or will be in once the command in flight is done
+        requested = self.requested_state
+        return self.state if requested is None else requested
+        
+    def is_playing(self):
+        """Return whether the player is playing or about to play, without asking libvlc
+        """
+        return self.target_state == vlc.State.Playing
+        
+    def output_size(self, source_size):
+        """Size (width, height) of the decoded frames for a video of the given original size
+        
+        Frames are scaled down to fit into the display size keeping the aspect ratio, but 
+        never scaled up. Sizes are even so chroma planes are not rounded.
+        """
+        width, height = source_size
+        if self.display_size:
+            scale = min(1., self.display_size[0] / float(width), self.display_size[1] / float(height))
+            width, height = width * scale, height * scale
+        return (max(2, int(width) // 2 * 2), max(2, int(height) // 2 * 2))
+        
+    def set_display_size(self, width, height, tolerance=0.1):
+        """Decode embedded videos no larger than they are displayed
+        
+        If the current frames differ by more than tolerance (relative width) from the new 
+        output size, libvlc is made to re-negotiate the frame format.
+        """
+        size = (max(1, int(width)), max(1, int(height)))
+        if size == self.display_size:
+            return
+        self.display_size = size
+        ring = self.frame_ring
+        if ring is None or self.source_size is None:
+            return
+        new_width = self.output_size(self.source_size)[0]
+        if abs(new_width - ring.frame_format.width) > tolerance * ring.frame_format.width:
+            self._restart_video_output()
+            
+    def _restart_video_output(self):
+        # libvlc only negotiates the frame format when it creates the video output, 
+        # re-selecting the video track makes it create a new one
+        track = self.mediaplayer.video_get_track()
+        if track is None or track < 0:
+            return
+        self.mediaplayer.video_set_track(-1)
+        self.mediaplayer.video_set_track(track)
+        
+    def _set_video_callbacks(self):
+        # let libvlc decode into our frame ring. The callbacks are called from the decoder 
+        # thread of libvlc, keep references to them so they are not garbage collected
+        self._video_format_cb = VideoFormatCb(self._video_format)
+        self._video_lock_cb = vlc.CallbackDecorators.VideoLockCb(self._video_lock)
+        self._video_unlock_cb = vlc.CallbackDecorators.VideoUnlockCb(self._video_unlock)
+        self._video_display_cb = vlc.CallbackDecorators.VideoDisplayCb(self._video_display)
+        self._mediaplayer.video_set_callbacks(self._video_lock_cb, self._video_unlock_cb, 
+                                              self._video_display_cb, None)
+        self._mediaplayer.video_set_format_callbacks(self._video_format_cb, None)
+        
+    # The decoder thread callbacks only do a few attribute assignments and never block. The 
+    # picture pointer passed on by libvlc is the ring slot + 1, since 0 would be a NULL pointer.
+    def _video_format(self, opaque, chroma, width, height, pitches, lines):
+        # decoder thread: libvlc proposes the format of the decoder output, we request our 
+        # chroma in the display size and allocate a new ring for these frames
+        self.source_size = (width[0], height[0])
+        frame_format = video_format(self.chroma, *self.output_size(self.source_size))
+        ctypes.memmove(chroma, self.chroma.encode('ascii'), 4)
+        width[0], height[0] = frame_format.width, frame_format.height
+        for i, plane in enumerate(frame_format.planes):
+            pitches[i] = plane[1]
+            lines[i] = plane[5]
+        self.frame_ring = FrameRing(frame_format.frame_bytes, self.n_frame_buffers + 2, 
+                                    frame_format=frame_format)
+        return self.frame_ring.n_pictures
+        
+    def _video_lock(self, opaque, planes):
+        # decoder thread: hand out a free slot of the ring
+        ring = self.frame_ring
+        slot = ring.begin_write()
+        address = ring.address(slot)
+        for i, plane in enumerate(ring.frame_format.planes):
+            planes[i] = address + plane[0]
+        return slot + 1
+        
+    def _video_unlock(self, opaque, picture, planes):
+        # decoder thread: the frame is completely decoded
+        self.frame_ring.end_write(picture - 1)
+        
+    def _video_display(self, opaque, picture):
+        # decoder thread: the frame is due to be displayed
+        self.frame_ring.publish(picture - 1)
+        
+    def copy_frame(self, address):
+        """Copy the newest decoded frame to the given memory address
+        
+        See FrameRing.copy_newest for details.
         """
-        # creating a basic vlc instance
-        self.instance = vlc.Instance("--no-xlib")
-        # creating an empty vlc media player
-        self.mediaplayer = self.instance.media_player_new()
+        ring = self.frame_ring
+        return ring.copy_newest(address) if ring else None
         
     def play_pause(self):
         """Toggle play/pause status
         """
-        if self.mediaplayer.is_playing():
-            self.mediaplayer.pause()
+        if self.is_playing():
+            self.pause()
         else:
-            if self.mediaplayer.play() == -1:
-                return
-            self.mediaplayer.play()
+            self.play()
             
     def play(self):
         """Play player
+        
+        Nothing is sent to libvlc if the player is playing or a play command is in flight.
         """
-        if self.mediaplayer.is_playing():
+        if self.is_playing():
             return
-        self.mediaplayer.play()
+        self.requested_state = vlc.State.Playing
+        if self.mediaplayer.fast_play() == -1:
+            self.requested_state = None
     
     def pause(self):
         """Pause player 
+        
+        Nothing is sent to libvlc if the player is not playing and no play command is in flight.
         """
-        if self.mediaplayer.is_playing():
-            self.mediaplayer.pause()
+        if not self.is_playing():
+            return
+        self.requested_state = vlc.State.Paused
+        self.mediaplayer.fast_pause()
     
     def stop(self):
         """Stop player
         """
+        if self._instance is None:
+            return
+        self.requested_state = vlc.State.Stopped
         self.mediaplayer.stop()
         
     def open_file(self, filename = None):
@@ -53,12 +466,242 @@ class VLC:
         if filename == None:
             return
         
-        # create the media
-        self.media = self.instance.media_new(filename)
-        # put the media in the media player
-        self.mediaplayer.set_media(self.media)
+        # create the media and put it in the media player
+        self.swap_media(self.instance.media_new(filename))
+        
+    def swap_media(self, media):
+        """Replace the media of the Media Player and release the previous one
+        
+        The media player keeps its own reference of the media, so the previous media is 
+        freed by libvlc as soon as it is replaced. Returns the new media.
+        """
+        # put the media in the media player, this stops the previous media
+        self.mediaplayer.set_media(media)
+        previous, self.media = self.media, media
+        if previous is not None:
+            previous.release()
+        self.state = vlc.State.NothingSpecial
+        self.requested_state = None
+        return media
+        
+    def release(self):
+        """Release the media, the media player and the vlc instance
+        
+        A later command creates a new instance and media player.
+        """
+        with self._create_lock:
+            if self._instance is None:
+                return
+            self._mediaplayer.stop()
+            if self.media is not None:
+                self.media.release()
+                self.media = None
+            self._mediaplayer.release()
+            self._instance.release()
+            self._mediaplayer = None
+            self._instance = None
+            self.frame_ring = None
+            self.state = None
+            self.requested_state = None
         
     def set_volume(self, Volume):
         """Set the volume
         """
         self.mediaplayer.audio_set_volume(Volume)
+
+
+class AsyncVLC:
+    def __init__(self, player):
+        """Asynchronous control front-end for a VLC player
+        
+        play(), pause(), stop(), open_file(), set_volume() and set_display_size() only put a 
+        command into a queue and return immediately. A single worker thread owns the player 
+        and runs the commands in order. Queued play/pause commands are coalesced to the latest 
+        intent, and so are display sizes, but never across open_file() or stop(). Everything 
+        else (state, frames, listeners) is read directly from the wrapped player.
+        """
+        self.player = player
+        self._commands = collections.deque()
+        self._wakeup = threading.Condition()
+        self._display_size = None
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name='AsyncVLC', daemon=True)
+        self._worker.start()
+        
+    def __getattr__(self, name):
+        # only called for attributes not found on the front-end itself
+        return getattr(self.player, name)
+        
+    def _put(self, key, function, *args):
+        # commands with a key replace a queued command with the same key unless a command 
+        # without key (a barrier) was queued after it
+        with self._wakeup:
+            if self._closed:
+                return
+            if key is not None:
+                for i in range(len(self._commands) - 1, -1, -1):
+                    queued_key = self._commands[i][0]
+                    if queued_key is None:
+                        break
+                    if queued_key == key:
+                        del self._commands[i]
+                        break
+            self._commands.append((key, function, args))
+            self._wakeup.notify()
+            
+    def _run(self):
+        # worker thread: execute the queued commands one after another
+        while True:
+            with self._wakeup:
+                while not self._commands and not self._closed:
+                    self._wakeup.wait()
+                if not self._commands:
+                    return
+                key, function, args = self._commands.popleft()
+            try:
+                function(*args)
+            except Exception:
+                logger.error("VLC command {} failed".format(function.__name__), exc_info=True)
+                
+    @property
+    def pending(self):
+        # number of commands waiting for the worker
+        return len(self._commands)
+        
+    def play(self):
+        self._put('intent', self.player.play)
+        
+    def pause(self):
+        self._put('intent', self.player.pause)
+        
+    def play_pause(self):
+        self._put('intent', self.player.play_pause)
+        
+    def stop(self):
+        self._put(None, self.player.stop)
+        
+    def open_file(self, filename = None):
+        self._put(None, self.player.open_file, filename)
+        
+    def swap_media(self, media):
+        self._put(None, self.player.swap_media, media)
+        
+    def set_volume(self, Volume):
+        self._put('volume', self.player.set_volume, Volume)
+        
+    def set_display_size(self, width, height, tolerance=0.1):
+        # called every redraw, only changed sizes are sent to the worker
+        size = (width, height)
+        if size == self._display_size:
+            return
+        self._display_size = size
+        self._put('display_size', self.player.set_display_size, width, height, tolerance)
+        
+    def close(self, timeout=None):
+        """Run the queued commands and stop the worker thread
+        
+        Returns False if the worker is still busy after timeout seconds.
+        """
+        with self._wakeup:
+            self._closed = True
+            self._wakeup.notify()
+        self._worker.join(timeout)
+        return not self._worker.is_alive()
+
+
+class AioVLC:
+    def __init__(self, player=None, loop=None):
+        """asyncio front-end for a VLC player (a new one with a video window if player is None)
+        
+        Has to be created in the running event loop it is used with, unless loop is given. State 
+        changes reported by libvlc are handed to the loop with call_soon_threadsafe, nothing is 
+        polled. The blocking libvlc calls run in the default executor of the loop.
+        """
+        # asyncio is only imported when AioVLC is used
+        import asyncio
+        # a player created here is released by close()
+        self._owns_player = player is None
+        self.player = player if player is not None else VLC()
+        self.loop = loop or asyncio.get_running_loop()
+        # futures waiting for a state and queues of the running events() iterators
+        self._waiters = []
+        self._queues = []
+        self.player.state_listeners.append(self._on_state)
+        
+    def _on_state(self, state):
+        # libvlc event thread: forward the state to the event loop
+        self.loop.call_soon_threadsafe(self._dispatch, state)
+        
+    def _dispatch(self, state):
+        # event loop: resolve the waiters of this state and feed all event iterators
+        waiters, self._waiters = self._waiters, []
+        # states that end the wait for any other state
+        failed = (vlc.State.Stopped, vlc.State.Ended, vlc.State.Error)
+        for wanted, future in waiters:
+            if future.done():
+                continue
+            if state == wanted:
+                future.set_result(state)
+            elif state in failed:
+                future.set_exception(RuntimeError('libvlc reported {} instead of {}'.format(state, wanted)))
+            else:
+                self._waiters.append((wanted, future))
+        for queue in self._queues:
+            queue.put_nowait(state)
+            
+    async def _command(self, state, function):
+        # issue a blocking command in the executor and wait until libvlc reports the state
+        if self.player.state == state and self.player.requested_state in (None, state):
+            return state
+        future = self.loop.create_future()
+        self._waiters.append((state, future))
+        await self.loop.run_in_executor(None, function)
+        # the player drops the request if libvlc refused the command
+        if self.player.requested_state != state and self.player.state != state:
+            future.cancel()
+            raise RuntimeError('libvlc refused to switch to {}'.format(state))
+        return await future
+        
+    async def open(self, filename):
+        """Load the video file into the player
+        """
+        await self.loop.run_in_executor(None, self.player.open_file, filename)
+        
+    async def play(self):
+        """Start playing, resolves when libvlc reports MediaPlayerPlaying
+        """
+        return await self._command(vlc.State.Playing, self.player.play)
+        
+    async def pause(self):
+        """Pause, resolves when libvlc reports MediaPlayerPaused
+        
+        Returns the current state right away if the player is not playing.
+        """
+        if not self.player.is_playing():
+            return self.player.state
+        return await self._command(vlc.State.Paused, self.player.pause)
+        
+    async def stop(self):
+        """Stop, resolves when libvlc reports MediaPlayerStopped
+        """
+        if self.player.state in (None, vlc.State.NothingSpecial, vlc.State.Stopped):
+            return self.player.state
+        return await self._command(vlc.State.Stopped, self.player.stop)
+        
+    async def events(self):
+        """Asynchronously iterate over the states reported by libvlc from now on
+        """
+        import asyncio
+        queue = asyncio.Queue()
+        self._queues.append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._queues.remove(queue)
+            
+    def close(self):
+        # stop forwarding events to the loop and release the player if it was created here
+        self.player.state_listeners.remove(self._on_state)
+        if self._owns_player:
+            self.player.release()
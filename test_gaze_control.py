@@ -0,0 +1,99 @@
+'''
+(*)~----------------------------------------------------------------------------------
+ Tests of the gaze-based playback control
+----------------------------------------------------------------------------------~(*)
+'''
+
+import unittest
+import numpy as np
+
+from gaze_control import Gaze_Samples, Playback_Control, PAUSE
+
+FRAME = 1. / 30
+
+
+def frame(timestamp, confidence, x=0.5, n=4):
+    # n gaze samples of one frame at the same position with the same confidence
+    t = timestamp - FRAME * np.arange(n)[::-1] / n
+    return Gaze_Samples(on_srf=np.ones(n, np.bool_), norm_pos=np.tile((x, 0.5), (n, 1)),
+                        confidence=np.full(n, confidence), timestamp=t)
+
+
+def no_gaze():
+    return Gaze_Samples(on_srf=np.zeros(0, np.bool_), norm_pos=np.zeros((0, 2)),
+                        confidence=np.zeros(0), timestamp=np.zeros(0))
+
+
+class Test_Playback_Control(unittest.TestCase):
+
+    def start_playing(self, control):
+        # look at the surface until the video plays, return the time of the next frame
+        t = 0.
+        while not control.playing:
+            control.process(t, frame(t, 1.))
+            t += FRAME
+        return t
+
+    def pause_time(self, control, t, samples):
+        # feed the frames of samples(t) for 10 s, return the time of the pause
+        for _ in range(int(10. / FRAME)):
+            if control.process(t, samples(t)) == PAUSE:
+                return t
+            t += FRAME
+        self.fail('the video was not paused')
+
+    def test_look_away_pauses(self):
+        control = Playback_Control(gaze_filter='none', predict_look_away=False)
+        start = self.start_playing(control)
+        paused = self.pause_time(control, start, lambda t: frame(t, 1., x=2.))
+        self.assertAlmostEqual(paused - start, control.exit_dwell, delta=2 * FRAME)
+
+    def test_blink_keeps_playing(self):
+        control = Playback_Control(gaze_filter='none')
+        t = self.start_playing(control)
+        end = t + 0.8 * control.max_blink
+        while t < end:
+            self.assertIsNone(control.process(t, frame(t, 0.1)))
+            t += FRAME
+        self.assertIsNone(control.process(t, frame(t, 1.)))
+        self.assertTrue(control.playing)
+
+    def test_low_confidence_pauses(self):
+        control = Playback_Control(gaze_filter='none')
+        start = self.start_playing(control)
+        paused = self.pause_time(control, start, lambda t: frame(t, 0.1))
+        self.assertAlmostEqual(paused - start, control.max_blink + control.grace_period, delta=2 * FRAME)
+
+    def test_no_gaze_pauses(self):
+        control = Playback_Control(gaze_filter='none')
+        start = self.start_playing(control)
+        paused = self.pause_time(control, start, lambda t: no_gaze())
+        self.assertAlmostEqual(paused - start, control.max_blink + control.grace_period, delta=2 * FRAME)
+
+    def test_lost_surface_pauses(self):
+        control = Playback_Control(gaze_filter='none')
+        start = self.start_playing(control)
+        paused = self.pause_time(control, start, lambda t: None)
+        self.assertAlmostEqual(paused - start, control.grace_period, delta=2 * FRAME)
+
+    def test_source_is_first_sample_off_surface(self):
+        control = Playback_Control(gaze_filter='none', predict_look_away=False)
+        t = self.start_playing(control)
+        # the gaze leaves the surface with the second sample of this frame
+        leaving = frame(t, 1.)
+        leaving.norm_pos[1:, 0] = 2.
+        self.assertIsNone(control.process(t, leaving))
+        command = None
+        while command is None:
+            t += FRAME
+            command = control.process(t, frame(t, 1., x=2.))
+        self.assertEqual(command, PAUSE)
+        self.assertEqual(control.source_timestamp, leaving.timestamp[1])
+
+    def test_settings_round_trip(self):
+        control = Playback_Control(max_blink=0.25)
+        self.assertEqual(Playback_Control(**control.get_settings()).get_settings(), control.get_settings())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+'''
+(*)~----------------------------------------------------------------------------------
+ Tests of the frame ring shared by the libvlc decoder thread and the reader
+----------------------------------------------------------------------------------~(*)
+'''
+
+import ctypes
+import unittest
+
+import myvlc
+from myvlc import FrameRing
+
+
+class Test_Frame_Ring(unittest.TestCase):
+
+    def test_pool_never_shares_a_slot(self):
+        # libvlc locks its whole picture pool while the newest frame and the frame being read are set aside
+        player = myvlc.VLC(embed_video=True)
+        chroma = ctypes.create_string_buffer(4)
+        width, height = (ctypes.c_uint * 1)(64), (ctypes.c_uint * 1)(48)
+        pitches, lines = (ctypes.c_uint * 3)(), (ctypes.c_uint * 3)()
+        n_pictures = player._video_format(None, chroma, width, height, pitches, lines)
+        ring = player.frame_ring
+        slot = ring.begin_write()
+        ring.end_write(slot)
+        ring.publish(slot)
+        self.assertIsNotNone(ring.acquire())
+        locked = [ring.begin_write() for _ in range(2)]
+        ring.end_write(locked[0])
+        ring.publish(locked[0])
+        locked += [ring.begin_write() for _ in range(n_pictures - 1)]
+        self.assertEqual(len(set(locked)), len(locked))
+        self.assertNotIn(slot, locked)
+        self.assertEqual(ring.late, 0)
+
+    def test_dropped_frame_is_recycled(self):
+        # a ring for a pool of one picture: libvlc reuses the picture of frames it never displayed
+        ring = FrameRing(16, n_slots=3)
+        for slot in range(3):
+            self.assertEqual(ring.begin_write(), slot)
+            ring.end_write(slot)
+        self.assertEqual(ring.late, 0)
+        # the pool of one picture is locked again, none of the three frames was displayed
+        self.assertEqual(ring.begin_write(), 0)
+        self.assertEqual(ring.late, 3)
+        self.assertEqual(ring._state.count(FrameRing.FREE), 2)
+
+    def test_reader_gets_newest_frame(self):
+        ring = FrameRing(16)
+        for value in (1, 2):
+            slot = ring.begin_write()
+            ring.view(slot)[:] = value
+            ring.end_write(slot)
+            ring.publish(slot)
+        slot, sequence = ring.acquire()
+        self.assertEqual(ring.view(slot)[0], 2)
+        ring.release(sequence)
+        self.assertIsNone(ring.acquire())
+        self.assertEqual(ring.dropped, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
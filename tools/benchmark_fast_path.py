@@ -0,0 +1,58 @@
+'''
+(*)~----------------------------------------------------------------------------------
+ Microbenchmark of the per-frame libvlc calls: generic wrappers vs. fast path
+
+ Usage: python tools/benchmark_fast_path.py [video file] [-n calls]
+----------------------------------------------------------------------------------~(*)
+'''
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import vlc
+
+# (label, generic wrapper, fast path) of the calls compared. play and pause change the
+# player state and are left out, their fast path skips the same work as is_playing
+CALLS = (
+    ('is_playing', 'is_playing', 'fast_is_playing'),
+    ('get_time', 'get_time', 'fast_get_time'),
+    ('get_position', 'get_position', 'fast_get_position'),
+    ('get_state', 'get_state', 'fast_get_state'),
+)
+
+
+def per_call(function, n, repeat=5):
+    # best time of a call in nanoseconds
+    return min(timeit.repeat(function, number=n, repeat=repeat)) / n * 1e9
+
+
+def run(player, n):
+    print('{:<14}{:>12}{:>12}{:>10}'.format('call', 'wrapper ns', 'fast ns', 'speedup'))
+    for label, wrapper, fast in CALLS:
+        generic = per_call(getattr(player, wrapper), n)
+        # the first call binds the fast path to the player
+        getattr(player, fast)()
+        fast_path = per_call(getattr(player, fast), n)
+        print('{:<14}{:>12.0f}{:>12.0f}{:>9.1f}x'.format(label, generic, fast_path, generic / fast_path))
+
+
+if __name__ == '__main__':
+    # the description is the first paragraph below the banner line of the docstring
+    description = ' '.join(line.strip() for line in __doc__.split('\n\n')[0].split('\n')[2:])
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('video', nargs='?', help='video file played during the benchmark')
+    parser.add_argument('-n', type=int, default=200000, help='calls per measurement')
+    args = parser.parse_args()
+
+    instance = vlc.Instance('--no-xlib', '--quiet', '--vout=dummy', '--aout=dummy')
+    player = instance.media_player_new()
+    if args.video:
+        player.set_media(instance.media_new(args.video))
+        player.play()
+    run(player, args.n)
+    player.stop()
+    player.release()
+    instance.release()
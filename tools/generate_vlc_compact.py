@@ -0,0 +1,298 @@
+'''
+(*)~----------------------------------------------------------------------------------
+ Generator of the compact libvlc binding vlc_compact.py
+
+ vlc.py defines every libvlc function twice, as wrapper function and as method, each
+ with its docstring. The compact binding keeps all hand-written code of vlc.py but
+ replaces
+   - the wrapper functions by a table of (symbol, paramflags, errcheck, restype,
+     argtypes) entries, each bound to ctypes when it is called first, and
+   - the plain methods of the libvlc classes by a table of their source, compiled
+     when the method is used first.
+ The docstrings go to vlc_compact_docs.json and are only read on request.
+
+ Usage: python tools/generate_vlc_compact.py [path of vlc.py] [output directory]
+----------------------------------------------------------------------------------~(*)
+'''
+
+import ast
+import json
+import os
+import sys
+import textwrap
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+HEADER = '''\
+# Compact libvlc binding generated by tools/generate_vlc_compact.py from vlc.py.
+# Do not edit, change vlc.py and run the generator again. The docstrings of the
+# wrapped functions and methods are in vlc_compact_docs.json, see docstring().
+'''
+
+# appended to the generated module, %(bindings)s and %(methods)s are the tables
+RUNTIME = '''
+# Start of compact binding #
+
+from types import MethodType as _MethodType
+
+_docs = None
+
+def docstring(name):
+    """Return the docstring of a libvlc function ('libvlc_...') or of a
+    method ('Class.method'), read from vlc_compact_docs.json on first use.
+    Without that file there are no docstrings and None is returned.
+    """
+    global _docs
+    if _docs is None:
+        import json
+        path = os.path.splitext(os.path.abspath(__file__))[0] + '_docs.json'
+        try:
+            with open(path) as f:
+                _docs = json.load(f)
+        except (IOError, ValueError):
+            _docs = {}
+    return _docs.get(name)
+
+class _Binding(object):
+    """(INTERNAL) Placeholder of a libvlc function, binds it on the first call.
+
+    The bound ctypes function replaces the placeholder in the module, so
+    later calls go straight to ctypes.
+    """
+    __slots__ = ('__name__',)
+
+    def __init__(self, name):
+        self.__name__ = name
+
+    def __call__(self, *args):
+        return _bind(self.__name__)(*args)
+
+    @property
+    def __doc__(self):
+        return docstring(self.__name__)
+
+    def __repr__(self):
+        return '<libvlc function %%s>' %% (self.__name__,)
+
+# ctypes function type -> subclass with a docstring read on request
+_documented = {}
+
+def _bind(name):
+    """(INTERNAL) Bind the libvlc function name from its table entry.
+    """
+    f = _Globals[name]
+    if isinstance(f, _Binding):
+        f = _Cfunction(name, *eval('(%%s,)' %% (_bindings[name],), _Globals))
+        cls = type(f)
+        if cls not in _documented:
+            _documented[cls] = type(cls.__name__, (cls,), {
+                '_flags_': cls._flags_, '_argtypes_': cls._argtypes_,
+                '_restype_': cls._restype_,
+                '__doc__': property(lambda self: docstring(self.__name__))})
+        f.__class__ = _documented[cls]
+        f.__name__ = name
+        _Globals[name] = f
+    return f
+
+class _Method(object):
+    """(INTERNAL) Method compiled from the table, its docstring is read on
+    request.
+    """
+    __slots__ = ('__func__',)
+
+    def __init__(self, func):
+        self.__func__ = func
+
+    def __get__(self, obj, cls=None):
+        return self if obj is None else _MethodType(self.__func__, obj)
+
+    def __call__(self, *args, **kwds):
+        return self.__func__(*args, **kwds)
+
+    @property
+    def __doc__(self):
+        return docstring(self.__func__.__qualname__)
+
+    @property
+    def __wrapped__(self):
+        return self.__func__
+
+    def __getattr__(self, name):
+        # __name__, __qualname__ and the other function attributes
+        return getattr(self.__func__, name)
+
+    def __repr__(self):
+        return '<method %%s>' %% (self.__func__.__qualname__,)
+
+def _method(cls, name):
+    """(INTERNAL) Compile the method name of cls (or of a base class) from
+    its table entry and add it to the class, None if there is none.
+    """
+    for c in cls.__mro__:
+        key = '%%s.%%s' %% (c.__name__, name)
+        source = _methods.get(key)
+        if source is not None:
+            namespace = {}
+            exec(source, _Globals, namespace)
+            f = namespace[name]
+            f.__qualname__ = key
+            setattr(c, name, _Method(f))
+            return f
+    return None
+
+def _Ctype_getattr(self, name):
+    """(INTERNAL) Create the methods of the libvlc classes on first use.
+    """
+    if name.startswith('__') or _method(type(self), name) is None:
+        raise AttributeError('%%r object has no attribute %%r' %% (type(self).__name__, name))
+    return getattr(self, name)
+
+def _Ctype_dir(self):
+    """(INTERNAL) List the methods that are not created yet, too.
+    """
+    names = set(object.__dir__(self))
+    for c in type(self).__mro__:
+        prefix = c.__name__ + '.'
+        names.update(k[len(prefix):] for k in _methods if k.startswith(prefix))
+    return sorted(names)
+
+_Ctype.__getattr__ = _Ctype_getattr
+_Ctype.__dir__ = _Ctype_dir
+
+# libvlc function -> arguments of _Cfunction after the name (paramflags,
+# errcheck, restype, argtypes) as Python source
+_bindings = %(bindings)s
+
+# 'Class.method' -> source of the method
+_methods = %(methods)s
+
+for _name in _bindings:
+    _Globals[_name] = _Binding(_name)
+del _name
+'''
+
+
+def is_docstring(node):
+    return (isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str))
+
+
+def cfunction_call(function):
+    """Return the _Cfunction call of a generated wrapper function or None
+
+    Generated wrappers consist of a docstring, f = _Cfunctions.get(...) or _Cfunction(...)
+    and return f(...).
+    """
+    body = function.body
+    if len(body) != 3 or not is_docstring(body[0]):
+        return None
+    if not isinstance(body[1], ast.Assign) or not isinstance(body[2], ast.Return):
+        return None
+    value = body[1].value
+    if not isinstance(value, ast.BoolOp) or len(value.values) != 2:
+        return None
+    call = value.values[1]
+    if isinstance(call, ast.Call) and getattr(call.func, 'id', None) == '_Cfunction':
+        return call
+    return None
+
+
+def lazy_method(method):
+    # plain methods can be compiled later: no decorators, no dunders and no super()
+    if method.decorator_list or method.name.startswith('__'):
+        return False
+    return not any(isinstance(node, ast.Name) and node.id == 'super' for node in ast.walk(method))
+
+
+def segment(lines, node):
+    # source of a node, ast.get_source_segment splits the whole source on every call
+    if node.lineno == node.end_lineno:
+        return lines[node.lineno - 1].encode()[node.col_offset:node.end_col_offset].decode()
+    text = [lines[node.lineno - 1].encode()[node.col_offset:].decode()]
+    text += lines[node.lineno:node.end_lineno - 1]
+    text.append(lines[node.end_lineno - 1].encode()[:node.end_col_offset].decode())
+    return ''.join(text)
+
+
+def span(node):
+    # line range (0-based, end exclusive) of a node including its decorators
+    first = min([node.lineno] + [d.lineno for d in node.decorator_list])
+    return first - 1, node.end_lineno
+
+
+def generate(source):
+    """Return the compact module and its docstrings for the source of vlc.py
+    """
+    tree = ast.parse(source)
+    lines = source.splitlines(True)
+    ctype_classes = {'_Ctype'}
+    bindings, methods, docs = {}, {}, {}
+    removed = []
+
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name.startswith('libvlc_'):
+            call = cfunction_call(node)
+            if call is None:
+                continue
+            bindings[node.name] = ', '.join(segment(lines, a) for a in call.args[1:])
+            docs[node.name] = ast.get_docstring(node)
+            removed.append(span(node))
+        elif isinstance(node, ast.ClassDef):
+            if not any(getattr(base, 'id', None) in ctype_classes for base in node.bases):
+                continue
+            ctype_classes.add(node.name)
+            for method in node.body:
+                if not isinstance(method, ast.FunctionDef) or not lazy_method(method):
+                    continue
+                key = '{}.{}'.format(node.name, method.name)
+                docs[key] = ast.get_docstring(method)
+                start, end = span(method)
+                if is_docstring(method.body[0]):
+                    # drop the docstring, but keep the body (a docstring-only method gets a pass)
+                    body_start = method.body[1].lineno - 1 if len(method.body) > 1 else None
+                    method_lines = lines[start:method.body[0].lineno - 1]
+                    method_lines += lines[body_start:end] if body_start is not None else ['        pass\n']
+                else:
+                    method_lines = lines[start:end]
+                methods[key] = textwrap.dedent(''.join(method_lines))
+                removed.append((start, end))
+        elif (isinstance(node, ast.If) and isinstance(node.test, ast.Compare)
+              and getattr(node.test.left, 'id', None) == '__name__'):
+            # the command line player of vlc.py
+            removed.append((node.lineno - 1, node.end_lineno))
+
+    keep = [True] * len(lines)
+    for start, end in removed:
+        keep[start:end] = [False] * (end - start)
+    body = ''.join(line for line, k in zip(lines, keep) if k)
+    # classes whose methods were all moved to the table still need a body
+    body = fill_empty_classes(body)
+    runtime = RUNTIME % {'bindings': format_table(bindings), 'methods': format_table(methods)}
+    return HEADER + body.rstrip() + '\n' + runtime, docs
+
+
+def fill_empty_classes(body):
+    # insert a pass into every class that lost all its statements
+    lines = body.splitlines(True)
+    while True:
+        try:
+            ast.parse(''.join(lines))
+            return ''.join(lines)
+        except IndentationError as e:
+            lines.insert(e.lineno - 1, '    pass\n')
+
+
+def format_table(table):
+    return '{\n' + ''.join('    {!r}: {!r},\n'.format(k, table[k]) for k in sorted(table)) + '}'
+
+
+if __name__ == '__main__':
+    source_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(ROOT, 'vlc.py')
+    output = sys.argv[2] if len(sys.argv) > 2 else ROOT
+    with open(source_path) as f:
+        module, docs = generate(f.read())
+    with open(os.path.join(output, 'vlc_compact.py'), 'w') as f:
+        f.write(module)
+    with open(os.path.join(output, 'vlc_compact_docs.json'), 'w') as f:
+        json.dump(docs, f, indent=0, sort_keys=True)
+    print('vlc_compact.py: {} bytes, vlc_compact_docs.json: {} docstrings'.format(len(module), len(docs)))
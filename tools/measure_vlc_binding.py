@@ -0,0 +1,65 @@
+'''
+(*)~----------------------------------------------------------------------------------
+ Import time and memory of the libvlc bindings vlc.py and vlc_compact.py
+
+ Every measurement runs in a fresh interpreter. Cold imports compile the module (empty
+ bytecode cache), warm imports load it from the cache. libvlc itself is not loaded.
+
+ Usage: python tools/measure_vlc_binding.py [-n runs]
+----------------------------------------------------------------------------------~(*)
+'''
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# run in the child interpreter: import the module and report the import time or, since
+# tracing slows the import down, the memory allocated by the import
+CHILD = '''
+import json, sys, time, tracemalloc
+import ctypes, functools, threading
+sys.path.insert(0, {root!r})
+if {memory}:
+    tracemalloc.start()
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps(tracemalloc.get_traced_memory()[0] if {memory} else seconds))
+'''
+
+
+def measure(module, cache, memory=False):
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=cache)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    child = CHILD.format(root=ROOT, module=module, memory=memory)
+    return json.loads(subprocess.check_output([sys.executable, '-c', child], env=env))
+
+
+def run(module, n):
+    # best of n cold and warm imports, and the memory of a warm import
+    cold, warm = [], []
+    for _ in range(n):
+        with tempfile.TemporaryDirectory() as cache:
+            cold.append(measure(module, cache))
+            warm.append(measure(module, cache))
+            memory = measure(module, cache, memory=True)
+    return min(cold), min(warm), memory
+
+
+if __name__ == '__main__':
+    # the description is the first paragraph below the banner line of the docstring
+    description = ' '.join(line.strip() for line in __doc__.split('\n\n')[0].split('\n')[2:])
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('-n', type=int, default=5, help='runs per measurement')
+    args = parser.parse_args()
+
+    print('{:<14}{:>10}{:>12}{:>12}{:>12}'.format('module', 'source kB', 'cold ms', 'warm ms', 'memory kB'))
+    for module in ('vlc', 'vlc_compact'):
+        size = os.path.getsize(os.path.join(ROOT, module + '.py')) / 1024.
+        cold, warm, memory = run(module, args.n)
+        print('{:<14}{:>10.0f}{:>12.1f}{:>12.1f}{:>12.0f}'.format(module, size, 1000 * cold, 1000 * warm, memory / 1024.))
@@ -0,0 +1,61 @@
+'''
+(*)~----------------------------------------------------------------------------------
+ Soak check of the media lifetime: swaps many media items into one player and fails
+ if the resident memory (RSS) of the process keeps growing
+
+ Usage: python tools/soak_media_swap.py [video file] [-n media] [--tolerance MB]
+----------------------------------------------------------------------------------~(*)
+'''
+
+import argparse
+import gc
+import os
+import resource
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import myvlc
+
+
+def rss():
+    # current resident memory in bytes (peak resident memory if /proc is not available)
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except (IOError, OSError):
+        scale = 1 if sys.platform == 'darwin' else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def soak(player, filename, n, warmup, report_every):
+    """Swap n media into the player after warmup swaps, return the RSS before and after
+    """
+    for _ in range(warmup):
+        player.open_file(filename)
+    gc.collect()
+    start = rss()
+    for i in range(1, n + 1):
+        player.open_file(filename)
+        if i % report_every == 0:
+            print('{:>8} media  RSS {:8.1f} MB'.format(i, rss() / 2. ** 20))
+    gc.collect()
+    return start, rss()
+
+
+if __name__ == '__main__':
+    # the description is the first paragraph below the banner line of the docstring
+    description = ' '.join(line.strip() for line in __doc__.split('\n\n')[0].split('\n')[2:])
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('video', nargs='?', default='soak.mp4',
+                        help='media file, it is not played and does not need to exist')
+    parser.add_argument('-n', type=int, default=10000, help='media items to load')
+    parser.add_argument('--warmup', type=int, default=1000, help='media items loaded before measuring')
+    parser.add_argument('--tolerance', type=float, default=4., help='allowed RSS growth in MB')
+    args = parser.parse_args()
+
+    player = myvlc.VLC()
+    start, end = soak(player, args.video, args.n, args.warmup, max(1, args.n // 10))
+    player.release()
+    growth = (end - start) / 2. ** 20
+    print('RSS growth over {} media: {:.2f} MB (tolerance {:.1f} MB)'.format(args.n, growth, args.tolerance))
+    sys.exit(0 if growth <= args.tolerance else 1)
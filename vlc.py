@@ -41,13 +41,14 @@ C{get_instance} method of L{MediaPlayer} and L{MediaListPlayer}.
 """
 
 import ctypes
-from ctypes.util import find_library
 import os
 import sys
 import functools
+import logging
+import threading
+import weakref
 
-# Used by EventManager in override.py
-from inspect import getargspec
+logger = logging.getLogger(__name__)
 
 __version__ = "N/A"
 build_date  = "Mon Mar 20 11:04:27 2017"
@@ -105,6 +106,8 @@ else:
 _internal_guard = object()
 
 def find_lib():
+    # ctypes.util is slow to import, it is only needed to load the library
+    from ctypes.util import find_library
     dll = None
     plugin_path = None
     if sys.platform.startswith('linux'):
@@ -177,8 +180,35 @@ def find_lib():
 
     return (dll, plugin_path)
 
-# plugin_path used on win32 and MacOS in override.py
-dll, plugin_path  = find_lib()
+# The library is only loaded when the first binding is used (or dll/plugin_path
+# are read from the module), so importing this module stays cheap.
+_lib_lock = threading.Lock()
+
+def _load_lib():
+    """(INTERNAL) Load libvlc on first use and return the dll.
+
+    Sets the module globals dll and plugin_path (used on win32 and
+    MacOS in override.py) and the libvlc_free fallback.
+    """
+    try:
+        return _Globals['dll']
+    except KeyError:
+        pass
+    with _lib_lock:
+        if 'dll' not in _Globals:
+            lib, _Globals['plugin_path'] = find_lib()
+            _emulate_libvlc_free(lib)
+            _bind_fast_path(lib)
+            _Globals['dll'] = lib
+    return _Globals['dll']
+
+def __getattr__(name):
+    """(INTERNAL) Materialise the library dependent module attributes on demand.
+    """
+    if name in ('dll', 'plugin_path'):
+        _load_lib()
+        return _Globals[name]
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
 
 class VLCException(Exception):
     """Exception raised by libvlc methods.
@@ -197,19 +227,26 @@ class memoize_parameterless(object):
 
     If called later with the same arguments, the cached value is returned
     (not reevaluated).
+    The value is stored in the object's __dict__, so it lives exactly as
+    long as its object, even if it refers back to it.
     Adapted from https://wiki.python.org/moin/PythonDecoratorLibrary
     """
     def __init__(self, func):
         self.func = func
-        self._cache = {}
+        self._key = '_memoized_' + func.__name__
 
     def __call__(self, obj):
         try:
-            return self._cache[obj]
+            return obj.__dict__[self._key]
         except KeyError:
-            v = self._cache[obj] = self.func(obj)
+            v = obj.__dict__[self._key] = self.func(obj)
             return v
 
+    def forget(self, obj):
+        """Drop the cached value of obj, e.g. when its native object is released.
+        """
+        obj.__dict__.pop(self._key, None)
+
     def __repr__(self):
         """Return the function's docstring.
         """
@@ -218,6 +255,8 @@ class memoize_parameterless(object):
     def __get__(self, obj, objtype):
       """Support instance methods.
       """
+      if obj is None:  # accessed on the class, e.g. to forget an object
+          return self
       return functools.partial(self.__call__, obj)
 
 # Default instance. It is used to instanciate classes directly in the
@@ -238,9 +277,13 @@ _Globals = globals()  # sys.modules[__name__].__dict__
 def _Cfunction(name, flags, errcheck, *types):
     """(INTERNAL) New ctypes function binding.
     """
+    dll = _load_lib()
     if hasattr(dll, name) and name in _Globals:
         p = ctypes.CFUNCTYPE(*types)
         f = p((name, dll), flags)
+        if name in _owning_functions:
+            # the new wrapper owns a reference of the native object
+            errcheck = _owning_result(errcheck)
         if errcheck is not None:
             f.errcheck = errcheck
         # replace the Python function
@@ -1579,19 +1622,63 @@ class EventManager(_Ctype):
     remain alive (i.e. are not garbage collected) until
     B{after} the notification has been unregistered.
 
-    @note: Only a single notification can be registered
-    for each event type in an EventManager instance.
+    @note: Any number of notifications can be registered
+    for each event type in an EventManager instance. They
+    are called in the order they were registered, and may
+    be attached or detached while events are dispatched.
     
     '''
 
-    _callback_handler = None
-    _callbacks = {}
+    # guards the lazy creation of the registries
+    _registry_lock = threading.Lock()
 
     def __new__(cls, ptr=_internal_guard):
         if ptr == _internal_guard:
             raise VLCException("(INTERNAL) ctypes class.\nYou should get a reference to EventManager through the MediaPlayer.event_manager() method.")
         return _Constructor(cls, ptr)
 
+    def _registry(self):
+        """(INTERNAL) Create the subscriber registry and the native trampoline of this instance.
+
+        The registry maps event type values to tuples of (callback, args, kwds), which
+        are replaced (never modified) under the lock, so dispatch needs no lock. libvlc
+        is never called under the lock, since libvlc holds its own event lock while it
+        dispatches, and handlers may attach and detach callbacks.
+        """
+        try:
+            return self._subscribers
+        except AttributeError:
+            pass
+        with self._registry_lock:
+            if '_subscribers' not in self.__dict__:
+                self._create_registry()
+        return self._subscribers
+
+    def _create_registry(self):
+        _called_from_ctypes = ctypes.CFUNCTYPE(None, ctypes.POINTER(Event), ctypes.c_void_p)
+        subscribers = {}
+        @_called_from_ctypes
+        def _callback_handler(event, k):
+            """(INTERNAL) handle callback call from ctypes.
+
+            @note: We cannot simply make this an EventManager
+            method since ctypes does not prepend self as the
+            first parameter, hence this closure.
+            """
+            # deref event.contents once to simplify callback code
+            event = event.contents
+            for call, args, kwds in subscribers.get(k, ()):
+                # a failing subscriber must not keep the event from the others
+                try:
+                    call(event, *args, **kwds)
+                except Exception:
+                    logger.error('Callback %r for %s failed', call, event.type, exc_info=True)
+        self._lock = threading.Lock()
+        self._callback_handler = _callback_handler
+        # event types the trampoline is attached to, it stays attached as long as the registry
+        self._attached = set()
+        self._subscribers = subscribers
+
     def event_attach(self, eventtype, callback, *args, **kwds):
         """Register an event notification.
 
@@ -1609,47 +1696,60 @@ class EventManager(_Ctype):
             raise VLCException("%s required: %r" % ('EventType', eventtype))
         if not hasattr(callback, '__call__'):  # callable()
             raise VLCException("%s required: %r" % ('callable', callback))
-         # check that the callback expects arguments
-        if not any(getargspec(callback)[:2]):  # list(...)
+         # check once that the callback accepts the event and the given arguments,
+         # inspect is imported here since it is slow to import
+        from inspect import signature
+        try:
+            signature(callback).bind(None, *args, **kwds)
+        except TypeError:
             raise VLCException("%s required: %r" % ('argument', callback))
+        except ValueError:  # no signature (builtins), trust the caller
+            pass
 
-        if self._callback_handler is None:
-            _called_from_ctypes = ctypes.CFUNCTYPE(None, ctypes.POINTER(Event), ctypes.c_void_p)
-            @_called_from_ctypes
-            def _callback_handler(event, k):
-                """(INTERNAL) handle callback call from ctypes.
-
-                @note: We cannot simply make this an EventManager
-                method since ctypes does not prepend self as the
-                first parameter, hence this closure.
-                """
-                try: # retrieve Python callback and arguments
-                    call, args, kwds = self._callbacks[k]
-                     # deref event.contents to simplify callback code
-                    call(event.contents, *args, **kwds)
-                except KeyError:  # detached?
-                    pass
-            self._callback_handler = _callback_handler
-            self._callbacks = {}
-
+        subscribers = self._registry()
         k = eventtype.value
+        entry = (callback, args, kwds)
+        with self._lock:
+            subscribers[k] = subscribers.get(k, ()) + (entry,)
+            # the native trampoline is attached once per event type
+            attach = k not in self._attached
+            self._attached.add(k)
+        if not attach:
+            return 0
         r = libvlc_event_attach(self, k, self._callback_handler, k)
-        if not r:
-            self._callbacks[k] = (callback, args, kwds)
+        if r:
+            with self._lock:
+                self._attached.discard(k)
+                callbacks = tuple(c for c in subscribers.get(k, ()) if c is not entry)
+                if callbacks:
+                    subscribers[k] = callbacks
+                else:
+                    subscribers.pop(k, None)
         return r
 
-    def event_detach(self, eventtype):
+    def event_detach(self, eventtype, callback=None):
         """Unregister an event notification.
 
         @param eventtype: the event type notification to be removed.
+        @param callback: the callback to remove, all callbacks of the event type if None.
+
+        @note: The native trampoline stays attached, it ignores event types without callbacks.
         """
         if not isinstance(eventtype, EventType):
             raise VLCException("%s required: %r" % ('EventType', eventtype))
 
+        subscribers = self._registry()
         k = eventtype.value
-        if k in self._callbacks:
-            del self._callbacks[k] # remove, regardless of libvlc return value
-            libvlc_event_detach(self, k, self._callback_handler, k)
+        with self._lock:
+            callbacks = subscribers.get(k, ())
+            if callback is not None:
+                callbacks = tuple(c for c in callbacks if c[0] != callback)
+            else:
+                callbacks = ()
+            if callbacks:
+                subscribers[k] = callbacks
+            else:
+                subscribers.pop(k, None)
 
 class Instance(_Ctype):
     '''Create a new Instance instance.
@@ -1682,6 +1782,7 @@ class Instance(_Ctype):
         elif args[0] != 'vlc':
             args.insert(0, 'vlc')
 
+        _load_lib()
         if plugin_path is not None:
             # set plugin_path if detected, win32 and MacOS,
             # if the user did not specify it itself.
@@ -8120,12 +8221,146 @@ def callbackmethod(callback):
     """Now obsolete @callbackmethod decorator."""
     return callback
 
+# Lifetime of the native objects. Wrappers returned by the functions
+# creating a native object own its reference: it is released once,
+# either explicitly by release() (or leaving a with block) or when the
+# wrapper is garbage collected. Other wrappers (e.g. of get_media())
+# are not released automatically.
+_owning_functions = frozenset((
+    'libvlc_new',
+    'libvlc_media_new_location', 'libvlc_media_new_path', 'libvlc_media_new_fd',
+    'libvlc_media_new_callbacks', 'libvlc_media_new_as_node', 'libvlc_media_duplicate',
+    'libvlc_media_list_new',
+    'libvlc_media_player_new', 'libvlc_media_player_new_from_media',
+    'libvlc_media_list_player_new',
+))
+
+# class -> libvlc function releasing its native object
+_release_functions = {
+    'Instance':        'libvlc_release',
+    'Media':           'libvlc_media_release',
+    'MediaList':       'libvlc_media_list_release',
+    'MediaPlayer':     'libvlc_media_player_release',
+    'MediaListPlayer': 'libvlc_media_list_player_release',
+}
+
+class _Handle(object):
+    """(INTERNAL) Bare native handle, passed to the release function
+    by the finalizer, which must not refer to the wrapper.
+    """
+    __slots__ = ('_as_parameter_',)
+
+    def __init__(self, handle):
+        self._as_parameter_ = handle
+
+def _release_native(name, handle):
+    """(INTERNAL) Release a native object.
+    """
+    _Globals[name](_Handle(handle))
+
+def _owning_result(errcheck):
+    """(INTERNAL) Errcheck function. Makes the new wrapper release its native object.
+    """
+    def wrap_errcheck(result, func, arguments):
+        if errcheck is not None:
+            result = errcheck(result, func, arguments)
+        if isinstance(result, _Ctype) and type(result).__name__ in _release_functions:
+            f = weakref.finalize(result, _release_native,
+                                 _release_functions[type(result).__name__], result._as_parameter_)
+            # libvlc may already be shutting down at exit, the OS frees everything anyway
+            f.atexit = False
+            result._finalizer = f
+        return result
+    return wrap_errcheck
+
+def _release_method(name):
+    """(INTERNAL) release() method of a class whose native object is released by name.
+    """
+    def release(self):
+        """Decrement the reference count of the native object.
+        An owned reference is released once, further calls do nothing.
+        """
+        event_manager = getattr(type(self), 'event_manager', None)
+        if isinstance(event_manager, memoize_parameterless):
+            event_manager.forget(self)
+        f = self.__dict__.get('_finalizer')
+        if f is None:
+            return _Globals[name](self)
+        f()
+    return release
+
+def _enter(self):
+    return self
+
+def _exit(self, *exc_info):
+    self.release()
+
+for _name, _release in _release_functions.items():
+    _cls = _Globals[_name]
+    _cls.release = _release_method(_release)
+    # with blocks release the native object at their end
+    _cls.__enter__ = _enter
+    _cls.__exit__ = _exit
+del _name, _release, _cls
+
+# Fast path for the MediaPlayer calls made per video frame. The ctypes
+# functions are bound once when libvlc is loaded, with fixed argtypes and
+# restype, and take the raw c_void_p handle of the player. They skip the
+# binding lookup and the from_param conversions of the generic wrappers.
+_fast_path_table = (
+    # (method, libvlc function, restype, fixed arguments as (type, value))
+    ('fast_is_playing',   'libvlc_media_player_is_playing',   ctypes.c_int,      ()),
+    ('fast_play',         'libvlc_media_player_play',         ctypes.c_int,      ()),
+    ('fast_pause',        'libvlc_media_player_set_pause',    None,              ((ctypes.c_int, 1),)),
+    ('fast_get_time',     'libvlc_media_player_get_time',     ctypes.c_longlong, ()),
+    ('fast_get_position', 'libvlc_media_player_get_position', ctypes.c_float,    ()),
+    ('fast_get_state',    'libvlc_media_player_get_state',    ctypes.c_int,      ()),
+)
+_fast_path = {}
+
+def _bind_fast_path(dll):
+    """(INTERNAL) Bind the fast path functions found in the library.
+    """
+    for name, cname, restype, fixed in _fast_path_table:
+        if hasattr(dll, cname):
+            p = ctypes.CFUNCTYPE(restype, ctypes.c_void_p, *[t for t, _ in fixed])
+            _fast_path[name] = p((cname, dll))
+
+def _fast_path_method(name, cname, fixed):
+    """(INTERNAL) MediaPlayer method calling a fast path function.
+
+    The first call stores a partial with the player's handle in the
+    instance, later calls find it there and run without any Python frame.
+    """
+    args = tuple(v for _, v in fixed)
+    def method(self):
+        try:
+            f = _fast_path[name]
+        except KeyError:
+            raise NameError('no function %r' % (cname,))
+        f = self.__dict__[name] = functools.partial(f, self._as_parameter_, *args)
+        return f()
+    method.__name__ = name
+    method.__doc__ = 'Fast path of L{%s}().' % (cname,)
+    return method
+
+for _name, _cname, _restype, _fixed in _fast_path_table:
+    setattr(MediaPlayer, _name, _fast_path_method(_name, _cname, _fixed))
+del _name, _cname, _restype, _fixed
+MediaPlayer.fast_get_state.__doc__ += '''
+    The state is returned as int, which compares equal to the L{State} values.'''
+
 # libvlc_free is not present in some versions of libvlc. If it is not
 # in the library, then emulate it by calling libc.free
-if not hasattr(dll, 'libvlc_free'):
+def _emulate_libvlc_free(dll):
+    """(INTERNAL) Replace libvlc_free when the library is loaded.
+    """
+    if hasattr(dll, 'libvlc_free'):
+        return
     # need to find the free function in the C runtime. This is
     # platform specific.
     # For Linux and MacOSX
+    from ctypes.util import find_library
     libc_path = find_library('c')
     if libc_path:
         libc = ctypes.CDLL(libc_path)
@@ -8140,6 +8375,7 @@ if not hasattr(dll, 'libvlc_free'):
     # ensure argtypes is right, because default type of int won't
     # work on 64-bit systems
     libvlc_free.argtypes = [ ctypes.c_void_p ]
+    _Globals['libvlc_free'] = libvlc_free
 
 # Version functions
 def _dot2int(v):
@@ -0,0 +1,3639 @@
+# Compact libvlc binding generated by tools/generate_vlc_compact.py from vlc.py.
+# Do not edit, change vlc.py and run the generator again. The docstrings of the
+# wrapped functions and methods are in vlc_compact_docs.json, see docstring().
+#! /usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Python ctypes bindings for VLC
+#
+# Copyright (C) 2009-2012 the VideoLAN team
+# $Id: $
+#
+# Authors: Olivier Aubert <contact at olivieraubert.net>
+#          Jean Brouwers <MrJean1 at gmail.com>
+#          Geoff Salmon <geoff.salmon at gmail.com>
+#
+# This library is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as
+# published by the Free Software Foundation; either version 2.1 of the
+# License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston MA 02110-1301 USA
+
+"""This module provides bindings for the LibVLC public API, see
+U{http://wiki.videolan.org/LibVLC}.
+
+You can find the documentation and a README file with some examples
+at U{http://www.advene.org/download/python-ctypes/}.
+
+Basically, the most important class is L{Instance}, which is used
+to create a libvlc instance.  From this instance, you then create
+L{MediaPlayer} and L{MediaListPlayer} instances.
+
+Alternatively, you may create instances of the L{MediaPlayer} and
+L{MediaListPlayer} class directly and an instance of L{Instance}
+will be implicitly created.  The latter can be obtained using the
+C{get_instance} method of L{MediaPlayer} and L{MediaListPlayer}.
+"""
+
+import ctypes
+import os
+import sys
+import functools
+import logging
+import threading
+import weakref
+
+logger = logging.getLogger(__name__)
+
+__version__ = "N/A"
+build_date  = "Mon Mar 20 11:04:27 2017"
+
+# The libvlc doc states that filenames are expected to be in UTF8, do
+# not rely on sys.getfilesystemencoding() which will be confused,
+# esp. on windows.
+DEFAULT_ENCODING = 'utf-8'
+
+if sys.version_info[0] > 2:
+    str = str
+    unicode = str
+    bytes = bytes
+    basestring = (str, bytes)
+    PYTHON3 = True
+    def str_to_bytes(s):
+        """Translate string or bytes to bytes.
+        """
+        if isinstance(s, str):
+            return bytes(s, DEFAULT_ENCODING)
+        else:
+            return s
+
+    def bytes_to_str(b):
+        """Translate bytes to string.
+        """
+        if isinstance(b, bytes):
+            return b.decode(DEFAULT_ENCODING)
+        else:
+            return b
+else:
+    str = str
+    unicode = unicode
+    bytes = str
+    basestring = basestring
+    PYTHON3 = False
+    def str_to_bytes(s):
+        """Translate string or bytes to bytes.
+        """
+        if isinstance(s, unicode):
+            return s.encode(DEFAULT_ENCODING)
+        else:
+            return s
+
+    def bytes_to_str(b):
+        """Translate bytes to unicode string.
+        """
+        if isinstance(b, str):
+            return unicode(b, DEFAULT_ENCODING)
+        else:
+            return b
+
+# Internal guard to prevent internal classes to be directly
+# instanciated.
+_internal_guard = object()
+
+def find_lib():
+    # ctypes.util is slow to import, it is only needed to load the library
+    from ctypes.util import find_library
+    dll = None
+    plugin_path = None
+    if sys.platform.startswith('linux'):
+        p = find_library('vlc')
+        try:
+            dll = ctypes.CDLL(p)
+        except OSError:  # may fail
+            dll = ctypes.CDLL('libvlc.so.5')
+    elif sys.platform.startswith('win'):
+        libname = 'libvlc.dll'
+        p = find_library(libname)
+        if p is None:
+            try:  # some registry settings
+                # leaner than win32api, win32con
+                if PYTHON3:
+                    import winreg as w
+                else:
+                    import _winreg as w
+                for r in w.HKEY_LOCAL_MACHINE, w.HKEY_CURRENT_USER:
+                    try:
+                        r = w.OpenKey(r, 'Software\\VideoLAN\\VLC')
+                        plugin_path, _ = w.QueryValueEx(r, 'InstallDir')
+                        w.CloseKey(r)
+                        break
+                    except w.error:
+                        pass
+            except ImportError:  # no PyWin32
+                pass
+            if plugin_path is None:
+                # try some standard locations.
+                programfiles = os.environ["ProgramFiles"]
+                homedir = os.environ["HOMEDRIVE"]
+                for p in ('{programfiles}\\VideoLan{libname}', '{homedir}:\\VideoLan{libname}',
+                          '{programfiles}{libname}',           '{homedir}:{libname}'):
+                    p = p.format(homedir = homedir,
+                                 programfiles = programfiles,
+                                 libname = '\\VLC\\' + libname)
+                    if os.path.exists(p):
+                        plugin_path = os.path.dirname(p)
+                        break
+            if plugin_path is not None:  # try loading
+                p = os.getcwd()
+                os.chdir(plugin_path)
+                 # if chdir failed, this will raise an exception
+                dll = ctypes.CDLL(libname)
+                 # restore cwd after dll has been loaded
+                os.chdir(p)
+            else:  # may fail
+                dll = ctypes.CDLL(libname)
+        else:
+            plugin_path = os.path.dirname(p)
+            dll = ctypes.CDLL(p)
+
+    elif sys.platform.startswith('darwin'):
+        # FIXME: should find a means to configure path
+        d = '/Applications/VLC.app/Contents/MacOS/'
+        p = d + 'lib/libvlc.dylib'
+        if os.path.exists(p):
+            dll = ctypes.CDLL(p)
+            for p in ('modules', 'plugins'):
+                p = d + p
+                if os.path.isdir(p):
+                    plugin_path = p
+                    break
+        else:  # hope, some PATH is set...
+            dll = ctypes.CDLL('libvlc.dylib')
+
+    else:
+        raise NotImplementedError('%s: %s not supported' % (sys.argv[0], sys.platform))
+
+    return (dll, plugin_path)
+
+# The library is only loaded when the first binding is used (or dll/plugin_path
+# are read from the module), so importing this module stays cheap.
+_lib_lock = threading.Lock()
+
+def _load_lib():
+    """(INTERNAL) Load libvlc on first use and return the dll.
+
+    Sets the module globals dll and plugin_path (used on win32 and
+    MacOS in override.py) and the libvlc_free fallback.
+    """
+    try:
+        return _Globals['dll']
+    except KeyError:
+        pass
+    with _lib_lock:
+        if 'dll' not in _Globals:
+            lib, _Globals['plugin_path'] = find_lib()
+            _emulate_libvlc_free(lib)
+            _bind_fast_path(lib)
+            _Globals['dll'] = lib
+    return _Globals['dll']
+
+def __getattr__(name):
+    """(INTERNAL) Materialise the library dependent module attributes on demand.
+    """
+    if name in ('dll', 'plugin_path'):
+        _load_lib()
+        return _Globals[name]
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+class VLCException(Exception):
+    """Exception raised by libvlc methods.
+    """
+    pass
+
+try:
+    _Ints = (int, long)
+except NameError:  # no long in Python 3+
+    _Ints =  int
+_Seqs = (list, tuple)
+
+# Used for handling *event_manager() methods.
+class memoize_parameterless(object):
+    """Decorator. Caches a parameterless method's return value each time it is called.
+
+    If called later with the same arguments, the cached value is returned
+    (not reevaluated).
+    The value is stored in the object's __dict__, so it lives exactly as
+    long as its object, even if it refers back to it.
+    Adapted from https://wiki.python.org/moin/PythonDecoratorLibrary
+    """
+    def __init__(self, func):
+        self.func = func
+        self._key = '_memoized_' + func.__name__
+
+    def __call__(self, obj):
+        try:
+            return obj.__dict__[self._key]
+        except KeyError:
+            v = obj.__dict__[self._key] = self.func(obj)
+            return v
+
+    def forget(self, obj):
+        """Drop the cached value of obj, e.g. when its native object is released.
+        """
+        obj.__dict__.pop(self._key, None)
+
+    def __repr__(self):
+        """Return the function's docstring.
+        """
+        return self.func.__doc__
+
+    def __get__(self, obj, objtype):
+      """Support instance methods.
+      """
+      if obj is None:  # accessed on the class, e.g. to forget an object
+          return self
+      return functools.partial(self.__call__, obj)
+
+# Default instance. It is used to instanciate classes directly in the
+# OO-wrapper.
+_default_instance = None
+
+def get_default_instance():
+    """Return the default VLC.Instance.
+    """
+    global _default_instance
+    if _default_instance is None:
+        _default_instance = Instance()
+    return _default_instance
+
+_Cfunctions = {}  # from LibVLC __version__
+_Globals = globals()  # sys.modules[__name__].__dict__
+
+def _Cfunction(name, flags, errcheck, *types):
+    """(INTERNAL) New ctypes function binding.
+    """
+    dll = _load_lib()
+    if hasattr(dll, name) and name in _Globals:
+        p = ctypes.CFUNCTYPE(*types)
+        f = p((name, dll), flags)
+        if name in _owning_functions:
+            # the new wrapper owns a reference of the native object
+            errcheck = _owning_result(errcheck)
+        if errcheck is not None:
+            f.errcheck = errcheck
+        # replace the Python function
+        # in this module, but only when
+        # running as python -O or -OO
+        if __debug__:
+            _Cfunctions[name] = f
+        else:
+            _Globals[name] = f
+        return f
+    raise NameError('no function %r' % (name,))
+
+def _Cobject(cls, ctype):
+    """(INTERNAL) New instance from ctypes.
+    """
+    o = object.__new__(cls)
+    o._as_parameter_ = ctype
+    return o
+
+def _Constructor(cls, ptr=_internal_guard):
+    """(INTERNAL) New wrapper from ctypes.
+    """
+    if ptr == _internal_guard:
+        raise VLCException("(INTERNAL) ctypes class. You should get references for this class through methods of the LibVLC API.")
+    if ptr is None or ptr == 0:
+        return None
+    return _Cobject(cls, ctypes.c_void_p(ptr))
+
+class _Cstruct(ctypes.Structure):
+    """(INTERNAL) Base class for ctypes structures.
+    """
+    _fields_ = []  # list of 2-tuples ('name', ctyptes.<type>)
+
+    def __str__(self):
+        l = [' %s:\t%s' % (n, getattr(self, n)) for n, _ in self._fields_]
+        return '\n'.join([self.__class__.__name__] + l)
+
+    def __repr__(self):
+        return '%s.%s' % (self.__class__.__module__, self)
+
+class _Ctype(object):
+    """(INTERNAL) Base class for ctypes.
+    """
+    @staticmethod
+    def from_param(this):  # not self
+        """(INTERNAL) ctypes parameter conversion method.
+        """
+        if this is None:
+            return None
+        return this._as_parameter_
+
+class ListPOINTER(object):
+    """Just like a POINTER but accept a list of ctype as an argument.
+    """
+    def __init__(self, etype):
+        self.etype = etype
+
+    def from_param(self, param):
+        if isinstance(param, _Seqs):
+            return (self.etype * len(param))(*param)
+        else:
+            return ctypes.POINTER(param)
+
+# errcheck functions for some native functions.
+def string_result(result, func, arguments):
+    """Errcheck function. Returns a string and frees the original pointer.
+
+    It assumes the result is a char *.
+    """
+    if result:
+        # make a python string copy
+        s = bytes_to_str(ctypes.string_at(result))
+        # free original string ptr
+        libvlc_free(result)
+        return s
+    return None
+
+def class_result(classname):
+    """Errcheck function. Returns a function that creates the specified class.
+    """
+    def wrap_errcheck(result, func, arguments):
+        if result is None:
+            return None
+        return classname(result)
+    return wrap_errcheck
+
+# Wrapper for the opaque struct libvlc_log_t
+class Log(ctypes.Structure):
+    pass
+Log_ptr = ctypes.POINTER(Log)
+
+# FILE* ctypes wrapper, copied from
+# http://svn.python.org/projects/ctypes/trunk/ctypeslib/ctypeslib/contrib/pythonhdr.py
+class FILE(ctypes.Structure):
+    pass
+FILE_ptr = ctypes.POINTER(FILE)
+
+if PYTHON3:
+    PyFile_FromFd = ctypes.pythonapi.PyFile_FromFd
+    PyFile_FromFd.restype = ctypes.py_object
+    PyFile_FromFd.argtypes = [ctypes.c_int,
+                              ctypes.c_char_p,
+                              ctypes.c_char_p,
+                              ctypes.c_int,
+                              ctypes.c_char_p,
+                              ctypes.c_char_p,
+                              ctypes.c_char_p,
+                              ctypes.c_int ]
+
+    PyFile_AsFd = ctypes.pythonapi.PyObject_AsFileDescriptor
+    PyFile_AsFd.restype = ctypes.c_int
+    PyFile_AsFd.argtypes = [ctypes.py_object]
+else:
+    PyFile_FromFile = ctypes.pythonapi.PyFile_FromFile
+    PyFile_FromFile.restype = ctypes.py_object
+    PyFile_FromFile.argtypes = [FILE_ptr,
+                                ctypes.c_char_p,
+                                ctypes.c_char_p,
+                                ctypes.CFUNCTYPE(ctypes.c_int, FILE_ptr)]
+
+    PyFile_AsFile = ctypes.pythonapi.PyFile_AsFile
+    PyFile_AsFile.restype = FILE_ptr
+    PyFile_AsFile.argtypes = [ctypes.py_object]
+
+ # Generated enum types #
+
+class _Enum(ctypes.c_uint):
+    '''(INTERNAL) Base class
+    '''
+    _enum_names_ = {}
+
+    def __str__(self):
+        n = self._enum_names_.get(self.value, '') or ('FIXME_(%r)' % (self.value,))
+        return '.'.join((self.__class__.__name__, n))
+
+    def __hash__(self):
+        return self.value
+
+    def __repr__(self):
+        return '.'.join((self.__class__.__module__, self.__str__()))
+
+    def __eq__(self, other):
+        return ( (isinstance(other, _Enum) and self.value == other.value)
+              or (isinstance(other, _Ints) and self.value == other) )
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+class LogLevel(_Enum):
+    '''Logging messages level.
+\note future libvlc versions may define new levels.
+    '''
+    _enum_names_ = {
+        0: 'DEBUG',
+        2: 'NOTICE',
+        3: 'WARNING',
+        4: 'ERROR',
+    }
+LogLevel.DEBUG   = LogLevel(0)
+LogLevel.ERROR   = LogLevel(4)
+LogLevel.NOTICE  = LogLevel(2)
+LogLevel.WARNING = LogLevel(3)
+
+class MediaDiscovererCategory(_Enum):
+    '''Category of a media discoverer
+See libvlc_media_discoverer_list_get().
+    '''
+    _enum_names_ = {
+        0: 'devices',
+        1: 'lan',
+        2: 'podcasts',
+        3: 'localdirs',
+    }
+MediaDiscovererCategory.devices   = MediaDiscovererCategory(0)
+MediaDiscovererCategory.lan       = MediaDiscovererCategory(1)
+MediaDiscovererCategory.localdirs = MediaDiscovererCategory(3)
+MediaDiscovererCategory.podcasts  = MediaDiscovererCategory(2)
+
+class DialogQuestionType(_Enum):
+    '''@defgroup libvlc_dialog libvlc dialog
+@ingroup libvlc
+@{
+@file
+libvlc dialog external api.
+    '''
+    _enum_names_ = {
+        0: 'NORMAL',
+        1: 'WARNING',
+        2: 'CRITICAL',
+    }
+DialogQuestionType.CRITICAL = DialogQuestionType(2)
+DialogQuestionType.NORMAL   = DialogQuestionType(0)
+DialogQuestionType.WARNING  = DialogQuestionType(1)
+
+class EventType(_Enum):
+    '''Event types.
+    '''
+    _enum_names_ = {
+        0: 'MediaMetaChanged',
+        1: 'MediaSubItemAdded',
+        2: 'MediaDurationChanged',
+        3: 'MediaParsedChanged',
+        4: 'MediaFreed',
+        5: 'MediaStateChanged',
+        6: 'MediaSubItemTreeAdded',
+        0x100: 'MediaPlayerMediaChanged',
+        257: 'MediaPlayerNothingSpecial',
+        258: 'MediaPlayerOpening',
+        259: 'MediaPlayerBuffering',
+        260: 'MediaPlayerPlaying',
+        261: 'MediaPlayerPaused',
+        262: 'MediaPlayerStopped',
+        263: 'MediaPlayerForward',
+        264: 'MediaPlayerBackward',
+        265: 'MediaPlayerEndReached',
+        266: 'MediaPlayerEncounteredError',
+        267: 'MediaPlayerTimeChanged',
+        268: 'MediaPlayerPositionChanged',
+        269: 'MediaPlayerSeekableChanged',
+        270: 'MediaPlayerPausableChanged',
+        271: 'MediaPlayerTitleChanged',
+        272: 'MediaPlayerSnapshotTaken',
+        273: 'MediaPlayerLengthChanged',
+        274: 'MediaPlayerVout',
+        275: 'MediaPlayerScrambledChanged',
+        276: 'MediaPlayerESAdded',
+        277: 'MediaPlayerESDeleted',
+        278: 'MediaPlayerESSelected',
+        279: 'MediaPlayerCorked',
+        280: 'MediaPlayerUncorked',
+        281: 'MediaPlayerMuted',
+        282: 'MediaPlayerUnmuted',
+        283: 'MediaPlayerAudioVolume',
+        284: 'MediaPlayerAudioDevice',
+        285: 'MediaPlayerChapterChanged',
+        0x200: 'MediaListItemAdded',
+        513: 'MediaListWillAddItem',
+        514: 'MediaListItemDeleted',
+        515: 'MediaListWillDeleteItem',
+        516: 'MediaListEndReached',
+        0x300: 'MediaListViewItemAdded',
+        769: 'MediaListViewWillAddItem',
+        770: 'MediaListViewItemDeleted',
+        771: 'MediaListViewWillDeleteItem',
+        0x400: 'MediaListPlayerPlayed',
+        1025: 'MediaListPlayerNextItemSet',
+        1026: 'MediaListPlayerStopped',
+        0x500: 'MediaDiscovererStarted',
+        1281: 'MediaDiscovererEnded',
+        1282: 'RendererDiscovererItemAdded',
+        1283: 'RendererDiscovererItemDeleted',
+        0x600: 'VlmMediaAdded',
+        1537: 'VlmMediaRemoved',
+        1538: 'VlmMediaChanged',
+        1539: 'VlmMediaInstanceStarted',
+        1540: 'VlmMediaInstanceStopped',
+        1541: 'VlmMediaInstanceStatusInit',
+        1542: 'VlmMediaInstanceStatusOpening',
+        1543: 'VlmMediaInstanceStatusPlaying',
+        1544: 'VlmMediaInstanceStatusPause',
+        1545: 'VlmMediaInstanceStatusEnd',
+        1546: 'VlmMediaInstanceStatusError',
+    }
+EventType.MediaDiscovererEnded          = EventType(1281)
+EventType.MediaDiscovererStarted        = EventType(0x500)
+EventType.MediaDurationChanged          = EventType(2)
+EventType.MediaFreed                    = EventType(4)
+EventType.MediaListEndReached           = EventType(516)
+EventType.MediaListItemAdded            = EventType(0x200)
+EventType.MediaListItemDeleted          = EventType(514)
+EventType.MediaListPlayerNextItemSet    = EventType(1025)
+EventType.MediaListPlayerPlayed         = EventType(0x400)
+EventType.MediaListPlayerStopped        = EventType(1026)
+EventType.MediaListViewItemAdded        = EventType(0x300)
+EventType.MediaListViewItemDeleted      = EventType(770)
+EventType.MediaListViewWillAddItem      = EventType(769)
+EventType.MediaListViewWillDeleteItem   = EventType(771)
+EventType.MediaListWillAddItem          = EventType(513)
+EventType.MediaListWillDeleteItem       = EventType(515)
+EventType.MediaMetaChanged              = EventType(0)
+EventType.MediaParsedChanged            = EventType(3)
+EventType.MediaPlayerAudioDevice        = EventType(284)
+EventType.MediaPlayerAudioVolume        = EventType(283)
+EventType.MediaPlayerBackward           = EventType(264)
+EventType.MediaPlayerBuffering          = EventType(259)
+EventType.MediaPlayerChapterChanged     = EventType(285)
+EventType.MediaPlayerCorked             = EventType(279)
+EventType.MediaPlayerESAdded            = EventType(276)
+EventType.MediaPlayerESDeleted          = EventType(277)
+EventType.MediaPlayerESSelected         = EventType(278)
+EventType.MediaPlayerEncounteredError   = EventType(266)
+EventType.MediaPlayerEndReached         = EventType(265)
+EventType.MediaPlayerForward            = EventType(263)
+EventType.MediaPlayerLengthChanged      = EventType(273)
+EventType.MediaPlayerMediaChanged       = EventType(0x100)
+EventType.MediaPlayerMuted              = EventType(281)
+EventType.MediaPlayerNothingSpecial     = EventType(257)
+EventType.MediaPlayerOpening            = EventType(258)
+EventType.MediaPlayerPausableChanged    = EventType(270)
+EventType.MediaPlayerPaused             = EventType(261)
+EventType.MediaPlayerPlaying            = EventType(260)
+EventType.MediaPlayerPositionChanged    = EventType(268)
+EventType.MediaPlayerScrambledChanged   = EventType(275)
+EventType.MediaPlayerSeekableChanged    = EventType(269)
+EventType.MediaPlayerSnapshotTaken      = EventType(272)
+EventType.MediaPlayerStopped            = EventType(262)
+EventType.MediaPlayerTimeChanged        = EventType(267)
+EventType.MediaPlayerTitleChanged       = EventType(271)
+EventType.MediaPlayerUncorked           = EventType(280)
+EventType.MediaPlayerUnmuted            = EventType(282)
+EventType.MediaPlayerVout               = EventType(274)
+EventType.MediaStateChanged             = EventType(5)
+EventType.MediaSubItemAdded             = EventType(1)
+EventType.MediaSubItemTreeAdded         = EventType(6)
+EventType.RendererDiscovererItemAdded   = EventType(1282)
+EventType.RendererDiscovererItemDeleted = EventType(1283)
+EventType.VlmMediaAdded                 = EventType(0x600)
+EventType.VlmMediaChanged               = EventType(1538)
+EventType.VlmMediaInstanceStarted       = EventType(1539)
+EventType.VlmMediaInstanceStatusEnd     = EventType(1545)
+EventType.VlmMediaInstanceStatusError   = EventType(1546)
+EventType.VlmMediaInstanceStatusInit    = EventType(1541)
+EventType.VlmMediaInstanceStatusOpening = EventType(1542)
+EventType.VlmMediaInstanceStatusPause   = EventType(1544)
+EventType.VlmMediaInstanceStatusPlaying = EventType(1543)
+EventType.VlmMediaInstanceStopped       = EventType(1540)
+EventType.VlmMediaRemoved               = EventType(1537)
+
+class Meta(_Enum):
+    '''Meta data types.
+    '''
+    _enum_names_ = {
+        0: 'Title',
+        1: 'Artist',
+        2: 'Genre',
+        3: 'Copyright',
+        4: 'Album',
+        5: 'TrackNumber',
+        6: 'Description',
+        7: 'Rating',
+        8: 'Date',
+        9: 'Setting',
+        10: 'URL',
+        11: 'Language',
+        12: 'NowPlaying',
+        13: 'Publisher',
+        14: 'EncodedBy',
+        15: 'ArtworkURL',
+        16: 'TrackID',
+        17: 'TrackTotal',
+        18: 'Director',
+        19: 'Season',
+        20: 'Episode',
+        21: 'ShowName',
+        22: 'Actors',
+        23: 'AlbumArtist',
+        24: 'DiscNumber',
+        25: 'DiscTotal',
+    }
+Meta.Actors      = Meta(22)
+Meta.Album       = Meta(4)
+Meta.AlbumArtist = Meta(23)
+Meta.Artist      = Meta(1)
+Meta.ArtworkURL  = Meta(15)
+Meta.Copyright   = Meta(3)
+Meta.Date        = Meta(8)
+Meta.Description = Meta(6)
+Meta.Director    = Meta(18)
+Meta.DiscNumber  = Meta(24)
+Meta.DiscTotal   = Meta(25)
+Meta.EncodedBy   = Meta(14)
+Meta.Episode     = Meta(20)
+Meta.Genre       = Meta(2)
+Meta.Language    = Meta(11)
+Meta.NowPlaying  = Meta(12)
+Meta.Publisher   = Meta(13)
+Meta.Rating      = Meta(7)
+Meta.Season      = Meta(19)
+Meta.Setting     = Meta(9)
+Meta.ShowName    = Meta(21)
+Meta.Title       = Meta(0)
+Meta.TrackID     = Meta(16)
+Meta.TrackNumber = Meta(5)
+Meta.TrackTotal  = Meta(17)
+Meta.URL         = Meta(10)
+
+class State(_Enum):
+    '''Note the order of libvlc_state_t enum must match exactly the order of
+See mediacontrol_playerstatus, See input_state_e enums,
+and videolan.libvlc.state (at bindings/cil/src/media.cs).
+expected states by web plugins are:
+idle/close=0, opening=1, playing=3, paused=4,
+stopping=5, ended=6, error=7.
+    '''
+    _enum_names_ = {
+        0: 'NothingSpecial',
+        1: 'Opening',
+        2: 'Buffering',
+        3: 'Playing',
+        4: 'Paused',
+        5: 'Stopped',
+        6: 'Ended',
+        7: 'Error',
+    }
+State.Buffering      = State(2)
+State.Ended          = State(6)
+State.Error          = State(7)
+State.NothingSpecial = State(0)
+State.Opening        = State(1)
+State.Paused         = State(4)
+State.Playing        = State(3)
+State.Stopped        = State(5)
+
+class TrackType(_Enum):
+    '''N/A
+    '''
+    _enum_names_ = {
+        -1: 'unknown',
+        0: 'audio',
+        1: 'video',
+        2: 'text',
+    }
+TrackType.audio   = TrackType(0)
+TrackType.text    = TrackType(2)
+TrackType.unknown = TrackType(-1)
+TrackType.video   = TrackType(1)
+
+class VideoOrient(_Enum):
+    '''N/A
+    '''
+    _enum_names_ = {
+        0: 'left',
+        1: 'right',
+        2: 'left',
+        3: 'right',
+        4: 'top',
+        5: 'bottom',
+        6: 'top',
+        7: 'bottom',
+    }
+VideoOrient.bottom = VideoOrient(5)
+VideoOrient.bottom = VideoOrient(7)
+VideoOrient.left   = VideoOrient(0)
+VideoOrient.left   = VideoOrient(2)
+VideoOrient.right  = VideoOrient(1)
+VideoOrient.right  = VideoOrient(3)
+VideoOrient.top    = VideoOrient(4)
+VideoOrient.top    = VideoOrient(6)
+
+class VideoProjection(_Enum):
+    '''N/A
+    '''
+    _enum_names_ = {
+        0: 'rectangular',
+        1: 'equirectangular',
+        0x100: 'standard',
+    }
+VideoProjection.equirectangular = VideoProjection(1)
+VideoProjection.rectangular     = VideoProjection(0)
+VideoProjection.standard        = VideoProjection(0x100)
+
+class MediaType(_Enum):
+    '''Media type
+See libvlc_media_get_type.
+    '''
+    _enum_names_ = {
+        0: 'unknown',
+        1: 'file',
+        2: 'directory',
+        3: 'disc',
+        4: 'stream',
+        5: 'playlist',
+    }
+MediaType.directory = MediaType(2)
+MediaType.disc      = MediaType(3)
+MediaType.file      = MediaType(1)
+MediaType.playlist  = MediaType(5)
+MediaType.stream    = MediaType(4)
+MediaType.unknown   = MediaType(0)
+
+class MediaParseFlag(_Enum):
+    '''Parse flags used by libvlc_media_parse_with_options()
+See libvlc_media_parse_with_options.
+    '''
+    _enum_names_ = {
+        0x0: 'local',
+        0x1: 'network',
+        0x2: 'local',
+        0x4: 'network',
+        0x8: 'interact',
+    }
+MediaParseFlag.interact = MediaParseFlag(0x8)
+MediaParseFlag.local    = MediaParseFlag(0x0)
+MediaParseFlag.local    = MediaParseFlag(0x2)
+MediaParseFlag.network  = MediaParseFlag(0x1)
+MediaParseFlag.network  = MediaParseFlag(0x4)
+
+class MediaParsedStatus(_Enum):
+    '''Parse status used sent by libvlc_media_parse_with_options() or returned by
+libvlc_media_get_parsed_status()
+See libvlc_media_parse_with_options
+See libvlc_media_get_parsed_status.
+    '''
+    _enum_names_ = {
+        1: 'skipped',
+        2: 'failed',
+        3: 'timeout',
+        4: 'done',
+    }
+MediaParsedStatus.done    = MediaParsedStatus(4)
+MediaParsedStatus.failed  = MediaParsedStatus(2)
+MediaParsedStatus.skipped = MediaParsedStatus(1)
+MediaParsedStatus.timeout = MediaParsedStatus(3)
+
+class MediaSlaveType(_Enum):
+    '''Type of a media slave: subtitle or audio.
+    '''
+    _enum_names_ = {
+        0: 'subtitle',
+        1: 'audio',
+    }
+MediaSlaveType.audio    = MediaSlaveType(1)
+MediaSlaveType.subtitle = MediaSlaveType(0)
+
+class VideoMarqueeOption(_Enum):
+    '''Marq options definition.
+    '''
+    _enum_names_ = {
+        0: 'Enable',
+        1: 'Text',
+        2: 'Color',
+        3: 'Opacity',
+        4: 'Position',
+        5: 'Refresh',
+        6: 'Size',
+        7: 'Timeout',
+        8: 'marquee_X',
+        9: 'marquee_Y',
+    }
+VideoMarqueeOption.Color     = VideoMarqueeOption(2)
+VideoMarqueeOption.Enable    = VideoMarqueeOption(0)
+VideoMarqueeOption.Opacity   = VideoMarqueeOption(3)
+VideoMarqueeOption.Position  = VideoMarqueeOption(4)
+VideoMarqueeOption.Refresh   = VideoMarqueeOption(5)
+VideoMarqueeOption.Size      = VideoMarqueeOption(6)
+VideoMarqueeOption.Text      = VideoMarqueeOption(1)
+VideoMarqueeOption.Timeout   = VideoMarqueeOption(7)
+VideoMarqueeOption.marquee_X = VideoMarqueeOption(8)
+VideoMarqueeOption.marquee_Y = VideoMarqueeOption(9)
+
+class NavigateMode(_Enum):
+    '''Navigation mode.
+    '''
+    _enum_names_ = {
+        0: 'activate',
+        1: 'up',
+        2: 'down',
+        3: 'left',
+        4: 'right',
+        5: 'popup',
+    }
+NavigateMode.activate = NavigateMode(0)
+NavigateMode.down     = NavigateMode(2)
+NavigateMode.left     = NavigateMode(3)
+NavigateMode.popup    = NavigateMode(5)
+NavigateMode.right    = NavigateMode(4)
+NavigateMode.up       = NavigateMode(1)
+
+class Position(_Enum):
+    '''Enumeration of values used to set position (e.g. of video title).
+    '''
+    _enum_names_ = {
+        -1: 'disable',
+        0: 'center',
+        1: 'left',
+        2: 'right',
+        3: 'top',
+        4: 'left',
+        5: 'right',
+        6: 'bottom',
+        7: 'left',
+        8: 'right',
+    }
+Position.bottom  = Position(6)
+Position.center  = Position(0)
+Position.disable = Position(-1)
+Position.left    = Position(1)
+Position.left    = Position(4)
+Position.left    = Position(7)
+Position.right   = Position(2)
+Position.right   = Position(5)
+Position.right   = Position(8)
+Position.top     = Position(3)
+
+class VideoLogoOption(_Enum):
+    '''Option values for libvlc_video_{get,set}_logo_{int,string}.
+    '''
+    _enum_names_ = {
+        0: 'enable',
+        1: 'file',
+        2: 'logo_x',
+        3: 'logo_y',
+        4: 'delay',
+        5: 'repeat',
+        6: 'opacity',
+        7: 'position',
+    }
+VideoLogoOption.delay    = VideoLogoOption(4)
+VideoLogoOption.enable   = VideoLogoOption(0)
+VideoLogoOption.file     = VideoLogoOption(1)
+VideoLogoOption.logo_x   = VideoLogoOption(2)
+VideoLogoOption.logo_y   = VideoLogoOption(3)
+VideoLogoOption.opacity  = VideoLogoOption(6)
+VideoLogoOption.position = VideoLogoOption(7)
+VideoLogoOption.repeat   = VideoLogoOption(5)
+
+class VideoAdjustOption(_Enum):
+    '''Option values for libvlc_video_{get,set}_adjust_{int,float,bool}.
+    '''
+    _enum_names_ = {
+        0: 'Enable',
+        1: 'Contrast',
+        2: 'Brightness',
+        3: 'Hue',
+        4: 'Saturation',
+        5: 'Gamma',
+    }
+VideoAdjustOption.Brightness = VideoAdjustOption(2)
+VideoAdjustOption.Contrast   = VideoAdjustOption(1)
+VideoAdjustOption.Enable     = VideoAdjustOption(0)
+VideoAdjustOption.Gamma      = VideoAdjustOption(5)
+VideoAdjustOption.Hue        = VideoAdjustOption(3)
+VideoAdjustOption.Saturation = VideoAdjustOption(4)
+
+class AudioOutputDeviceTypes(_Enum):
+    '''Audio device types.
+    '''
+    _enum_names_ = {
+        -1: 'Error',
+        1: 'Mono',
+        2: 'Stereo',
+        4: '_2F2R',
+        5: '_3F2R',
+        6: '_5_1',
+        7: '_6_1',
+        8: '_7_1',
+        10: 'SPDIF',
+    }
+AudioOutputDeviceTypes.Error  = AudioOutputDeviceTypes(-1)
+AudioOutputDeviceTypes.Mono   = AudioOutputDeviceTypes(1)
+AudioOutputDeviceTypes.SPDIF  = AudioOutputDeviceTypes(10)
+AudioOutputDeviceTypes.Stereo = AudioOutputDeviceTypes(2)
+AudioOutputDeviceTypes._2F2R  = AudioOutputDeviceTypes(4)
+AudioOutputDeviceTypes._3F2R  = AudioOutputDeviceTypes(5)
+AudioOutputDeviceTypes._5_1   = AudioOutputDeviceTypes(6)
+AudioOutputDeviceTypes._6_1   = AudioOutputDeviceTypes(7)
+AudioOutputDeviceTypes._7_1   = AudioOutputDeviceTypes(8)
+
+class AudioOutputChannel(_Enum):
+    '''Audio channels.
+    '''
+    _enum_names_ = {
+        -1: 'Error',
+        1: 'Stereo',
+        2: 'RStereo',
+        3: 'Left',
+        4: 'Right',
+        5: 'Dolbys',
+    }
+AudioOutputChannel.Dolbys  = AudioOutputChannel(5)
+AudioOutputChannel.Error   = AudioOutputChannel(-1)
+AudioOutputChannel.Left    = AudioOutputChannel(3)
+AudioOutputChannel.RStereo = AudioOutputChannel(2)
+AudioOutputChannel.Right   = AudioOutputChannel(4)
+AudioOutputChannel.Stereo  = AudioOutputChannel(1)
+
+class MediaPlayerRole(_Enum):
+    '''Media player roles.
+\version libvlc 3.0.0 and later.
+see \ref libvlc_media_player_set_role().
+    '''
+    _enum_names_ = {
+        0: '_None',
+        1: 'Music',
+        2: 'Video',
+        3: 'Communication',
+        4: 'Game',
+        5: 'Notification',
+        6: 'Animation',
+        7: 'Production',
+        8: 'Accessibility',
+        9: 'Test',
+    }
+MediaPlayerRole.Accessibility = MediaPlayerRole(8)
+MediaPlayerRole.Animation     = MediaPlayerRole(6)
+MediaPlayerRole.Communication = MediaPlayerRole(3)
+MediaPlayerRole.Game          = MediaPlayerRole(4)
+MediaPlayerRole.Music         = MediaPlayerRole(1)
+MediaPlayerRole.Notification  = MediaPlayerRole(5)
+MediaPlayerRole.Production    = MediaPlayerRole(7)
+MediaPlayerRole.Test          = MediaPlayerRole(9)
+MediaPlayerRole.Video         = MediaPlayerRole(2)
+MediaPlayerRole._None         = MediaPlayerRole(0)
+
+class PlaybackMode(_Enum):
+    '''Defines playback modes for playlist.
+    '''
+    _enum_names_ = {
+        0: 'default',
+        1: 'loop',
+        2: 'repeat',
+    }
+PlaybackMode.default = PlaybackMode(0)
+PlaybackMode.loop    = PlaybackMode(1)
+PlaybackMode.repeat  = PlaybackMode(2)
+
+class Callback(ctypes.c_void_p):
+    """Callback function notification.
+    @param p_event: the event triggering the callback.
+    """
+    pass
+class LogCb(ctypes.c_void_p):
+    """Callback prototype for LibVLC log message handler.
+    @param data: data pointer as given to L{libvlc_log_set}().
+    @param level: message level (@ref libvlc_log_level).
+    @param ctx: message context (meta-information about the message).
+    @param fmt: printf() format string (as defined by ISO C11).
+    @param args: variable argument list for the format @note Log message handlers B{must} be thread-safe. @warning The message context pointer, the format string parameters and the variable arguments are only valid until the callback returns.
+    """
+    pass
+class MediaOpenCb(ctypes.c_void_p):
+    """Callback prototype to open a custom bitstream input media.
+    The same media item can be opened multiple times. Each time, this callback
+    is invoked. It should allocate and initialize any instance-specific
+    resources, then store them in *datap. The instance resources can be freed
+    in the @ref libvlc_media_close_cb callback.
+    @param opaque: private pointer as passed to L{libvlc_media_new_callbacks}().
+    @return: datap storage space for a private data pointer, sizep byte length of the bitstream or UINT64_MAX if unknown.
+    """
+    pass
+class MediaReadCb(ctypes.c_void_p):
+    """Callback prototype to read data from a custom bitstream input media.
+    @param opaque: private pointer as set by the @ref libvlc_media_open_cb callback.
+    @param buf: start address of the buffer to read data into.
+    @param len: bytes length of the buffer.
+    @return: strictly positive number of bytes read, 0 on end-of-stream, or -1 on non-recoverable error @note If no data is immediately available, then the callback should sleep. @warning The application is responsible for avoiding deadlock situations. In particular, the callback should return an error if playback is stopped; if it does not return, then L{libvlc_media_player_stop}() will never return.
+    """
+    pass
+class MediaSeekCb(ctypes.c_void_p):
+    """Callback prototype to seek a custom bitstream input media.
+    @param opaque: private pointer as set by the @ref libvlc_media_open_cb callback.
+    @param offset: absolute byte offset to seek to.
+    @return: 0 on success, -1 on error.
+    """
+    pass
+class MediaCloseCb(ctypes.c_void_p):
+    """Callback prototype to close a custom bitstream input media.
+    @param opaque: private pointer as set by the @ref libvlc_media_open_cb callback.
+    """
+    pass
+class VideoLockCb(ctypes.c_void_p):
+    """Callback prototype to allocate and lock a picture buffer.
+    Whenever a new video frame needs to be decoded, the lock callback is
+    invoked. Depending on the video chroma, one or three pixel planes of
+    adequate dimensions must be returned via the second parameter. Those
+    planes must be aligned on 32-bytes boundaries.
+    @param opaque: private pointer as passed to L{libvlc_video_set_callbacks}() [IN].
+    @param planes: start address of the pixel planes (LibVLC allocates the array of void pointers, this callback must initialize the array) [OUT].
+    @return: a private pointer for the display and unlock callbacks to identify the picture buffers.
+    """
+    pass
+class VideoUnlockCb(ctypes.c_void_p):
+    """Callback prototype to unlock a picture buffer.
+    When the video frame decoding is complete, the unlock callback is invoked.
+    This callback might not be needed at all. It is only an indication that the
+    application can now read the pixel values if it needs to.
+    @note: A picture buffer is unlocked after the picture is decoded,
+    but before the picture is displayed.
+    @param opaque: private pointer as passed to L{libvlc_video_set_callbacks}() [IN].
+    @param picture: private pointer returned from the @ref libvlc_video_lock_cb callback [IN].
+    @param planes: pixel planes as defined by the @ref libvlc_video_lock_cb callback (this parameter is only for convenience) [IN].
+    """
+    pass
+class VideoDisplayCb(ctypes.c_void_p):
+    """Callback prototype to display a picture.
+    When the video frame needs to be shown, as determined by the media playback
+    clock, the display callback is invoked.
+    @param opaque: private pointer as passed to L{libvlc_video_set_callbacks}() [IN].
+    @param picture: private pointer returned from the @ref libvlc_video_lock_cb callback [IN].
+    """
+    pass
+class VideoFormatCb(ctypes.c_void_p):
+    """Callback prototype to configure picture buffers format.
+    This callback gets the format of the video as output by the video decoder
+    and the chain of video filters (if any). It can opt to change any parameter
+    as it needs. In that case, LibVLC will attempt to convert the video format
+    (rescaling and chroma conversion) but these operations can be CPU intensive.
+    @param opaque: pointer to the private pointer passed to L{libvlc_video_set_callbacks}() [IN/OUT].
+    @param chroma: pointer to the 4 bytes video format identifier [IN/OUT].
+    @param width: pointer to the pixel width [IN/OUT].
+    @param height: pointer to the pixel height [IN/OUT].
+    @param pitches: table of scanline pitches in bytes for each pixel plane (the table is allocated by LibVLC) [OUT].
+    @return: lines table of scanlines count for each plane.
+    """
+    pass
+class VideoCleanupCb(ctypes.c_void_p):
+    """Callback prototype to configure picture buffers format.
+    @param opaque: private pointer as passed to L{libvlc_video_set_callbacks}() (and possibly modified by @ref libvlc_video_format_cb) [IN].
+    """
+    pass
+class AudioPlayCb(ctypes.c_void_p):
+    """Callback prototype for audio playback.
+    The LibVLC media player decodes and post-processes the audio signal
+    asynchronously (in an internal thread). Whenever audio samples are ready
+    to be queued to the output, this callback is invoked.
+    The number of samples provided per invocation may depend on the file format,
+    the audio coding algorithm, the decoder plug-in, the post-processing
+    filters and timing. Application must not assume a certain number of samples.
+    The exact format of audio samples is determined by L{libvlc_audio_set_format}()
+    or L{libvlc_audio_set_format_callbacks}() as is the channels layout.
+    Note that the number of samples is per channel. For instance, if the audio
+    track sampling rate is 48000 Hz, then 1200 samples represent 25 milliseconds
+    of audio signal - regardless of the number of audio channels.
+    @param data: data pointer as passed to L{libvlc_audio_set_callbacks}() [IN].
+    @param samples: pointer to a table of audio samples to play back [IN].
+    @param count: number of audio samples to play back.
+    @param pts: expected play time stamp (see libvlc_delay()).
+    """
+    pass
+class AudioPauseCb(ctypes.c_void_p):
+    """Callback prototype for audio pause.
+    LibVLC invokes this callback to pause audio playback.
+    @note: The pause callback is never called if the audio is already paused.
+    @param data: data pointer as passed to L{libvlc_audio_set_callbacks}() [IN].
+    @param pts: time stamp of the pause request (should be elapsed already).
+    """
+    pass
+class AudioResumeCb(ctypes.c_void_p):
+    """Callback prototype for audio resumption.
+    LibVLC invokes this callback to resume audio playback after it was
+    previously paused.
+    @note: The resume callback is never called if the audio is not paused.
+    @param data: data pointer as passed to L{libvlc_audio_set_callbacks}() [IN].
+    @param pts: time stamp of the resumption request (should be elapsed already).
+    """
+    pass
+class AudioFlushCb(ctypes.c_void_p):
+    """Callback prototype for audio buffer flush.
+    LibVLC invokes this callback if it needs to discard all pending buffers and
+    stop playback as soon as possible. This typically occurs when the media is
+    stopped.
+    @param data: data pointer as passed to L{libvlc_audio_set_callbacks}() [IN].
+    """
+    pass
+class AudioDrainCb(ctypes.c_void_p):
+    """Callback prototype for audio buffer drain.
+    LibVLC may invoke this callback when the decoded audio track is ending.
+    There will be no further decoded samples for the track, but playback should
+    nevertheless continue until all already pending buffers are rendered.
+    @param data: data pointer as passed to L{libvlc_audio_set_callbacks}() [IN].
+    """
+    pass
+class AudioSetVolumeCb(ctypes.c_void_p):
+    """Callback prototype for audio volume change.
+    @param data: data pointer as passed to L{libvlc_audio_set_callbacks}() [IN].
+    @param volume: software volume (1. = nominal, 0. = mute).
+    @param mute: muted flag.
+    """
+    pass
+class AudioSetupCb(ctypes.c_void_p):
+    """Callback prototype to setup the audio playback.
+    This is called when the media player needs to create a new audio output.
+    @param opaque: pointer to the data pointer passed to L{libvlc_audio_set_callbacks}() [IN/OUT].
+    @param format: 4 bytes sample format [IN/OUT].
+    @param rate: sample rate [IN/OUT].
+    @param channels: channels count [IN/OUT].
+    @return: 0 on success, anything else to skip audio playback.
+    """
+    pass
+class AudioCleanupCb(ctypes.c_void_p):
+    """Callback prototype for audio playback cleanup.
+    This is called when the media player no longer needs an audio output.
+    @param opaque: data pointer as passed to L{libvlc_audio_set_callbacks}() [IN].
+    """
+    pass
+class CallbackDecorators(object):
+    "Class holding various method decorators for callback functions."
+    Callback = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)
+    Callback.__doc__ = '''Callback function notification.
+        @param p_event: the event triggering the callback.
+    ''' 
+    LogCb = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int, Log_ptr, ctypes.c_char_p, ctypes.c_void_p)
+    LogCb.__doc__ = '''Callback prototype for LibVLC log message handler.
+        @param data: data pointer as given to L{libvlc_log_set}().
+        @param level: message level (@ref libvlc_log_level).
+        @param ctx: message context (meta-information about the message).
+        @param fmt: printf() format string (as defined by ISO C11).
+        @param args: variable argument list for the format @note Log message handlers B{must} be thread-safe. @warning The message context pointer, the format string parameters and the variable arguments are only valid until the callback returns.
+    ''' 
+    MediaOpenCb = ctypes.CFUNCTYPE(ctypes.POINTER(ctypes.c_int), ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_uint64))
+    MediaOpenCb.__doc__ = '''Callback prototype to open a custom bitstream input media.
+        The same media item can be opened multiple times. Each time, this callback
+        is invoked. It should allocate and initialize any instance-specific
+        resources, then store them in *datap. The instance resources can be freed
+        in the @ref libvlc_media_close_cb callback.
+        @param opaque: private pointer as passed to L{libvlc_media_new_callbacks}().
+        @return: datap storage space for a private data pointer, sizep byte length of the bitstream or UINT64_MAX if unknown.
+    ''' 
+    MediaReadCb = ctypes.CFUNCTYPE(ctypes.POINTER(ctypes.c_ssize_t), ctypes.c_void_p, ctypes.c_char_p, ctypes.c_size_t)
+    MediaReadCb.__doc__ = '''Callback prototype to read data from a custom bitstream input media.
+        @param opaque: private pointer as set by the @ref libvlc_media_open_cb callback.
+        @param buf: start address of the buffer to read data into.
+        @param len: bytes length of the buffer.
+        @return: strictly positive number of bytes read, 0 on end-of-stream, or -1 on non-recoverable error @note If no data is immediately available, then the callback should sleep. @warning The application is responsible for avoiding deadlock situations. In particular, the callback should return an error if playback is stopped; if it does not return, then L{libvlc_media_player_stop}() will never return.
+    ''' 
+    MediaSeekCb = ctypes.CFUNCTYPE(ctypes.POINTER(ctypes.c_int), ctypes.c_void_p, ctypes.c_uint64)
+    MediaSeekCb.__doc__ = '''Callback prototype to seek a custom bitstream input media.
+        @param opaque: private pointer as set by the @ref libvlc_media_open_cb callback.
+        @param offset: absolute byte offset to seek to.
+        @return: 0 on success, -1 on error.
+    ''' 
+    MediaCloseCb = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p)
+    MediaCloseCb.__doc__ = '''Callback prototype to close a custom bitstream input media.
+        @param opaque: private pointer as set by the @ref libvlc_media_open_cb callback.
+    ''' 
+    VideoLockCb = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p))
+    VideoLockCb.__doc__ = '''Callback prototype to allocate and lock a picture buffer.
+        Whenever a new video frame needs to be decoded, the lock callback is
+        invoked. Depending on the video chroma, one or three pixel planes of
+        adequate dimensions must be returned via the second parameter. Those
+        planes must be aligned on 32-bytes boundaries.
+        @param opaque: private pointer as passed to L{libvlc_video_set_callbacks}() [IN].
+        @param planes: start address of the pixel planes (LibVLC allocates the array of void pointers, this callback must initialize the array) [OUT].
+        @return: a private pointer for the display and unlock callbacks to identify the picture buffers.
+    ''' 
+    VideoUnlockCb = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p))
+    VideoUnlockCb.__doc__ = '''Callback prototype to unlock a picture buffer.
+        When the video frame decoding is complete, the unlock callback is invoked.
+        This callback might not be needed at all. It is only an indication that the
+        application can now read the pixel values if it needs to.
+        @note: A picture buffer is unlocked after the picture is decoded,
+        but before the picture is displayed.
+        @param opaque: private pointer as passed to L{libvlc_video_set_callbacks}() [IN].
+        @param picture: private pointer returned from the @ref libvlc_video_lock_cb callback [IN].
+        @param planes: pixel planes as defined by the @ref libvlc_video_lock_cb callback (this parameter is only for convenience) [IN].
+    ''' 
+    VideoDisplayCb = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)
+    VideoDisplayCb.__doc__ = '''Callback prototype to display a picture.
+        When the video frame needs to be shown, as determined by the media playback
+        clock, the display callback is invoked.
+        @param opaque: private pointer as passed to L{libvlc_video_set_callbacks}() [IN].
+        @param picture: private pointer returned from the @ref libvlc_video_lock_cb callback [IN].
+    ''' 
+    VideoFormatCb = ctypes.CFUNCTYPE(ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_void_p), ctypes.c_char_p, ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint))
+    VideoFormatCb.__doc__ = '''Callback prototype to configure picture buffers format.
+        This callback gets the format of the video as output by the video decoder
+        and the chain of video filters (if any). It can opt to change any parameter
+        as it needs. In that case, LibVLC will attempt to convert the video format
+        (rescaling and chroma conversion) but these operations can be CPU intensive.
+        @param opaque: pointer to the private pointer passed to L{libvlc_video_set_callbacks}() [IN/OUT].
+        @param chroma: pointer to the 4 bytes video format identifier [IN/OUT].
+        @param width: pointer to the pixel width [IN/OUT].
+        @param height: pointer to the pixel height [IN/OUT].
+        @param pitches: table of scanline pitches in bytes for each pixel plane (the table is allocated by LibVLC) [OUT].
+        @return: lines table of scanlines count for each plane.
+    ''' 
+    VideoCleanupCb = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p)
+    VideoCleanupCb.__doc__ = '''Callback prototype to configure picture buffers format.
+        @param opaque: private pointer as passed to L{libvlc_video_set_callbacks}() (and possibly modified by @ref libvlc_video_format_cb) [IN].
+    ''' 
+    AudioPlayCb = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int64)
+    AudioPlayCb.__doc__ = '''Callback prototype for audio playback.
+        The LibVLC media player decodes and post-processes the audio signal
+        asynchronously (in an internal thread). Whenever audio samples are ready
+        to be queued to the output, this callback is invoked.
+        The number of samples provided per invocation may depend on the file format,
+        the audio coding algorithm, the decoder plug-in, the post-processing
+        filters and timing. Application must not assume a certain number of samples.
+        The exact format of audio samples is determined by L{libvlc_audio_set_format}()
+        or L{libvlc_audio_set_format_callbacks}() as is the channels layout.
+        Note that the number of samples is per channel. For instance, if the audio
+        track sampling rate is 48000 Hz, then 1200 samples represent 25 milliseconds
+        of audio signal - regardless of the number of audio channels.
+        @param data: data pointer as passed to L{libvlc_audio_set_callbacks}() [IN].
+        @param samples: pointer to a table of audio samples to play back [IN].
+        @param count: number of audio samples to play back.
+        @param pts: expected play time stamp (see libvlc_delay()).
+    ''' 
+    AudioPauseCb = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int64)
+    AudioPauseCb.__doc__ = '''Callback prototype for audio pause.
+        LibVLC invokes this callback to pause audio playback.
+        @note: The pause callback is never called if the audio is already paused.
+        @param data: data pointer as passed to L{libvlc_audio_set_callbacks}() [IN].
+        @param pts: time stamp of the pause request (should be elapsed already).
+    ''' 
+    AudioResumeCb = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int64)
+    AudioResumeCb.__doc__ = '''Callback prototype for audio resumption.
+        LibVLC invokes this callback to resume audio playback after it was
+        previously paused.
+        @note: The resume callback is never called if the audio is not paused.
+        @param data: data pointer as passed to L{libvlc_audio_set_callbacks}() [IN].
+        @param pts: time stamp of the resumption request (should be elapsed already).
+    ''' 
+    AudioFlushCb = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int64)
+    AudioFlushCb.__doc__ = '''Callback prototype for audio buffer flush.
+        LibVLC invokes this callback if it needs to discard all pending buffers and
+        stop playback as soon as possible. This typically occurs when the media is
+        stopped.
+        @param data: data pointer as passed to L{libvlc_audio_set_callbacks}() [IN].
+    ''' 
+    AudioDrainCb = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p)
+    AudioDrainCb.__doc__ = '''Callback prototype for audio buffer drain.
+        LibVLC may invoke this callback when the decoded audio track is ending.
+        There will be no further decoded samples for the track, but playback should
+        nevertheless continue until all already pending buffers are rendered.
+        @param data: data pointer as passed to L{libvlc_audio_set_callbacks}() [IN].
+    ''' 
+    AudioSetVolumeCb = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_float, ctypes.c_bool)
+    AudioSetVolumeCb.__doc__ = '''Callback prototype for audio volume change.
+        @param data: data pointer as passed to L{libvlc_audio_set_callbacks}() [IN].
+        @param volume: software volume (1. = nominal, 0. = mute).
+        @param mute: muted flag.
+    ''' 
+    AudioSetupCb = ctypes.CFUNCTYPE(ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_void_p), ctypes.c_char_p, ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint))
+    AudioSetupCb.__doc__ = '''Callback prototype to setup the audio playback.
+        This is called when the media player needs to create a new audio output.
+        @param opaque: pointer to the data pointer passed to L{libvlc_audio_set_callbacks}() [IN/OUT].
+        @param format: 4 bytes sample format [IN/OUT].
+        @param rate: sample rate [IN/OUT].
+        @param channels: channels count [IN/OUT].
+        @return: 0 on success, anything else to skip audio playback.
+    ''' 
+    AudioCleanupCb = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p)
+    AudioCleanupCb.__doc__ = '''Callback prototype for audio playback cleanup.
+        This is called when the media player no longer needs an audio output.
+        @param opaque: data pointer as passed to L{libvlc_audio_set_callbacks}() [IN].
+    ''' 
+cb = CallbackDecorators
+ # End of generated enum types #
+
+ # From libvlc_structures.h
+
+class AudioOutput(_Cstruct):
+
+    def __str__(self):
+        return '%s(%s:%s)' % (self.__class__.__name__, self.name, self.description)
+
+AudioOutput._fields_ = [  # recursive struct
+    ('name',        ctypes.c_char_p),
+    ('description', ctypes.c_char_p),
+    ('next',        ctypes.POINTER(AudioOutput)),
+    ]
+
+class LogMessage(_Cstruct):
+    _fields_ = [
+        ('size',     ctypes.c_uint  ),
+        ('severity', ctypes.c_int   ),
+        ('type',     ctypes.c_char_p),
+        ('name',     ctypes.c_char_p),
+        ('header',   ctypes.c_char_p),
+        ('message',  ctypes.c_char_p),
+    ]
+
+    def __init__(self):
+        super(LogMessage, self).__init__()
+        self.size = ctypes.sizeof(self)
+
+    def __str__(self):
+        return '%s(%d:%s): %s' % (self.__class__.__name__, self.severity, self.type, self.message)
+
+class MediaEvent(_Cstruct):
+    _fields_ = [
+        ('media_name',    ctypes.c_char_p),
+        ('instance_name', ctypes.c_char_p),
+    ]
+
+class MediaStats(_Cstruct):
+    _fields_ = [
+        ('read_bytes',          ctypes.c_int  ),
+        ('input_bitrate',       ctypes.c_float),
+        ('demux_read_bytes',    ctypes.c_int  ),
+        ('demux_bitrate',       ctypes.c_float),
+        ('demux_corrupted',     ctypes.c_int  ),
+        ('demux_discontinuity', ctypes.c_int  ),
+        ('decoded_video',       ctypes.c_int  ),
+        ('decoded_audio',       ctypes.c_int  ),
+        ('displayed_pictures',  ctypes.c_int  ),
+        ('lost_pictures',       ctypes.c_int  ),
+        ('played_abuffers',     ctypes.c_int  ),
+        ('lost_abuffers',       ctypes.c_int  ),
+        ('sent_packets',        ctypes.c_int  ),
+        ('sent_bytes',          ctypes.c_int  ),
+        ('send_bitrate',        ctypes.c_float),
+    ]
+
+class MediaTrackInfo(_Cstruct):
+    _fields_ = [
+        ('codec',              ctypes.c_uint32),
+        ('id',                 ctypes.c_int   ),
+        ('type',               TrackType      ),
+        ('profile',            ctypes.c_int   ),
+        ('level',              ctypes.c_int   ),
+        ('channels_or_height', ctypes.c_uint  ),
+        ('rate_or_width',      ctypes.c_uint  ),
+    ]
+
+class AudioTrack(_Cstruct):
+    _fields_ = [
+        ('channels', ctypes.c_uint),
+        ('rate', ctypes.c_uint),
+        ]
+
+class VideoTrack(_Cstruct):
+    _fields_ = [
+        ('height', ctypes.c_uint),
+        ('width', ctypes.c_uint),
+        ('sar_num', ctypes.c_uint),
+        ('sar_den', ctypes.c_uint),
+        ('frame_rate_num', ctypes.c_uint),
+        ('frame_rate_den', ctypes.c_uint),
+        ]
+
+class SubtitleTrack(_Cstruct):
+    _fields_ = [
+        ('encoding', ctypes.c_char_p),
+        ]
+
+class MediaTrackTracks(ctypes.Union):
+    _fields_ = [
+        ('audio', ctypes.POINTER(AudioTrack)),
+        ('video', ctypes.POINTER(VideoTrack)),
+        ('subtitle', ctypes.POINTER(SubtitleTrack)),
+        ]
+
+class MediaTrack(_Cstruct):
+    _anonymous_ = ("u",)
+    _fields_ = [
+        ('codec',              ctypes.c_uint32),
+        ('original_fourcc',    ctypes.c_uint32),
+        ('id',                 ctypes.c_int   ),
+        ('type',               TrackType      ),
+        ('profile',            ctypes.c_int   ),
+        ('level',              ctypes.c_int   ),
+
+        ('u',                  MediaTrackTracks),
+        ('bitrate',            ctypes.c_uint),
+        ('language',           ctypes.c_char_p),
+        ('description',        ctypes.c_char_p),
+        ]
+
+class PlaylistItem(_Cstruct):
+    _fields_ = [
+        ('id',   ctypes.c_int   ),
+        ('uri',  ctypes.c_char_p),
+        ('name', ctypes.c_char_p),
+    ]
+
+    def __str__(self):
+        return '%s #%d %s (uri %s)' % (self.__class__.__name__, self.id, self.name, self.uri)
+
+class Position(object):
+    """Enum-like, immutable window position constants.
+
+       See e.g. VideoMarqueeOption.Position.
+    """
+    Center       = 0
+    Left         = 1
+    CenterLeft   = 1
+    Right        = 2
+    CenterRight  = 2
+    Top          = 4
+    TopCenter    = 4
+    TopLeft      = 5
+    TopRight     = 6
+    Bottom       = 8
+    BottomCenter = 8
+    BottomLeft   = 9
+    BottomRight  = 10
+    def __init__(self, *unused):
+        raise TypeError('constants only')
+    def __setattr__(self, *unused):  #PYCHOK expected
+        raise TypeError('immutable constants')
+
+class Rectangle(_Cstruct):
+    _fields_ = [
+        ('top',    ctypes.c_int),
+        ('left',   ctypes.c_int),
+        ('bottom', ctypes.c_int),
+        ('right',  ctypes.c_int),
+    ]
+
+class TrackDescription(_Cstruct):
+
+    def __str__(self):
+        return '%s(%d:%s)' % (self.__class__.__name__, self.id, self.name)
+
+TrackDescription._fields_ = [  # recursive struct
+    ('id',   ctypes.c_int   ),
+    ('name', ctypes.c_char_p),
+    ('next', ctypes.POINTER(TrackDescription)),
+    ]
+
+def track_description_list(head):
+    """Convert a TrackDescription linked list to a Python list (and release the former).
+    """
+    r = []
+    if head:
+        item = head
+        while item:
+            item = item.contents
+            r.append((item.id, item.name))
+            item = item.next
+        try:
+            libvlc_track_description_release(head)
+        except NameError:
+            libvlc_track_description_list_release(head)
+
+    return r
+
+class EventUnion(ctypes.Union):
+    _fields_ = [
+        ('meta_type',    ctypes.c_uint    ),
+        ('new_child',    ctypes.c_uint    ),
+        ('new_duration', ctypes.c_longlong),
+        ('new_status',   ctypes.c_int     ),
+        ('media',        ctypes.c_void_p  ),
+        ('new_state',    ctypes.c_uint    ),
+        # FIXME: Media instance
+        ('new_cache', ctypes.c_float   ),
+        ('new_position', ctypes.c_float   ),
+        ('new_time',     ctypes.c_longlong),
+        ('new_title',    ctypes.c_int     ),
+        ('new_seekable', ctypes.c_longlong),
+        ('new_pausable', ctypes.c_longlong),
+        ('new_scrambled', ctypes.c_longlong),
+        ('new_count', ctypes.c_longlong),
+        # FIXME: Skipped MediaList and MediaListView...
+        ('filename',     ctypes.c_char_p  ),
+        ('new_length',   ctypes.c_longlong),
+        ('media_event',  MediaEvent       ),
+    ]
+
+class Event(_Cstruct):
+    _fields_ = [
+        ('type',   EventType      ),
+        ('object', ctypes.c_void_p),
+        ('u',      EventUnion     ),
+    ]
+
+class ModuleDescription(_Cstruct):
+
+    def __str__(self):
+        return '%s %s (%s)' % (self.__class__.__name__, self.shortname, self.name)
+
+ModuleDescription._fields_ = [  # recursive struct
+    ('name',      ctypes.c_char_p),
+    ('shortname', ctypes.c_char_p),
+    ('longname',  ctypes.c_char_p),
+    ('help',      ctypes.c_char_p),
+    ('next',      ctypes.POINTER(ModuleDescription)),
+    ]
+
+def module_description_list(head):
+    """Convert a ModuleDescription linked list to a Python list (and release the former).
+    """
+    r = []
+    if head:
+        item = head
+        while item:
+            item = item.contents
+            r.append((item.name, item.shortname, item.longname, item.help))
+            item = item.next
+        libvlc_module_description_list_release(head)
+    return r
+
+class AudioOutputDevice(_Cstruct):
+
+    def __str__(self):
+        return '%s(%d:%s)' % (self.__class__.__name__, self.id, self.name)
+
+AudioOutputDevice._fields_ = [  # recursive struct
+    ('next', ctypes.POINTER(AudioOutputDevice)),
+    ('device',   ctypes.c_char_p   ),
+    ('description', ctypes.c_char_p),
+    ]
+
+class TitleDescription(_Cstruct):
+    _fields = [
+        ('duration', ctypes.c_longlong),
+        ('name', ctypes.c_char_p),
+        ('menu', ctypes.c_bool),
+    ]
+
+class ChapterDescription(_Cstruct):
+    _fields = [
+        ('time_offset', ctypes.c_longlong),
+        ('duration', ctypes.c_longlong),
+        ('name', ctypes.c_char_p),
+    ]
+
+class VideoViewpoint(_Cstruct):
+    _fields = [
+        ('yaw', ctypes.c_float),
+        ('pitch', ctypes.c_float),
+        ('roll', ctypes.c_float),
+        ('field_of_view', ctypes.c_float),
+    ]
+
+# This struct depends on the MediaSlaveType enum that is defined only
+# in > 2.2
+if 'MediaSlaveType' in locals():
+    class MediaSlave(_Cstruct):
+        _fields = [
+            ('psz_uri', ctypes.c_char_p),
+            ('i_type', MediaSlaveType),
+            ('i_priority', ctypes.c_uint)
+        ]
+
+class RDDescription(_Cstruct):
+    _fields = [
+        ('name', ctypes.c_char_p),
+        ('longname', ctypes.c_char_p)
+    ]
+
+# End of header.py #
+class EventManager(_Ctype):
+    '''Create an event manager with callback handler.
+
+    This class interposes the registration and handling of
+    event notifications in order to (a) remove the need for
+    decorating each callback functions with the decorator
+    '@callbackmethod', (b) allow any number of positional
+    and/or keyword arguments to the callback (in addition
+    to the Event instance) and (c) to preserve the Python
+    objects such that the callback and argument objects
+    remain alive (i.e. are not garbage collected) until
+    B{after} the notification has been unregistered.
+
+    @note: Any number of notifications can be registered
+    for each event type in an EventManager instance. They
+    are called in the order they were registered, and may
+    be attached or detached while events are dispatched.
+    
+    '''
+
+    # guards the lazy creation of the registries
+    _registry_lock = threading.Lock()
+
+    def __new__(cls, ptr=_internal_guard):
+        if ptr == _internal_guard:
+            raise VLCException("(INTERNAL) ctypes class.\nYou should get a reference to EventManager through the MediaPlayer.event_manager() method.")
+        return _Constructor(cls, ptr)
+
+
+
+
+
+class Instance(_Ctype):
+    '''Create a new Instance instance.
+
+    It may take as parameter either:
+      - a string
+      - a list of strings as first parameters
+      - the parameters given as the constructor parameters (must be strings)
+    
+    '''
+
+    def __new__(cls, *args):
+        if len(args) == 1:
+            # Only 1 arg. It is either a C pointer, or an arg string,
+            # or a tuple.
+            i = args[0]
+            if isinstance(i, _Ints):
+                return _Constructor(cls, i)
+            elif isinstance(i, basestring):
+                args = i.strip().split()
+            elif isinstance(i, _Seqs):
+                args = list(i)
+            else:
+                raise VLCException('Instance %r' % (args,))
+        else:
+            args = list(args)
+
+        if not args:  # no parameters passed
+            args = ['vlc']
+        elif args[0] != 'vlc':
+            args.insert(0, 'vlc')
+
+        _load_lib()
+        if plugin_path is not None:
+            # set plugin_path if detected, win32 and MacOS,
+            # if the user did not specify it itself.
+            os.environ.setdefault('VLC_PLUGIN_PATH', plugin_path)
+
+        if PYTHON3:
+            args = [ str_to_bytes(a) for a in args ]
+        return libvlc_new(len(args), args)
+
+
+
+
+
+
+
+
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    @memoize_parameterless
+    def vlm_get_event_manager(self):
+        '''Get libvlc_event_manager from a vlm media.
+        The p_event_manager is immutable, so you don't have to hold the lock.
+        @return: libvlc_event_manager.
+        '''
+        return libvlc_vlm_get_event_manager(self)
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+class LogIterator(_Ctype):
+    '''Create a new VLC log iterator.
+    
+    '''
+
+    def __new__(cls, ptr=_internal_guard):
+        '''(INTERNAL) ctypes wrapper constructor.
+        '''
+        return _Constructor(cls, ptr)
+
+    def __iter__(self):
+        return self
+
+
+    def __next__(self):
+        return self.next()
+
+
+    
+
+    
+
+class Media(_Ctype):
+    '''Create a new Media instance.
+
+    Usage: Media(MRL, *options)
+
+    See vlc.Instance.media_new documentation for details.
+    
+    '''
+
+    def __new__(cls, *args):
+        if args:
+            i = args[0]
+            if isinstance(i, _Ints):
+                return _Constructor(cls, i)
+            if isinstance(i, Instance):
+                return i.media_new(*args[1:])
+
+        o = get_default_instance().media_new(*args)
+        return o
+
+
+
+
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    @memoize_parameterless
+    def event_manager(self):
+        '''Get event manager from media descriptor object.
+        NOTE: this function doesn't increment reference counting.
+        @return: event manager object.
+        '''
+        return libvlc_media_event_manager(self)
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+class MediaDiscoverer(_Ctype):
+    '''N/A
+    '''
+
+    def __new__(cls, ptr=_internal_guard):
+        '''(INTERNAL) ctypes wrapper constructor.
+        '''
+        return _Constructor(cls, ptr)
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    @memoize_parameterless
+    def event_manager(self):
+        '''Get event manager from media service discover object.
+        \deprecated Useless, media_discoverer events are only triggered when calling
+        L{start}() and L{stop}().
+        @return: event manager object.
+        '''
+        return libvlc_media_discoverer_event_manager(self)
+
+class MediaLibrary(_Ctype):
+    '''N/A
+    '''
+
+    def __new__(cls, ptr=_internal_guard):
+        '''(INTERNAL) ctypes wrapper constructor.
+        '''
+        return _Constructor(cls, ptr)
+    
+
+    
+
+    
+
+    
+
+class MediaList(_Ctype):
+    '''Create a new MediaList instance.
+
+    Usage: MediaList(list_of_MRLs)
+
+    See vlc.Instance.media_list_new documentation for details.
+    
+    '''
+
+    def __new__(cls, *args):
+        if args:
+            i = args[0]
+            if isinstance(i, _Ints):
+                return _Constructor(cls, i)
+            if isinstance(i, Instance):
+                return i.media_list_new(*args[1:])
+
+        o = get_default_instance().media_list_new(*args)
+        return o
+
+
+
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    def __len__(self):
+        return libvlc_media_list_count(self)
+
+    
+
+    def __getitem__(self, i):
+        return libvlc_media_list_item_at_index(self, i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    
+
+    
+
+    
+
+    
+
+    @memoize_parameterless
+    def event_manager(self):
+        '''Get libvlc_event_manager from this media list instance.
+        The p_event_manager is immutable, so you don't have to hold the lock.
+        @return: libvlc_event_manager.
+        '''
+        return libvlc_media_list_event_manager(self)
+
+class MediaListPlayer(_Ctype):
+    '''Create a new MediaListPlayer instance.
+
+    It may take as parameter either:
+      - a vlc.Instance
+      - nothing
+    
+    '''
+
+    def __new__(cls, arg=None):
+        if arg is None:
+            i = get_default_instance()
+        elif isinstance(arg, Instance):
+            i = arg
+        elif isinstance(arg, _Ints):
+            return _Constructor(cls, arg)
+        else:
+            raise TypeError('MediaListPlayer %r' % (arg,))
+
+        return i.media_list_player_new()
+
+
+
+    
+
+    
+
+    @memoize_parameterless
+    def event_manager(self):
+        '''Return the event manager of this media_list_player.
+        @return: the event manager.
+        '''
+        return libvlc_media_list_player_event_manager(self)
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    def __getitem__(self, i):
+        return libvlc_media_list_player_play_item_at_index(self, i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    
+
+    
+
+    
+
+    
+
+    
+
+class MediaPlayer(_Ctype):
+    '''Create a new MediaPlayer instance.
+
+    It may take as parameter either:
+      - a string (media URI), options... In this case, a vlc.Instance will be created.
+      - a vlc.Instance, a string (media URI), options...
+    
+    '''
+
+    def __new__(cls, *args):
+        if len(args) == 1 and isinstance(args[0], _Ints):
+            return _Constructor(cls, args[0])
+
+        if args and isinstance(args[0], Instance):
+            instance = args[0]
+            args = args[1:]
+        else:
+            instance = get_default_instance()
+
+        o = instance.media_player_new()
+        if args:
+            o.set_media(instance.media_new(*args))
+        return o
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    @memoize_parameterless
+    def event_manager(self):
+        '''Get the Event Manager from which the media player send event.
+        @return: the event manager associated with p_mi.
+        '''
+        return libvlc_media_player_event_manager(self)
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+    
+
+
+ # LibVLC __version__ functions #
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+# 5 function(s) blacklisted:
+#  libvlc_audio_output_get_device_type
+#  libvlc_audio_output_set_device_type
+#  libvlc_dialog_set_callbacks
+#  libvlc_printerr
+#  libvlc_set_exit_handler
+
+# 52 function(s) not wrapped as methods:
+#  libvlc_audio_equalizer_get_amp_at_index
+#  libvlc_audio_equalizer_get_band_count
+#  libvlc_audio_equalizer_get_band_frequency
+#  libvlc_audio_equalizer_get_preamp
+#  libvlc_audio_equalizer_get_preset_count
+#  libvlc_audio_equalizer_get_preset_name
+#  libvlc_audio_equalizer_new
+#  libvlc_audio_equalizer_new_from_preset
+#  libvlc_audio_equalizer_release
+#  libvlc_audio_equalizer_set_amp_at_index
+#  libvlc_audio_equalizer_set_preamp
+#  libvlc_audio_output_device_list_release
+#  libvlc_audio_output_list_release
+#  libvlc_chapter_descriptions_release
+#  libvlc_clearerr
+#  libvlc_clock
+#  libvlc_dialog_dismiss
+#  libvlc_dialog_get_context
+#  libvlc_dialog_post_action
+#  libvlc_dialog_post_login
+#  libvlc_dialog_set_context
+#  libvlc_event_type_name
+#  libvlc_free
+#  libvlc_get_changeset
+#  libvlc_get_compiler
+#  libvlc_get_version
+#  libvlc_log_clear
+#  libvlc_log_close
+#  libvlc_log_count
+#  libvlc_log_get_context
+#  libvlc_log_get_iterator
+#  libvlc_log_get_object
+#  libvlc_media_discoverer_list_release
+#  libvlc_media_get_codec_description
+#  libvlc_media_slaves_release
+#  libvlc_media_tracks_release
+#  libvlc_module_description_list_release
+#  libvlc_new
+#  libvlc_renderer_discoverer_event_manager
+#  libvlc_renderer_discoverer_list_release
+#  libvlc_renderer_discoverer_release
+#  libvlc_renderer_discoverer_start
+#  libvlc_renderer_discoverer_stop
+#  libvlc_renderer_item_flags
+#  libvlc_renderer_item_icon_uri
+#  libvlc_renderer_item_name
+#  libvlc_renderer_item_type
+#  libvlc_title_descriptions_release
+#  libvlc_track_description_list_release
+#  libvlc_track_description_release
+#  libvlc_video_new_viewpoint
+#  libvlc_vprinterr
+
+# Start of footer.py #
+
+# Backward compatibility
+def callbackmethod(callback):
+    """Now obsolete @callbackmethod decorator."""
+    return callback
+
+# Lifetime of the native objects. Wrappers returned by the functions
+# creating a native object own its reference: it is released once,
+# either explicitly by release() (or leaving a with block) or when the
+# wrapper is garbage collected. Other wrappers (e.g. of get_media())
+# are not released automatically.
+_owning_functions = frozenset((
+    'libvlc_new',
+    'libvlc_media_new_location', 'libvlc_media_new_path', 'libvlc_media_new_fd',
+    'libvlc_media_new_callbacks', 'libvlc_media_new_as_node', 'libvlc_media_duplicate',
+    'libvlc_media_list_new',
+    'libvlc_media_player_new', 'libvlc_media_player_new_from_media',
+    'libvlc_media_list_player_new',
+))
+
+# class -> libvlc function releasing its native object
+_release_functions = {
+    'Instance':        'libvlc_release',
+    'Media':           'libvlc_media_release',
+    'MediaList':       'libvlc_media_list_release',
+    'MediaPlayer':     'libvlc_media_player_release',
+    'MediaListPlayer': 'libvlc_media_list_player_release',
+}
+
+class _Handle(object):
+    """(INTERNAL) Bare native handle, passed to the release function
+    by the finalizer, which must not refer to the wrapper.
+    """
+    __slots__ = ('_as_parameter_',)
+
+    def __init__(self, handle):
+        self._as_parameter_ = handle
+
+def _release_native(name, handle):
+    """(INTERNAL) Release a native object.
+    """
+    _Globals[name](_Handle(handle))
+
+def _owning_result(errcheck):
+    """(INTERNAL) Errcheck function. Makes the new wrapper release its native object.
+    """
+    def wrap_errcheck(result, func, arguments):
+        if errcheck is not None:
+            result = errcheck(result, func, arguments)
+        if isinstance(result, _Ctype) and type(result).__name__ in _release_functions:
+            f = weakref.finalize(result, _release_native,
+                                 _release_functions[type(result).__name__], result._as_parameter_)
+            # libvlc may already be shutting down at exit, the OS frees everything anyway
+            f.atexit = False
+            result._finalizer = f
+        return result
+    return wrap_errcheck
+
+def _release_method(name):
+    """(INTERNAL) release() method of a class whose native object is released by name.
+    """
+    def release(self):
+        """Decrement the reference count of the native object.
+        An owned reference is released once, further calls do nothing.
+        """
+        event_manager = getattr(type(self), 'event_manager', None)
+        if isinstance(event_manager, memoize_parameterless):
+            event_manager.forget(self)
+        f = self.__dict__.get('_finalizer')
+        if f is None:
+            return _Globals[name](self)
+        f()
+    return release
+
+def _enter(self):
+    return self
+
+def _exit(self, *exc_info):
+    self.release()
+
+for _name, _release in _release_functions.items():
+    _cls = _Globals[_name]
+    _cls.release = _release_method(_release)
+    # with blocks release the native object at their end
+    _cls.__enter__ = _enter
+    _cls.__exit__ = _exit
+del _name, _release, _cls
+
+# Fast path for the MediaPlayer calls made per video frame. The ctypes
+# functions are bound once when libvlc is loaded, with fixed argtypes and
+# restype, and take the raw c_void_p handle of the player. They skip the
+# binding lookup and the from_param conversions of the generic wrappers.
+_fast_path_table = (
+    # (method, libvlc function, restype, fixed arguments as (type, value))
+    ('fast_is_playing',   'libvlc_media_player_is_playing',   ctypes.c_int,      ()),
+    ('fast_play',         'libvlc_media_player_play',         ctypes.c_int,      ()),
+    ('fast_pause',        'libvlc_media_player_set_pause',    None,              ((ctypes.c_int, 1),)),
+    ('fast_get_time',     'libvlc_media_player_get_time',     ctypes.c_longlong, ()),
+    ('fast_get_position', 'libvlc_media_player_get_position', ctypes.c_float,    ()),
+    ('fast_get_state',    'libvlc_media_player_get_state',    ctypes.c_int,      ()),
+)
+_fast_path = {}
+
+def _bind_fast_path(dll):
+    """(INTERNAL) Bind the fast path functions found in the library.
+    """
+    for name, cname, restype, fixed in _fast_path_table:
+        if hasattr(dll, cname):
+            p = ctypes.CFUNCTYPE(restype, ctypes.c_void_p, *[t for t, _ in fixed])
+            _fast_path[name] = p((cname, dll))
+
+def _fast_path_method(name, cname, fixed):
+    """(INTERNAL) MediaPlayer method calling a fast path function.
+
+    The first call stores a partial with the player's handle in the
+    instance, later calls find it there and run without any Python frame.
+    """
+    args = tuple(v for _, v in fixed)
+    def method(self):
+        try:
+            f = _fast_path[name]
+        except KeyError:
+            raise NameError('no function %r' % (cname,))
+        f = self.__dict__[name] = functools.partial(f, self._as_parameter_, *args)
+        return f()
+    method.__name__ = name
+    method.__doc__ = 'Fast path of L{%s}().' % (cname,)
+    return method
+
+for _name, _cname, _restype, _fixed in _fast_path_table:
+    setattr(MediaPlayer, _name, _fast_path_method(_name, _cname, _fixed))
+del _name, _cname, _restype, _fixed
+MediaPlayer.fast_get_state.__doc__ += '''
+    The state is returned as int, which compares equal to the L{State} values.'''
+
+# libvlc_free is not present in some versions of libvlc. If it is not
+# in the library, then emulate it by calling libc.free
+def _emulate_libvlc_free(dll):
+    """(INTERNAL) Replace libvlc_free when the library is loaded.
+    """
+    if hasattr(dll, 'libvlc_free'):
+        return
+    # need to find the free function in the C runtime. This is
+    # platform specific.
+    # For Linux and MacOSX
+    from ctypes.util import find_library
+    libc_path = find_library('c')
+    if libc_path:
+        libc = ctypes.CDLL(libc_path)
+        libvlc_free = libc.free
+    else:
+        # On win32, it is impossible to guess the proper lib to call
+        # (msvcrt, mingw...). Just ignore the call: it will memleak,
+        # but not prevent to run the application.
+        def libvlc_free(p):
+            pass
+
+    # ensure argtypes is right, because default type of int won't
+    # work on 64-bit systems
+    libvlc_free.argtypes = [ ctypes.c_void_p ]
+    _Globals['libvlc_free'] = libvlc_free
+
+# Version functions
+def _dot2int(v):
+    '''(INTERNAL) Convert 'i.i.i[.i]' str to int.
+    '''
+    t = [int(i) for i in v.split('.')]
+    if len(t) == 3:
+        t.append(0)
+    elif len(t) != 4:
+        raise ValueError('"i.i.i[.i]": %r' % (v,))
+    if min(t) < 0 or max(t) > 255:
+        raise ValueError('[0..255]: %r' % (v,))
+    i = t.pop(0)
+    while t:
+        i = (i << 8) + t.pop(0)
+    return i
+
+def hex_version():
+    """Return the version of these bindings in hex or 0 if unavailable.
+    """
+    try:
+        return _dot2int(__version__)
+    except (NameError, ValueError):
+        return 0
+
+def libvlc_hex_version():
+    """Return the libvlc version in hex or 0 if unavailable.
+    """
+    try:
+        return _dot2int(bytes_to_str(libvlc_get_version()).split()[0])
+    except ValueError:
+        return 0
+
+def debug_callback(event, *args, **kwds):
+    '''Example callback, useful for debugging.
+    '''
+    l = ['event %s' % (event.type,)]
+    if args:
+        l.extend(map(str, args))
+    if kwds:
+        l.extend(sorted('%s=%s' % t for t in kwds.items()))
+    print('Debug callback (%s)' % ', '.join(l))
+
+# Start of compact binding #
+
+from types import MethodType as _MethodType
+
+_docs = None
+
+def docstring(name):
+    """Return the docstring of a libvlc function ('libvlc_...') or of a
+    method ('Class.method'), read from vlc_compact_docs.json on first use.
+    Without that file there are no docstrings and None is returned.
+    """
+    global _docs
+    if _docs is None:
+        import json
+        path = os.path.splitext(os.path.abspath(__file__))[0] + '_docs.json'
+        try:
+            with open(path) as f:
+                _docs = json.load(f)
+        except (IOError, ValueError):
+            _docs = {}
+    return _docs.get(name)
+
+class _Binding(object):
+    """(INTERNAL) Placeholder of a libvlc function, binds it on the first call.
+
+    The bound ctypes function replaces the placeholder in the module, so
+    later calls go straight to ctypes.
+    """
+    __slots__ = ('__name__',)
+
+    def __init__(self, name):
+        self.__name__ = name
+
+    def __call__(self, *args):
+        return _bind(self.__name__)(*args)
+
+    @property
+    def __doc__(self):
+        return docstring(self.__name__)
+
+    def __repr__(self):
+        return '<libvlc function %s>' % (self.__name__,)
+
+# ctypes function type -> subclass with a docstring read on request
+_documented = {}
+
+def _bind(name):
+    """(INTERNAL) Bind the libvlc function name from its table entry.
+    """
+    f = _Globals[name]
+    if isinstance(f, _Binding):
+        f = _Cfunction(name, *eval('(%s,)' % (_bindings[name],), _Globals))
+        cls = type(f)
+        if cls not in _documented:
+            _documented[cls] = type(cls.__name__, (cls,), {
+                '_flags_': cls._flags_, '_argtypes_': cls._argtypes_,
+                '_restype_': cls._restype_,
+                '__doc__': property(lambda self: docstring(self.__name__))})
+        f.__class__ = _documented[cls]
+        f.__name__ = name
+        _Globals[name] = f
+    return f
+
+class _Method(object):
+    """(INTERNAL) Method compiled from the table, its docstring is read on
+    request.
+    """
+    __slots__ = ('__func__',)
+
+    def __init__(self, func):
+        self.__func__ = func
+
+    def __get__(self, obj, cls=None):
+        return self if obj is None else _MethodType(self.__func__, obj)
+
+    def __call__(self, *args, **kwds):
+        return self.__func__(*args, **kwds)
+
+    @property
+    def __doc__(self):
+        return docstring(self.__func__.__qualname__)
+
+    @property
+    def __wrapped__(self):
+        return self.__func__
+
+    def __getattr__(self, name):
+        # __name__, __qualname__ and the other function attributes
+        return getattr(self.__func__, name)
+
+    def __repr__(self):
+        return '<method %s>' % (self.__func__.__qualname__,)
+
+def _method(cls, name):
+    """(INTERNAL) Compile the method name of cls (or of a base class) from
+    its table entry and add it to the class, None if there is none.
+    """
+    for c in cls.__mro__:
+        key = '%s.%s' % (c.__name__, name)
+        source = _methods.get(key)
+        if source is not None:
+            namespace = {}
+            exec(source, _Globals, namespace)
+            f = namespace[name]
+            f.__qualname__ = key
+            setattr(c, name, _Method(f))
+            return f
+    return None
+
+def _Ctype_getattr(self, name):
+    """(INTERNAL) Create the methods of the libvlc classes on first use.
+    """
+    if name.startswith('__') or _method(type(self), name) is None:
+        raise AttributeError('%r object has no attribute %r' % (type(self).__name__, name))
+    return getattr(self, name)
+
+def _Ctype_dir(self):
+    """(INTERNAL) List the methods that are not created yet, too.
+    """
+    names = set(object.__dir__(self))
+    for c in type(self).__mro__:
+        prefix = c.__name__ + '.'
+        names.update(k[len(prefix):] for k in _methods if k.startswith(prefix))
+    return sorted(names)
+
+_Ctype.__getattr__ = _Ctype_getattr
+_Ctype.__dir__ = _Ctype_dir
+
+# libvlc function -> arguments of _Cfunction after the name (paramflags,
+# errcheck, restype, argtypes) as Python source
+_bindings = {
+    'libvlc_add_intf': '((1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p',
+    'libvlc_audio_equalizer_get_amp_at_index': '((1,), (1,),), None, ctypes.c_float, ctypes.c_void_p, ctypes.c_uint',
+    'libvlc_audio_equalizer_get_band_count': '(), None, ctypes.c_uint',
+    'libvlc_audio_equalizer_get_band_frequency': '((1,),), None, ctypes.c_float, ctypes.c_uint',
+    'libvlc_audio_equalizer_get_preamp': '((1,),), None, ctypes.c_float, ctypes.c_void_p',
+    'libvlc_audio_equalizer_get_preset_count': '(), None, ctypes.c_uint',
+    'libvlc_audio_equalizer_get_preset_name': '((1,),), None, ctypes.c_char_p, ctypes.c_uint',
+    'libvlc_audio_equalizer_new': '(), None, ctypes.c_void_p',
+    'libvlc_audio_equalizer_new_from_preset': '((1,),), None, ctypes.c_void_p, ctypes.c_uint',
+    'libvlc_audio_equalizer_release': '((1,),), None, None, ctypes.c_void_p',
+    'libvlc_audio_equalizer_set_amp_at_index': '((1,), (1,), (1,),), None, ctypes.c_int, ctypes.c_void_p, ctypes.c_float, ctypes.c_uint',
+    'libvlc_audio_equalizer_set_preamp': '((1,), (1,),), None, ctypes.c_int, ctypes.c_void_p, ctypes.c_float',
+    'libvlc_audio_filter_list_get': '((1,),), None, ctypes.POINTER(ModuleDescription), Instance',
+    'libvlc_audio_get_channel': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_audio_get_delay': '((1,),), None, ctypes.c_int64, MediaPlayer',
+    'libvlc_audio_get_mute': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_audio_get_track': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_audio_get_track_count': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_audio_get_track_description': '((1,),), None, ctypes.POINTER(TrackDescription), MediaPlayer',
+    'libvlc_audio_get_volume': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_audio_output_device_count': '((1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p',
+    'libvlc_audio_output_device_enum': '((1,),), None, ctypes.POINTER(AudioOutputDevice), MediaPlayer',
+    'libvlc_audio_output_device_get': '((1,),), None, ctypes.c_char_p, MediaPlayer',
+    'libvlc_audio_output_device_id': '((1,), (1,), (1,),), string_result, ctypes.c_void_p, Instance, ctypes.c_char_p, ctypes.c_int',
+    'libvlc_audio_output_device_list_get': '((1,), (1,),), None, ctypes.POINTER(AudioOutputDevice), Instance, ctypes.c_char_p',
+    'libvlc_audio_output_device_list_release': '((1,),), None, None, ctypes.POINTER(AudioOutputDevice)',
+    'libvlc_audio_output_device_longname': '((1,), (1,), (1,),), string_result, ctypes.c_void_p, Instance, ctypes.c_char_p, ctypes.c_int',
+    'libvlc_audio_output_device_set': '((1,), (1,), (1,),), None, None, MediaPlayer, ctypes.c_char_p, ctypes.c_char_p',
+    'libvlc_audio_output_list_get': '((1,),), None, ctypes.POINTER(AudioOutput), Instance',
+    'libvlc_audio_output_list_release': '((1,),), None, None, ctypes.POINTER(AudioOutput)',
+    'libvlc_audio_output_set': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_char_p',
+    'libvlc_audio_set_callbacks': '((1,), (1,), (1,), (1,), (1,), (1,), (1,),), None, None, MediaPlayer, AudioPlayCb, AudioPauseCb, AudioResumeCb, AudioFlushCb, AudioDrainCb, ctypes.c_void_p',
+    'libvlc_audio_set_channel': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_int',
+    'libvlc_audio_set_delay': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_int64',
+    'libvlc_audio_set_format': '((1,), (1,), (1,), (1,),), None, None, MediaPlayer, ctypes.c_char_p, ctypes.c_uint, ctypes.c_uint',
+    'libvlc_audio_set_format_callbacks': '((1,), (1,), (1,),), None, None, MediaPlayer, AudioSetupCb, AudioCleanupCb',
+    'libvlc_audio_set_mute': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_int',
+    'libvlc_audio_set_track': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_int',
+    'libvlc_audio_set_volume': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_int',
+    'libvlc_audio_set_volume_callback': '((1,), (1,),), None, None, MediaPlayer, AudioSetVolumeCb',
+    'libvlc_audio_toggle_mute': '((1,),), None, None, MediaPlayer',
+    'libvlc_chapter_descriptions_release': '((1,), (1,),), None, None, ctypes.POINTER(ChapterDescription), ctypes.c_uint',
+    'libvlc_clearerr': '(), None, None',
+    'libvlc_clock': '(), None, ctypes.c_int64',
+    'libvlc_dialog_dismiss': '((1,),), None, ctypes.c_int, ctypes.c_void_p',
+    'libvlc_dialog_get_context': '((1,),), None, ctypes.c_void_p, ctypes.c_void_p',
+    'libvlc_dialog_post_action': '((1,), (1,),), None, ctypes.c_int, ctypes.c_void_p, ctypes.c_int',
+    'libvlc_dialog_post_login': '((1,), (1,), (1,), (1,),), None, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_bool',
+    'libvlc_dialog_set_context': '((1,), (1,),), None, None, ctypes.c_void_p, ctypes.c_void_p',
+    'libvlc_event_attach': '((1,), (1,), (1,), (1,),), None, ctypes.c_int, EventManager, ctypes.c_uint, Callback, ctypes.c_void_p',
+    'libvlc_event_detach': '((1,), (1,), (1,), (1,),), None, None, EventManager, ctypes.c_uint, Callback, ctypes.c_void_p',
+    'libvlc_event_type_name': '((1,),), None, ctypes.c_char_p, ctypes.c_uint',
+    'libvlc_free': '((1,),), None, None, ctypes.c_void_p',
+    'libvlc_get_changeset': '(), None, ctypes.c_char_p',
+    'libvlc_get_compiler': '(), None, ctypes.c_char_p',
+    'libvlc_get_fullscreen': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_get_log_verbosity': '((1,),), None, ctypes.c_uint, Instance',
+    'libvlc_get_version': '(), None, ctypes.c_char_p',
+    'libvlc_log_clear': '((1,),), None, None, Log_ptr',
+    'libvlc_log_close': '((1,),), None, None, Log_ptr',
+    'libvlc_log_count': '((1,),), None, ctypes.c_uint, Log_ptr',
+    'libvlc_log_get_context': '((1,), (2,), (2,), (2,),), None, None, Log_ptr, ListPOINTER(ctypes.c_char_p), ListPOINTER(ctypes.c_char_p), ctypes.POINTER(ctypes.c_uint)',
+    'libvlc_log_get_iterator': '((1,),), class_result(LogIterator), ctypes.c_void_p, Log_ptr',
+    'libvlc_log_get_object': '((1,), (2,), (2,), (1,),), None, None, Log_ptr, ListPOINTER(ctypes.c_char_p), ListPOINTER(ctypes.c_char_p), ctypes.POINTER(ctypes.c_uint)',
+    'libvlc_log_iterator_free': '((1,),), None, None, LogIterator',
+    'libvlc_log_iterator_has_next': '((1,),), None, ctypes.c_int, LogIterator',
+    'libvlc_log_iterator_next': '((1,), (1,),), None, ctypes.POINTER(LogMessage), LogIterator, ctypes.POINTER(LogMessage)',
+    'libvlc_log_open': '((1,),), None, Log_ptr, Instance',
+    'libvlc_log_set': '((1,), (1,), (1,),), None, None, Instance, LogCb, ctypes.c_void_p',
+    'libvlc_log_set_file': '((1,), (1,),), None, None, Instance, FILE_ptr',
+    'libvlc_log_unset': '((1,),), None, None, Instance',
+    'libvlc_media_add_option': '((1,), (1,),), None, None, Media, ctypes.c_char_p',
+    'libvlc_media_add_option_flag': '((1,), (1,), (1,),), None, None, Media, ctypes.c_char_p, ctypes.c_uint',
+    'libvlc_media_discoverer_event_manager': '((1,),), class_result(EventManager), ctypes.c_void_p, MediaDiscoverer',
+    'libvlc_media_discoverer_is_running': '((1,),), None, ctypes.c_int, MediaDiscoverer',
+    'libvlc_media_discoverer_list_get': '((1,), (1,), (1,),), None, ctypes.c_size_t, Instance, MediaDiscovererCategory, ctypes.POINTER(ctypes.POINTER(MediaDiscovererDescription))',
+    'libvlc_media_discoverer_list_release': '((1,), (1,),), None, None, ctypes.POINTER(MediaDiscovererDescription), ctypes.c_size_t',
+    'libvlc_media_discoverer_localized_name': '((1,),), string_result, ctypes.c_void_p, MediaDiscoverer',
+    'libvlc_media_discoverer_media_list': '((1,),), class_result(MediaList), ctypes.c_void_p, MediaDiscoverer',
+    'libvlc_media_discoverer_new': '((1,), (1,),), class_result(MediaDiscoverer), ctypes.c_void_p, Instance, ctypes.c_char_p',
+    'libvlc_media_discoverer_new_from_name': '((1,), (1,),), class_result(MediaDiscoverer), ctypes.c_void_p, Instance, ctypes.c_char_p',
+    'libvlc_media_discoverer_release': '((1,),), None, None, MediaDiscoverer',
+    'libvlc_media_discoverer_start': '((1,),), None, ctypes.c_int, MediaDiscoverer',
+    'libvlc_media_discoverer_stop': '((1,),), None, None, MediaDiscoverer',
+    'libvlc_media_duplicate': '((1,),), class_result(Media), ctypes.c_void_p, Media',
+    'libvlc_media_event_manager': '((1,),), class_result(EventManager), ctypes.c_void_p, Media',
+    'libvlc_media_get_codec_description': '((1,), (1,),), None, ctypes.c_char_p, TrackType, ctypes.c_uint32',
+    'libvlc_media_get_duration': '((1,),), None, ctypes.c_longlong, Media',
+    'libvlc_media_get_meta': '((1,), (1,),), string_result, ctypes.c_void_p, Media, Meta',
+    'libvlc_media_get_mrl': '((1,),), string_result, ctypes.c_void_p, Media',
+    'libvlc_media_get_parsed_status': '((1,),), None, MediaParsedStatus, Media',
+    'libvlc_media_get_state': '((1,),), None, State, Media',
+    'libvlc_media_get_stats': '((1,), (1,),), None, ctypes.c_int, Media, ctypes.POINTER(MediaStats)',
+    'libvlc_media_get_tracks_info': '((1,), (2,),), None, ctypes.c_int, Media, ctypes.POINTER(ctypes.c_void_p)',
+    'libvlc_media_get_type': '((1,),), None, MediaType, Media',
+    'libvlc_media_get_user_data': '((1,),), None, ctypes.c_void_p, Media',
+    'libvlc_media_is_parsed': '((1,),), None, ctypes.c_int, Media',
+    'libvlc_media_library_load': '((1,),), None, ctypes.c_int, MediaLibrary',
+    'libvlc_media_library_media_list': '((1,),), class_result(MediaList), ctypes.c_void_p, MediaLibrary',
+    'libvlc_media_library_new': '((1,),), class_result(MediaLibrary), ctypes.c_void_p, Instance',
+    'libvlc_media_library_release': '((1,),), None, None, MediaLibrary',
+    'libvlc_media_library_retain': '((1,),), None, None, MediaLibrary',
+    'libvlc_media_list_add_media': '((1,), (1,),), None, ctypes.c_int, MediaList, Media',
+    'libvlc_media_list_count': '((1,),), None, ctypes.c_int, MediaList',
+    'libvlc_media_list_event_manager': '((1,),), class_result(EventManager), ctypes.c_void_p, MediaList',
+    'libvlc_media_list_index_of_item': '((1,), (1,),), None, ctypes.c_int, MediaList, Media',
+    'libvlc_media_list_insert_media': '((1,), (1,), (1,),), None, ctypes.c_int, MediaList, Media, ctypes.c_int',
+    'libvlc_media_list_is_readonly': '((1,),), None, ctypes.c_int, MediaList',
+    'libvlc_media_list_item_at_index': '((1,), (1,),), class_result(Media), ctypes.c_void_p, MediaList, ctypes.c_int',
+    'libvlc_media_list_lock': '((1,),), None, None, MediaList',
+    'libvlc_media_list_media': '((1,),), class_result(Media), ctypes.c_void_p, MediaList',
+    'libvlc_media_list_new': '((1,),), class_result(MediaList), ctypes.c_void_p, Instance',
+    'libvlc_media_list_player_event_manager': '((1,),), class_result(EventManager), ctypes.c_void_p, MediaListPlayer',
+    'libvlc_media_list_player_get_media_player': '((1,),), class_result(MediaPlayer), ctypes.c_void_p, MediaListPlayer',
+    'libvlc_media_list_player_get_state': '((1,),), None, State, MediaListPlayer',
+    'libvlc_media_list_player_is_playing': '((1,),), None, ctypes.c_int, MediaListPlayer',
+    'libvlc_media_list_player_new': '((1,),), class_result(MediaListPlayer), ctypes.c_void_p, Instance',
+    'libvlc_media_list_player_next': '((1,),), None, ctypes.c_int, MediaListPlayer',
+    'libvlc_media_list_player_pause': '((1,),), None, None, MediaListPlayer',
+    'libvlc_media_list_player_play': '((1,),), None, None, MediaListPlayer',
+    'libvlc_media_list_player_play_item': '((1,), (1,),), None, ctypes.c_int, MediaListPlayer, Media',
+    'libvlc_media_list_player_play_item_at_index': '((1,), (1,),), None, ctypes.c_int, MediaListPlayer, ctypes.c_int',
+    'libvlc_media_list_player_previous': '((1,),), None, ctypes.c_int, MediaListPlayer',
+    'libvlc_media_list_player_release': '((1,),), None, None, MediaListPlayer',
+    'libvlc_media_list_player_retain': '((1,),), None, None, MediaListPlayer',
+    'libvlc_media_list_player_set_media_list': '((1,), (1,),), None, None, MediaListPlayer, MediaList',
+    'libvlc_media_list_player_set_media_player': '((1,), (1,),), None, None, MediaListPlayer, MediaPlayer',
+    'libvlc_media_list_player_set_playback_mode': '((1,), (1,),), None, None, MediaListPlayer, PlaybackMode',
+    'libvlc_media_list_player_stop': '((1,),), None, None, MediaListPlayer',
+    'libvlc_media_list_release': '((1,),), None, None, MediaList',
+    'libvlc_media_list_remove_index': '((1,), (1,),), None, ctypes.c_int, MediaList, ctypes.c_int',
+    'libvlc_media_list_retain': '((1,),), None, None, MediaList',
+    'libvlc_media_list_set_media': '((1,), (1,),), None, None, MediaList, Media',
+    'libvlc_media_list_unlock': '((1,),), None, None, MediaList',
+    'libvlc_media_new_as_node': '((1,), (1,),), class_result(Media), ctypes.c_void_p, Instance, ctypes.c_char_p',
+    'libvlc_media_new_callbacks': '((1,), (1,), (1,), (1,), (1,), (1,),), class_result(Media), ctypes.c_void_p, Instance, MediaOpenCb, MediaReadCb, MediaSeekCb, MediaCloseCb, ctypes.c_void_p',
+    'libvlc_media_new_fd': '((1,), (1,),), class_result(Media), ctypes.c_void_p, Instance, ctypes.c_int',
+    'libvlc_media_new_location': '((1,), (1,),), class_result(Media), ctypes.c_void_p, Instance, ctypes.c_char_p',
+    'libvlc_media_new_path': '((1,), (1,),), class_result(Media), ctypes.c_void_p, Instance, ctypes.c_char_p',
+    'libvlc_media_parse': '((1,),), None, None, Media',
+    'libvlc_media_parse_async': '((1,),), None, None, Media',
+    'libvlc_media_parse_stop': '((1,),), None, None, Media',
+    'libvlc_media_parse_with_options': '((1,), (1,), (1,),), None, ctypes.c_int, Media, MediaParseFlag, ctypes.c_int',
+    'libvlc_media_player_add_slave': '((1,), (1,), (1,), (1,),), None, ctypes.c_int, MediaPlayer, MediaSlaveType, ctypes.c_char_p, ctypes.c_bool',
+    'libvlc_media_player_can_pause': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_media_player_event_manager': '((1,),), class_result(EventManager), ctypes.c_void_p, MediaPlayer',
+    'libvlc_media_player_get_agl': '((1,),), None, ctypes.c_uint32, MediaPlayer',
+    'libvlc_media_player_get_chapter': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_media_player_get_chapter_count': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_media_player_get_chapter_count_for_title': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_int',
+    'libvlc_media_player_get_fps': '((1,),), None, ctypes.c_float, MediaPlayer',
+    'libvlc_media_player_get_full_chapter_descriptions': '((1,), (1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_int, ctypes.POINTER(ctypes.POINTER(ChapterDescription))',
+    'libvlc_media_player_get_full_title_descriptions': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.POINTER(ctypes.POINTER(TitleDescription))',
+    'libvlc_media_player_get_hwnd': '((1,),), None, ctypes.c_void_p, MediaPlayer',
+    'libvlc_media_player_get_length': '((1,),), None, ctypes.c_longlong, MediaPlayer',
+    'libvlc_media_player_get_media': '((1,),), class_result(Media), ctypes.c_void_p, MediaPlayer',
+    'libvlc_media_player_get_nsobject': '((1,),), None, ctypes.c_void_p, MediaPlayer',
+    'libvlc_media_player_get_position': '((1,),), None, ctypes.c_float, MediaPlayer',
+    'libvlc_media_player_get_rate': '((1,),), None, ctypes.c_float, MediaPlayer',
+    'libvlc_media_player_get_role': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_media_player_get_state': '((1,),), None, State, MediaPlayer',
+    'libvlc_media_player_get_time': '((1,),), None, ctypes.c_longlong, MediaPlayer',
+    'libvlc_media_player_get_title': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_media_player_get_title_count': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_media_player_get_xwindow': '((1,),), None, ctypes.c_uint32, MediaPlayer',
+    'libvlc_media_player_has_vout': '((1,),), None, ctypes.c_uint, MediaPlayer',
+    'libvlc_media_player_is_playing': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_media_player_is_seekable': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_media_player_navigate': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_uint',
+    'libvlc_media_player_new': '((1,),), class_result(MediaPlayer), ctypes.c_void_p, Instance',
+    'libvlc_media_player_new_from_media': '((1,),), class_result(MediaPlayer), ctypes.c_void_p, Media',
+    'libvlc_media_player_next_chapter': '((1,),), None, None, MediaPlayer',
+    'libvlc_media_player_next_frame': '((1,),), None, None, MediaPlayer',
+    'libvlc_media_player_pause': '((1,),), None, None, MediaPlayer',
+    'libvlc_media_player_play': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_media_player_previous_chapter': '((1,),), None, None, MediaPlayer',
+    'libvlc_media_player_program_scrambled': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_media_player_release': '((1,),), None, None, MediaPlayer',
+    'libvlc_media_player_retain': '((1,),), None, None, MediaPlayer',
+    'libvlc_media_player_set_agl': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_uint32',
+    'libvlc_media_player_set_android_context': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_void_p',
+    'libvlc_media_player_set_chapter': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_int',
+    'libvlc_media_player_set_equalizer': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_void_p',
+    'libvlc_media_player_set_evas_object': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_void_p',
+    'libvlc_media_player_set_hwnd': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_void_p',
+    'libvlc_media_player_set_media': '((1,), (1,),), None, None, MediaPlayer, Media',
+    'libvlc_media_player_set_nsobject': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_void_p',
+    'libvlc_media_player_set_pause': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_int',
+    'libvlc_media_player_set_position': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_float',
+    'libvlc_media_player_set_rate': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_float',
+    'libvlc_media_player_set_renderer': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_void_p',
+    'libvlc_media_player_set_role': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_uint',
+    'libvlc_media_player_set_time': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_longlong',
+    'libvlc_media_player_set_title': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_int',
+    'libvlc_media_player_set_video_title_display': '((1,), (1,), (1,),), None, None, MediaPlayer, Position, ctypes.c_int',
+    'libvlc_media_player_set_xwindow': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_uint32',
+    'libvlc_media_player_stop': '((1,),), None, None, MediaPlayer',
+    'libvlc_media_player_will_play': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_media_release': '((1,),), None, None, Media',
+    'libvlc_media_retain': '((1,),), None, None, Media',
+    'libvlc_media_save_meta': '((1,),), None, ctypes.c_int, Media',
+    'libvlc_media_set_meta': '((1,), (1,), (1,),), None, None, Media, Meta, ctypes.c_char_p',
+    'libvlc_media_set_user_data': '((1,), (1,),), None, None, Media, ctypes.c_void_p',
+    'libvlc_media_slaves_add': '((1,), (1,), (1,), (1,),), None, ctypes.c_int, Media, MediaSlaveType, ctypes.c_int, ctypes.c_char_p',
+    'libvlc_media_slaves_clear': '((1,),), None, None, Media',
+    'libvlc_media_slaves_get': '((1,), (1,),), None, ctypes.c_int, Media, ctypes.POINTER(ctypes.POINTER(MediaSlave))',
+    'libvlc_media_slaves_release': '((1,), (1,),), None, None, ctypes.POINTER(MediaSlave), ctypes.c_int',
+    'libvlc_media_subitems': '((1,),), class_result(MediaList), ctypes.c_void_p, Media',
+    'libvlc_media_tracks_get': '((1,), (1,),), None, ctypes.c_uint, Media, ctypes.POINTER(ctypes.POINTER(MediaTrack))',
+    'libvlc_media_tracks_release': '((1,), (1,),), None, None, ctypes.POINTER(MediaTrack), ctypes.c_uint',
+    'libvlc_module_description_list_release': '((1,),), None, None, ctypes.POINTER(ModuleDescription)',
+    'libvlc_new': '((1,), (1,),), class_result(Instance), ctypes.c_void_p, ctypes.c_int, ListPOINTER(ctypes.c_char_p)',
+    'libvlc_playlist_play': '((1,), (1,), (1,), (1,),), None, None, Instance, ctypes.c_int, ctypes.c_int, ListPOINTER(ctypes.c_char_p)',
+    'libvlc_release': '((1,),), None, None, Instance',
+    'libvlc_renderer_discoverer_event_manager': '((1,),), class_result(EventManager), ctypes.c_void_p, ctypes.c_void_p',
+    'libvlc_renderer_discoverer_list_get': '((1,), (1,),), None, ctypes.c_size_t, Instance, ctypes.POINTER(ctypes.POINTER(RDDescription))',
+    'libvlc_renderer_discoverer_list_release': '((1,), (1,),), None, None, ctypes.POINTER(RDDescription), ctypes.c_size_t',
+    'libvlc_renderer_discoverer_new': '((1,), (1,),), None, ctypes.c_void_p, Instance, ctypes.c_char_p',
+    'libvlc_renderer_discoverer_release': '((1,),), None, None, ctypes.c_void_p',
+    'libvlc_renderer_discoverer_start': '((1,),), None, ctypes.c_int, ctypes.c_void_p',
+    'libvlc_renderer_discoverer_stop': '((1,),), None, None, ctypes.c_void_p',
+    'libvlc_renderer_item_flags': '((1,),), None, ctypes.c_int, ctypes.c_void_p',
+    'libvlc_renderer_item_icon_uri': '((1,),), None, ctypes.c_char_p, ctypes.c_void_p',
+    'libvlc_renderer_item_name': '((1,),), None, ctypes.c_char_p, ctypes.c_void_p',
+    'libvlc_renderer_item_type': '((1,),), None, ctypes.c_char_p, ctypes.c_void_p',
+    'libvlc_retain': '((1,),), None, None, Instance',
+    'libvlc_set_app_id': '((1,), (1,), (1,), (1,),), None, None, Instance, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p',
+    'libvlc_set_fullscreen': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_int',
+    'libvlc_set_log_verbosity': '((1,), (1,),), None, None, Instance, ctypes.c_uint',
+    'libvlc_set_user_agent': '((1,), (1,), (1,),), None, None, Instance, ctypes.c_char_p, ctypes.c_char_p',
+    'libvlc_title_descriptions_release': '((1,), (1,),), None, None, ctypes.POINTER(TitleDescription), ctypes.c_uint',
+    'libvlc_toggle_fullscreen': '((1,),), None, None, MediaPlayer',
+    'libvlc_toggle_teletext': '((1,),), None, None, MediaPlayer',
+    'libvlc_track_description_list_release': '((1,),), None, None, ctypes.POINTER(TrackDescription)',
+    'libvlc_track_description_release': '((1,),), None, None, ctypes.POINTER(TrackDescription)',
+    'libvlc_video_filter_list_get': '((1,),), None, ctypes.POINTER(ModuleDescription), Instance',
+    'libvlc_video_get_adjust_float': '((1,), (1,),), None, ctypes.c_float, MediaPlayer, ctypes.c_uint',
+    'libvlc_video_get_adjust_int': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_uint',
+    'libvlc_video_get_aspect_ratio': '((1,),), string_result, ctypes.c_void_p, MediaPlayer',
+    'libvlc_video_get_chapter_description': '((1,), (1,),), None, ctypes.POINTER(TrackDescription), MediaPlayer, ctypes.c_int',
+    'libvlc_video_get_crop_geometry': '((1,),), string_result, ctypes.c_void_p, MediaPlayer',
+    'libvlc_video_get_cursor': '((1,), (1,), (2,), (2,),), None, ctypes.c_int, MediaPlayer, ctypes.c_uint, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int)',
+    'libvlc_video_get_height': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_video_get_logo_int': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_uint',
+    'libvlc_video_get_marquee_int': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_uint',
+    'libvlc_video_get_marquee_string': '((1,), (1,),), string_result, ctypes.c_void_p, MediaPlayer, ctypes.c_uint',
+    'libvlc_video_get_scale': '((1,),), None, ctypes.c_float, MediaPlayer',
+    'libvlc_video_get_size': '((1,), (1,), (2,), (2,),), None, ctypes.c_int, MediaPlayer, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint)',
+    'libvlc_video_get_spu': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_video_get_spu_count': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_video_get_spu_delay': '((1,),), None, ctypes.c_int64, MediaPlayer',
+    'libvlc_video_get_spu_description': '((1,),), None, ctypes.POINTER(TrackDescription), MediaPlayer',
+    'libvlc_video_get_teletext': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_video_get_title_description': '((1,),), None, ctypes.POINTER(TrackDescription), MediaPlayer',
+    'libvlc_video_get_track': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_video_get_track_count': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_video_get_track_description': '((1,),), None, ctypes.POINTER(TrackDescription), MediaPlayer',
+    'libvlc_video_get_width': '((1,),), None, ctypes.c_int, MediaPlayer',
+    'libvlc_video_new_viewpoint': '(), None, VideoViewpoint',
+    'libvlc_video_set_adjust_float': '((1,), (1,), (1,),), None, None, MediaPlayer, ctypes.c_uint, ctypes.c_float',
+    'libvlc_video_set_adjust_int': '((1,), (1,), (1,),), None, None, MediaPlayer, ctypes.c_uint, ctypes.c_int',
+    'libvlc_video_set_aspect_ratio': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_char_p',
+    'libvlc_video_set_callbacks': '((1,), (1,), (1,), (1,), (1,),), None, None, MediaPlayer, VideoLockCb, VideoUnlockCb, VideoDisplayCb, ctypes.c_void_p',
+    'libvlc_video_set_crop_geometry': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_char_p',
+    'libvlc_video_set_deinterlace': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_char_p',
+    'libvlc_video_set_format': '((1,), (1,), (1,), (1,), (1,),), None, None, MediaPlayer, ctypes.c_char_p, ctypes.c_uint, ctypes.c_uint, ctypes.c_uint',
+    'libvlc_video_set_format_callbacks': '((1,), (1,), (1,),), None, None, MediaPlayer, VideoFormatCb, VideoCleanupCb',
+    'libvlc_video_set_key_input': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_uint',
+    'libvlc_video_set_logo_int': '((1,), (1,), (1,),), None, None, MediaPlayer, ctypes.c_uint, ctypes.c_int',
+    'libvlc_video_set_logo_string': '((1,), (1,), (1,),), None, None, MediaPlayer, ctypes.c_uint, ctypes.c_char_p',
+    'libvlc_video_set_marquee_int': '((1,), (1,), (1,),), None, None, MediaPlayer, ctypes.c_uint, ctypes.c_int',
+    'libvlc_video_set_marquee_string': '((1,), (1,), (1,),), None, None, MediaPlayer, ctypes.c_uint, ctypes.c_char_p',
+    'libvlc_video_set_mouse_input': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_uint',
+    'libvlc_video_set_scale': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_float',
+    'libvlc_video_set_spu': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_int',
+    'libvlc_video_set_spu_delay': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_int64',
+    'libvlc_video_set_subtitle_file': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_char_p',
+    'libvlc_video_set_teletext': '((1,), (1,),), None, None, MediaPlayer, ctypes.c_int',
+    'libvlc_video_set_track': '((1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_int',
+    'libvlc_video_take_snapshot': '((1,), (1,), (1,), (1,), (1,),), None, ctypes.c_int, MediaPlayer, ctypes.c_uint, ctypes.c_char_p, ctypes.c_int, ctypes.c_int',
+    'libvlc_video_update_viewpoint': '((1,), (1,), (1,),), None, ctypes.c_int, MediaPlayer, VideoViewpoint, ctypes.c_bool',
+    'libvlc_vlm_add_broadcast': '((1,), (1,), (1,), (1,), (1,), (1,), (1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ListPOINTER(ctypes.c_char_p), ctypes.c_int, ctypes.c_int',
+    'libvlc_vlm_add_input': '((1,), (1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p, ctypes.c_char_p',
+    'libvlc_vlm_add_vod': '((1,), (1,), (1,), (1,), (1,), (1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ListPOINTER(ctypes.c_char_p), ctypes.c_int, ctypes.c_char_p',
+    'libvlc_vlm_change_media': '((1,), (1,), (1,), (1,), (1,), (1,), (1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ListPOINTER(ctypes.c_char_p), ctypes.c_int, ctypes.c_int',
+    'libvlc_vlm_del_media': '((1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p',
+    'libvlc_vlm_get_event_manager': '((1,),), class_result(EventManager), ctypes.c_void_p, Instance',
+    'libvlc_vlm_get_media_instance_chapter': '((1,), (1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p, ctypes.c_int',
+    'libvlc_vlm_get_media_instance_length': '((1,), (1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p, ctypes.c_int',
+    'libvlc_vlm_get_media_instance_position': '((1,), (1,), (1,),), None, ctypes.c_float, Instance, ctypes.c_char_p, ctypes.c_int',
+    'libvlc_vlm_get_media_instance_rate': '((1,), (1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p, ctypes.c_int',
+    'libvlc_vlm_get_media_instance_seekable': '((1,), (1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p, ctypes.c_int',
+    'libvlc_vlm_get_media_instance_time': '((1,), (1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p, ctypes.c_int',
+    'libvlc_vlm_get_media_instance_title': '((1,), (1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p, ctypes.c_int',
+    'libvlc_vlm_pause_media': '((1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p',
+    'libvlc_vlm_play_media': '((1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p',
+    'libvlc_vlm_release': '((1,),), None, None, Instance',
+    'libvlc_vlm_seek_media': '((1,), (1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p, ctypes.c_float',
+    'libvlc_vlm_set_enabled': '((1,), (1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p, ctypes.c_int',
+    'libvlc_vlm_set_input': '((1,), (1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p, ctypes.c_char_p',
+    'libvlc_vlm_set_loop': '((1,), (1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p, ctypes.c_int',
+    'libvlc_vlm_set_mux': '((1,), (1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p, ctypes.c_char_p',
+    'libvlc_vlm_set_output': '((1,), (1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p, ctypes.c_char_p',
+    'libvlc_vlm_show_media': '((1,), (1,),), string_result, ctypes.c_void_p, Instance, ctypes.c_char_p',
+    'libvlc_vlm_stop_media': '((1,), (1,),), None, ctypes.c_int, Instance, ctypes.c_char_p',
+    'libvlc_vprinterr': '((1,), (1,),), None, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_void_p',
+    'libvlc_wait': '((1,),), None, None, Instance',
+}
+
+# 'Class.method' -> source of the method
+_methods = {
+    'EventManager._create_registry': 'def _create_registry(self):\n    _called_from_ctypes = ctypes.CFUNCTYPE(None, ctypes.POINTER(Event), ctypes.c_void_p)\n    subscribers = {}\n    @_called_from_ctypes\n    def _callback_handler(event, k):\n        """(INTERNAL) handle callback call from ctypes.\n\n        @note: We cannot simply make this an EventManager\n        method since ctypes does not prepend self as the\n        first parameter, hence this closure.\n        """\n        # deref event.contents once to simplify callback code\n        event = event.contents\n        for call, args, kwds in subscribers.get(k, ()):\n            # a failing subscriber must not keep the event from the others\n            try:\n                call(event, *args, **kwds)\n            except Exception:\n                logger.error(\'Callback %r for %s failed\', call, event.type, exc_info=True)\n    self._lock = threading.Lock()\n    self._callback_handler = _callback_handler\n    # event types the trampoline is attached to, it stays attached as long as the registry\n    self._attached = set()\n    self._subscribers = subscribers\n',
+    'EventManager._registry': "def _registry(self):\n    try:\n        return self._subscribers\n    except AttributeError:\n        pass\n    with self._registry_lock:\n        if '_subscribers' not in self.__dict__:\n            self._create_registry()\n    return self._subscribers\n",
+    'EventManager.event_attach': 'def event_attach(self, eventtype, callback, *args, **kwds):\n    if not isinstance(eventtype, EventType):\n        raise VLCException("%s required: %r" % (\'EventType\', eventtype))\n    if not hasattr(callback, \'__call__\'):  # callable()\n        raise VLCException("%s required: %r" % (\'callable\', callback))\n     # check once that the callback accepts the event and the given arguments,\n     # inspect is imported here since it is slow to import\n    from inspect import signature\n    try:\n        signature(callback).bind(None, *args, **kwds)\n    except TypeError:\n        raise VLCException("%s required: %r" % (\'argument\', callback))\n    except ValueError:  # no signature (builtins), trust the caller\n        pass\n\n    subscribers = self._registry()\n    k = eventtype.value\n    entry = (callback, args, kwds)\n    with self._lock:\n        subscribers[k] = subscribers.get(k, ()) + (entry,)\n        # the native trampoline is attached once per event type\n        attach = k not in self._attached\n        self._attached.add(k)\n    if not attach:\n        return 0\n    r = libvlc_event_attach(self, k, self._callback_handler, k)\n    if r:\n        with self._lock:\n            self._attached.discard(k)\n            callbacks = tuple(c for c in subscribers.get(k, ()) if c is not entry)\n            if callbacks:\n                subscribers[k] = callbacks\n            else:\n                subscribers.pop(k, None)\n    return r\n',
+    'EventManager.event_detach': 'def event_detach(self, eventtype, callback=None):\n    if not isinstance(eventtype, EventType):\n        raise VLCException("%s required: %r" % (\'EventType\', eventtype))\n\n    subscribers = self._registry()\n    k = eventtype.value\n    with self._lock:\n        callbacks = subscribers.get(k, ())\n        if callback is not None:\n            callbacks = tuple(c for c in callbacks if c[0] != callback)\n        else:\n            callbacks = ()\n        if callbacks:\n            subscribers[k] = callbacks\n        else:\n            subscribers.pop(k, None)\n',
+    'Instance.add_intf': 'def add_intf(self, name):\n    return libvlc_add_intf(self, str_to_bytes(name))\n',
+    'Instance.audio_filter_list_get': 'def audio_filter_list_get(self):\n    return module_description_list(libvlc_audio_filter_list_get(self))\n',
+    'Instance.audio_output_device_count': 'def audio_output_device_count(self, psz_audio_output):\n    return libvlc_audio_output_device_count(self, str_to_bytes(psz_audio_output))\n',
+    'Instance.audio_output_device_id': 'def audio_output_device_id(self, psz_audio_output, i_device):\n    return libvlc_audio_output_device_id(self, str_to_bytes(psz_audio_output), i_device)\n',
+    'Instance.audio_output_device_list_get': 'def audio_output_device_list_get(self, aout):\n    return libvlc_audio_output_device_list_get(self, str_to_bytes(aout))\n',
+    'Instance.audio_output_device_longname': 'def audio_output_device_longname(self, psz_output, i_device):\n    return libvlc_audio_output_device_longname(self, str_to_bytes(psz_output), i_device)\n',
+    'Instance.audio_output_enumerate_devices': "def audio_output_enumerate_devices(self):\n    r = []\n    head = libvlc_audio_output_list_get(self)\n    if head:\n        i = head\n        while i:\n            i = i.contents\n            d = [{'id':       libvlc_audio_output_device_id      (self, i.name, d),\n                  'longname': libvlc_audio_output_device_longname(self, i.name, d)}\n               for d in range(libvlc_audio_output_device_count   (self, i.name))]\n            r.append({'name': i.name, 'description': i.description, 'devices': d})\n            i = i.next\n        libvlc_audio_output_list_release(head)\n    return r\n",
+    'Instance.audio_output_list_get': 'def audio_output_list_get(self):\n    return libvlc_audio_output_list_get(self)\n',
+    'Instance.get_log_verbosity': 'def get_log_verbosity(self):\n    return libvlc_get_log_verbosity(self)\n',
+    'Instance.log_open': 'def log_open(self):\n    return libvlc_log_open(self)\n',
+    'Instance.log_set': 'def log_set(self, cb, data):\n    return libvlc_log_set(self, cb, data)\n',
+    'Instance.log_set_file': 'def log_set_file(self, stream):\n    return libvlc_log_set_file(self, stream)\n',
+    'Instance.log_unset': 'def log_unset(self):\n    return libvlc_log_unset(self)\n',
+    'Instance.media_discoverer_list_get': 'def media_discoverer_list_get(self, i_cat, ppp_services):\n    return libvlc_media_discoverer_list_get(self, i_cat, ppp_services)\n',
+    'Instance.media_discoverer_new': 'def media_discoverer_new(self, psz_name):\n    return libvlc_media_discoverer_new(self, str_to_bytes(psz_name))\n',
+    'Instance.media_discoverer_new_from_name': 'def media_discoverer_new_from_name(self, psz_name):\n    return libvlc_media_discoverer_new_from_name(self, str_to_bytes(psz_name))\n',
+    'Instance.media_library_new': 'def media_library_new(self):\n    return libvlc_media_library_new(self)\n',
+    'Instance.media_list_new': 'def media_list_new(self, mrls=None):\n    l = libvlc_media_list_new(self)\n    # We should take the lock, but since we did not leak the\n    # reference, nobody else can access it.\n    if mrls:\n        for m in mrls:\n            l.add_media(m)\n    l._instance = self\n    return l\n',
+    'Instance.media_list_player_new': 'def media_list_player_new(self):\n    p = libvlc_media_list_player_new(self)\n    p._instance = self\n    return p\n',
+    'Instance.media_new': "def media_new(self, mrl, *options):\n    if ':' in mrl and mrl.index(':') > 1:\n        # Assume it is a URL\n        m = libvlc_media_new_location(self, str_to_bytes(mrl))\n    else:\n        # Else it should be a local path.\n        m = libvlc_media_new_path(self, str_to_bytes(os.path.normpath(mrl)))\n    for o in options:\n        libvlc_media_add_option(m, str_to_bytes(o))\n    m._instance = self\n    return m\n",
+    'Instance.media_new_as_node': 'def media_new_as_node(self, psz_name):\n    return libvlc_media_new_as_node(self, str_to_bytes(psz_name))\n',
+    'Instance.media_new_callbacks': 'def media_new_callbacks(self, open_cb, read_cb, seek_cb, close_cb, opaque):\n    return libvlc_media_new_callbacks(self, open_cb, read_cb, seek_cb, close_cb, opaque)\n',
+    'Instance.media_new_fd': 'def media_new_fd(self, fd):\n    return libvlc_media_new_fd(self, fd)\n',
+    'Instance.media_new_location': 'def media_new_location(self, psz_mrl):\n    return libvlc_media_new_location(self, str_to_bytes(psz_mrl))\n',
+    'Instance.media_new_path': 'def media_new_path(self, path):\n    return libvlc_media_new_path(self, str_to_bytes(path))\n',
+    'Instance.media_player_new': 'def media_player_new(self, uri=None):\n    p = libvlc_media_player_new(self)\n    if uri:\n        p.set_media(self.media_new(uri))\n    p._instance = self\n    return p\n',
+    'Instance.playlist_play': 'def playlist_play(self, i_id, i_options, ppsz_options):\n    return libvlc_playlist_play(self, i_id, i_options, ppsz_options)\n',
+    'Instance.release': 'def release(self):\n    return libvlc_release(self)\n',
+    'Instance.renderer_discoverer_list_get': 'def renderer_discoverer_list_get(self, ppp_services):\n    return libvlc_renderer_discoverer_list_get(self, ppp_services)\n',
+    'Instance.renderer_discoverer_new': 'def renderer_discoverer_new(self, psz_name):\n    return libvlc_renderer_discoverer_new(self, str_to_bytes(psz_name))\n',
+    'Instance.retain': 'def retain(self):\n    return libvlc_retain(self)\n',
+    'Instance.set_app_id': 'def set_app_id(self, id, version, icon):\n    return libvlc_set_app_id(self, str_to_bytes(id), str_to_bytes(version), str_to_bytes(icon))\n',
+    'Instance.set_log_verbosity': 'def set_log_verbosity(self, level):\n    return libvlc_set_log_verbosity(self, level)\n',
+    'Instance.set_user_agent': 'def set_user_agent(self, name, http):\n    return libvlc_set_user_agent(self, str_to_bytes(name), str_to_bytes(http))\n',
+    'Instance.video_filter_list_get': 'def video_filter_list_get(self):\n    return module_description_list(libvlc_video_filter_list_get(self))\n',
+    'Instance.vlm_add_broadcast': 'def vlm_add_broadcast(self, psz_name, psz_input, psz_output, i_options, ppsz_options, b_enabled, b_loop):\n    return libvlc_vlm_add_broadcast(self, str_to_bytes(psz_name), str_to_bytes(psz_input), str_to_bytes(psz_output), i_options, ppsz_options, b_enabled, b_loop)\n',
+    'Instance.vlm_add_input': 'def vlm_add_input(self, psz_name, psz_input):\n    return libvlc_vlm_add_input(self, str_to_bytes(psz_name), str_to_bytes(psz_input))\n',
+    'Instance.vlm_add_vod': 'def vlm_add_vod(self, psz_name, psz_input, i_options, ppsz_options, b_enabled, psz_mux):\n    return libvlc_vlm_add_vod(self, str_to_bytes(psz_name), str_to_bytes(psz_input), i_options, ppsz_options, b_enabled, str_to_bytes(psz_mux))\n',
+    'Instance.vlm_change_media': 'def vlm_change_media(self, psz_name, psz_input, psz_output, i_options, ppsz_options, b_enabled, b_loop):\n    return libvlc_vlm_change_media(self, str_to_bytes(psz_name), str_to_bytes(psz_input), str_to_bytes(psz_output), i_options, ppsz_options, b_enabled, b_loop)\n',
+    'Instance.vlm_del_media': 'def vlm_del_media(self, psz_name):\n    return libvlc_vlm_del_media(self, str_to_bytes(psz_name))\n',
+    'Instance.vlm_get_media_instance_chapter': 'def vlm_get_media_instance_chapter(self, psz_name, i_instance):\n    return libvlc_vlm_get_media_instance_chapter(self, str_to_bytes(psz_name), i_instance)\n',
+    'Instance.vlm_get_media_instance_length': 'def vlm_get_media_instance_length(self, psz_name, i_instance):\n    return libvlc_vlm_get_media_instance_length(self, str_to_bytes(psz_name), i_instance)\n',
+    'Instance.vlm_get_media_instance_position': 'def vlm_get_media_instance_position(self, psz_name, i_instance):\n    return libvlc_vlm_get_media_instance_position(self, str_to_bytes(psz_name), i_instance)\n',
+    'Instance.vlm_get_media_instance_rate': 'def vlm_get_media_instance_rate(self, psz_name, i_instance):\n    return libvlc_vlm_get_media_instance_rate(self, str_to_bytes(psz_name), i_instance)\n',
+    'Instance.vlm_get_media_instance_seekable': 'def vlm_get_media_instance_seekable(self, psz_name, i_instance):\n    return libvlc_vlm_get_media_instance_seekable(self, str_to_bytes(psz_name), i_instance)\n',
+    'Instance.vlm_get_media_instance_time': 'def vlm_get_media_instance_time(self, psz_name, i_instance):\n    return libvlc_vlm_get_media_instance_time(self, str_to_bytes(psz_name), i_instance)\n',
+    'Instance.vlm_get_media_instance_title': 'def vlm_get_media_instance_title(self, psz_name, i_instance):\n    return libvlc_vlm_get_media_instance_title(self, str_to_bytes(psz_name), i_instance)\n',
+    'Instance.vlm_pause_media': 'def vlm_pause_media(self, psz_name):\n    return libvlc_vlm_pause_media(self, str_to_bytes(psz_name))\n',
+    'Instance.vlm_play_media': 'def vlm_play_media(self, psz_name):\n    return libvlc_vlm_play_media(self, str_to_bytes(psz_name))\n',
+    'Instance.vlm_release': 'def vlm_release(self):\n    return libvlc_vlm_release(self)\n',
+    'Instance.vlm_seek_media': 'def vlm_seek_media(self, psz_name, f_percentage):\n    return libvlc_vlm_seek_media(self, str_to_bytes(psz_name), f_percentage)\n',
+    'Instance.vlm_set_enabled': 'def vlm_set_enabled(self, psz_name, b_enabled):\n    return libvlc_vlm_set_enabled(self, str_to_bytes(psz_name), b_enabled)\n',
+    'Instance.vlm_set_input': 'def vlm_set_input(self, psz_name, psz_input):\n    return libvlc_vlm_set_input(self, str_to_bytes(psz_name), str_to_bytes(psz_input))\n',
+    'Instance.vlm_set_loop': 'def vlm_set_loop(self, psz_name, b_loop):\n    return libvlc_vlm_set_loop(self, str_to_bytes(psz_name), b_loop)\n',
+    'Instance.vlm_set_mux': 'def vlm_set_mux(self, psz_name, psz_mux):\n    return libvlc_vlm_set_mux(self, str_to_bytes(psz_name), str_to_bytes(psz_mux))\n',
+    'Instance.vlm_set_output': 'def vlm_set_output(self, psz_name, psz_output):\n    return libvlc_vlm_set_output(self, str_to_bytes(psz_name), str_to_bytes(psz_output))\n',
+    'Instance.vlm_show_media': 'def vlm_show_media(self, psz_name):\n    return libvlc_vlm_show_media(self, str_to_bytes(psz_name))\n',
+    'Instance.vlm_stop_media': 'def vlm_stop_media(self, psz_name):\n    return libvlc_vlm_stop_media(self, str_to_bytes(psz_name))\n',
+    'Instance.wait': 'def wait(self):\n    return libvlc_wait(self)\n',
+    'LogIterator.free': 'def free(self):\n    return libvlc_log_iterator_free(self)\n',
+    'LogIterator.has_next': 'def has_next(self):\n    return libvlc_log_iterator_has_next(self)\n',
+    'LogIterator.next': 'def next(self):\n    if self.has_next():\n        b = LogMessage()\n        i = libvlc_log_iterator_next(self, b)\n        return i.contents\n    raise StopIteration\n',
+    'Media.add_option': 'def add_option(self, psz_options):\n    return libvlc_media_add_option(self, str_to_bytes(psz_options))\n',
+    'Media.add_option_flag': 'def add_option_flag(self, psz_options, i_flags):\n    return libvlc_media_add_option_flag(self, str_to_bytes(psz_options), i_flags)\n',
+    'Media.add_options': 'def add_options(self, *options):\n    for o in options:\n        self.add_option(o)\n',
+    'Media.duplicate': 'def duplicate(self):\n    return libvlc_media_duplicate(self)\n',
+    'Media.get_duration': 'def get_duration(self):\n    return libvlc_media_get_duration(self)\n',
+    'Media.get_instance': "def get_instance(self):\n    return getattr(self, '_instance', None)\n",
+    'Media.get_meta': 'def get_meta(self, e_meta):\n    return libvlc_media_get_meta(self, e_meta)\n',
+    'Media.get_mrl': 'def get_mrl(self):\n    return libvlc_media_get_mrl(self)\n',
+    'Media.get_parsed_status': 'def get_parsed_status(self):\n    return libvlc_media_get_parsed_status(self)\n',
+    'Media.get_state': 'def get_state(self):\n    return libvlc_media_get_state(self)\n',
+    'Media.get_stats': 'def get_stats(self, p_stats):\n    return libvlc_media_get_stats(self, p_stats)\n',
+    'Media.get_tracks_info': 'def get_tracks_info(self):\n    return libvlc_media_get_tracks_info(self)\n',
+    'Media.get_type': 'def get_type(self):\n    return libvlc_media_get_type(self)\n',
+    'Media.get_user_data': 'def get_user_data(self):\n    return libvlc_media_get_user_data(self)\n',
+    'Media.is_parsed': 'def is_parsed(self):\n    return libvlc_media_is_parsed(self)\n',
+    'Media.parse': 'def parse(self):\n    return libvlc_media_parse(self)\n',
+    'Media.parse_async': 'def parse_async(self):\n    return libvlc_media_parse_async(self)\n',
+    'Media.parse_stop': 'def parse_stop(self):\n    return libvlc_media_parse_stop(self)\n',
+    'Media.parse_with_options': 'def parse_with_options(self, parse_flag, timeout):\n    return libvlc_media_parse_with_options(self, parse_flag, timeout)\n',
+    'Media.player_new_from_media': 'def player_new_from_media(self):\n    return libvlc_media_player_new_from_media(self)\n',
+    'Media.release': 'def release(self):\n    return libvlc_media_release(self)\n',
+    'Media.retain': 'def retain(self):\n    return libvlc_media_retain(self)\n',
+    'Media.save_meta': 'def save_meta(self):\n    return libvlc_media_save_meta(self)\n',
+    'Media.set_meta': 'def set_meta(self, e_meta, psz_value):\n    return libvlc_media_set_meta(self, e_meta, str_to_bytes(psz_value))\n',
+    'Media.set_user_data': 'def set_user_data(self, p_new_user_data):\n    return libvlc_media_set_user_data(self, p_new_user_data)\n',
+    'Media.slaves_add': 'def slaves_add(self, i_type, i_priority, psz_uri):\n    return libvlc_media_slaves_add(self, i_type, i_priority, str_to_bytes(psz_uri))\n',
+    'Media.slaves_clear': 'def slaves_clear(self):\n    return libvlc_media_slaves_clear(self)\n',
+    'Media.slaves_get': 'def slaves_get(self, ppp_slaves):\n    return libvlc_media_slaves_get(self, ppp_slaves)\n',
+    'Media.subitems': 'def subitems(self):\n    return libvlc_media_subitems(self)\n',
+    'Media.tracks_get': 'def tracks_get(self):\n    mediaTrack_pp = ctypes.POINTER(MediaTrack)()\n    n = libvlc_media_tracks_get(self, ctypes.byref(mediaTrack_pp))\n    info = ctypes.cast(mediaTrack_pp, ctypes.POINTER(ctypes.POINTER(MediaTrack) * n))\n    try:\n        contents = info.contents\n    except ValueError:\n        # Media not parsed, no info.\n        return None\n    tracks = ( contents[i].contents for i in range(len(contents)) )\n    # libvlc_media_tracks_release(mediaTrack_pp, n)\n    return tracks\n',
+    'MediaDiscoverer.is_running': 'def is_running(self):\n    return libvlc_media_discoverer_is_running(self)\n',
+    'MediaDiscoverer.localized_name': 'def localized_name(self):\n    return libvlc_media_discoverer_localized_name(self)\n',
+    'MediaDiscoverer.media_list': 'def media_list(self):\n    return libvlc_media_discoverer_media_list(self)\n',
+    'MediaDiscoverer.release': 'def release(self):\n    return libvlc_media_discoverer_release(self)\n',
+    'MediaDiscoverer.start': 'def start(self):\n    return libvlc_media_discoverer_start(self)\n',
+    'MediaDiscoverer.stop': 'def stop(self):\n    return libvlc_media_discoverer_stop(self)\n',
+    'MediaLibrary.load': 'def load(self):\n    return libvlc_media_library_load(self)\n',
+    'MediaLibrary.media_list': 'def media_list(self):\n    return libvlc_media_library_media_list(self)\n',
+    'MediaLibrary.release': 'def release(self):\n    return libvlc_media_library_release(self)\n',
+    'MediaLibrary.retain': 'def retain(self):\n    return libvlc_media_library_retain(self)\n',
+    'MediaList.add_media': 'def add_media(self, mrl):\n    if isinstance(mrl, basestring):\n        mrl = (self.get_instance() or get_default_instance()).media_new(mrl)\n    return libvlc_media_list_add_media(self, mrl)\n',
+    'MediaList.count': 'def count(self):\n    return libvlc_media_list_count(self)\n',
+    'MediaList.get_instance': "def get_instance(self):\n    return getattr(self, '_instance', None)\n",
+    'MediaList.index_of_item': 'def index_of_item(self, p_md):\n    return libvlc_media_list_index_of_item(self, p_md)\n',
+    'MediaList.insert_media': 'def insert_media(self, p_md, i_pos):\n    return libvlc_media_list_insert_media(self, p_md, i_pos)\n',
+    'MediaList.is_readonly': 'def is_readonly(self):\n    return libvlc_media_list_is_readonly(self)\n',
+    'MediaList.item_at_index': 'def item_at_index(self, i_pos):\n    return libvlc_media_list_item_at_index(self, i_pos)\n',
+    'MediaList.lock': 'def lock(self):\n    return libvlc_media_list_lock(self)\n',
+    'MediaList.media': 'def media(self):\n    return libvlc_media_list_media(self)\n',
+    'MediaList.release': 'def release(self):\n    return libvlc_media_list_release(self)\n',
+    'MediaList.remove_index': 'def remove_index(self, i_pos):\n    return libvlc_media_list_remove_index(self, i_pos)\n',
+    'MediaList.retain': 'def retain(self):\n    return libvlc_media_list_retain(self)\n',
+    'MediaList.set_media': 'def set_media(self, p_md):\n    return libvlc_media_list_set_media(self, p_md)\n',
+    'MediaList.unlock': 'def unlock(self):\n    return libvlc_media_list_unlock(self)\n',
+    'MediaListPlayer.get_instance': 'def get_instance(self):\n    return self._instance  #PYCHOK expected\n',
+    'MediaListPlayer.get_media_player': 'def get_media_player(self):\n    return libvlc_media_list_player_get_media_player(self)\n',
+    'MediaListPlayer.get_state': 'def get_state(self):\n    return libvlc_media_list_player_get_state(self)\n',
+    'MediaListPlayer.is_playing': 'def is_playing(self):\n    return libvlc_media_list_player_is_playing(self)\n',
+    'MediaListPlayer.next': 'def next(self):\n    return libvlc_media_list_player_next(self)\n',
+    'MediaListPlayer.pause': 'def pause(self):\n    return libvlc_media_list_player_pause(self)\n',
+    'MediaListPlayer.play': 'def play(self):\n    return libvlc_media_list_player_play(self)\n',
+    'MediaListPlayer.play_item': 'def play_item(self, p_md):\n    return libvlc_media_list_player_play_item(self, p_md)\n',
+    'MediaListPlayer.play_item_at_index': 'def play_item_at_index(self, i_index):\n    return libvlc_media_list_player_play_item_at_index(self, i_index)\n',
+    'MediaListPlayer.previous': 'def previous(self):\n    return libvlc_media_list_player_previous(self)\n',
+    'MediaListPlayer.release': 'def release(self):\n    return libvlc_media_list_player_release(self)\n',
+    'MediaListPlayer.retain': 'def retain(self):\n    return libvlc_media_list_player_retain(self)\n',
+    'MediaListPlayer.set_media_list': 'def set_media_list(self, p_mlist):\n    return libvlc_media_list_player_set_media_list(self, p_mlist)\n',
+    'MediaListPlayer.set_media_player': 'def set_media_player(self, p_mi):\n    return libvlc_media_list_player_set_media_player(self, p_mi)\n',
+    'MediaListPlayer.set_playback_mode': 'def set_playback_mode(self, e_mode):\n    return libvlc_media_list_player_set_playback_mode(self, e_mode)\n',
+    'MediaListPlayer.stop': 'def stop(self):\n    return libvlc_media_list_player_stop(self)\n',
+    'MediaPlayer.add_slave': 'def add_slave(self, i_type, psz_uri, b_select):\n    return libvlc_media_player_add_slave(self, i_type, str_to_bytes(psz_uri), b_select)\n',
+    'MediaPlayer.audio_get_channel': 'def audio_get_channel(self):\n    return libvlc_audio_get_channel(self)\n',
+    'MediaPlayer.audio_get_delay': 'def audio_get_delay(self):\n    return libvlc_audio_get_delay(self)\n',
+    'MediaPlayer.audio_get_mute': 'def audio_get_mute(self):\n    return libvlc_audio_get_mute(self)\n',
+    'MediaPlayer.audio_get_track': 'def audio_get_track(self):\n    return libvlc_audio_get_track(self)\n',
+    'MediaPlayer.audio_get_track_count': 'def audio_get_track_count(self):\n    return libvlc_audio_get_track_count(self)\n',
+    'MediaPlayer.audio_get_track_description': 'def audio_get_track_description(self):\n    return track_description_list(libvlc_audio_get_track_description(self))\n',
+    'MediaPlayer.audio_get_volume': 'def audio_get_volume(self):\n    return libvlc_audio_get_volume(self)\n',
+    'MediaPlayer.audio_output_device_enum': 'def audio_output_device_enum(self):\n    return libvlc_audio_output_device_enum(self)\n',
+    'MediaPlayer.audio_output_device_get': 'def audio_output_device_get(self):\n    return libvlc_audio_output_device_get(self)\n',
+    'MediaPlayer.audio_output_device_set': 'def audio_output_device_set(self, module, device_id):\n    return libvlc_audio_output_device_set(self, str_to_bytes(module), str_to_bytes(device_id))\n',
+    'MediaPlayer.audio_output_set': 'def audio_output_set(self, psz_name):\n    return libvlc_audio_output_set(self, str_to_bytes(psz_name))\n',
+    'MediaPlayer.audio_set_callbacks': 'def audio_set_callbacks(self, play, pause, resume, flush, drain, opaque):\n    return libvlc_audio_set_callbacks(self, play, pause, resume, flush, drain, opaque)\n',
+    'MediaPlayer.audio_set_channel': 'def audio_set_channel(self, channel):\n    return libvlc_audio_set_channel(self, channel)\n',
+    'MediaPlayer.audio_set_delay': 'def audio_set_delay(self, i_delay):\n    return libvlc_audio_set_delay(self, i_delay)\n',
+    'MediaPlayer.audio_set_format': 'def audio_set_format(self, format, rate, channels):\n    return libvlc_audio_set_format(self, str_to_bytes(format), rate, channels)\n',
+    'MediaPlayer.audio_set_format_callbacks': 'def audio_set_format_callbacks(self, setup, cleanup):\n    return libvlc_audio_set_format_callbacks(self, setup, cleanup)\n',
+    'MediaPlayer.audio_set_mute': 'def audio_set_mute(self, status):\n    return libvlc_audio_set_mute(self, status)\n',
+    'MediaPlayer.audio_set_track': 'def audio_set_track(self, i_track):\n    return libvlc_audio_set_track(self, i_track)\n',
+    'MediaPlayer.audio_set_volume': 'def audio_set_volume(self, i_volume):\n    return libvlc_audio_set_volume(self, i_volume)\n',
+    'MediaPlayer.audio_set_volume_callback': 'def audio_set_volume_callback(self, set_volume):\n    return libvlc_audio_set_volume_callback(self, set_volume)\n',
+    'MediaPlayer.audio_toggle_mute': 'def audio_toggle_mute(self):\n    return libvlc_audio_toggle_mute(self)\n',
+    'MediaPlayer.can_pause': 'def can_pause(self):\n    return libvlc_media_player_can_pause(self)\n',
+    'MediaPlayer.get_agl': 'def get_agl(self):\n    return libvlc_media_player_get_agl(self)\n',
+    'MediaPlayer.get_chapter': 'def get_chapter(self):\n    return libvlc_media_player_get_chapter(self)\n',
+    'MediaPlayer.get_chapter_count': 'def get_chapter_count(self):\n    return libvlc_media_player_get_chapter_count(self)\n',
+    'MediaPlayer.get_chapter_count_for_title': 'def get_chapter_count_for_title(self, i_title):\n    return libvlc_media_player_get_chapter_count_for_title(self, i_title)\n',
+    'MediaPlayer.get_fps': 'def get_fps(self):\n    return libvlc_media_player_get_fps(self)\n',
+    'MediaPlayer.get_full_chapter_descriptions': 'def get_full_chapter_descriptions(self, i_chapters_of_title):\n    chapterDescription_pp = ctypes.POINTER(ChapterDescription)()\n    n = libvlc_media_player_get_full_chapter_descriptions(self, ctypes.byref(chapterDescription_pp))\n    info = ctypes.cast(ctypes.chapterDescription_pp, ctypes.POINTER(ctypes.POINTER(ChapterDescription) * n))\n    return info\n',
+    'MediaPlayer.get_full_title_descriptions': 'def get_full_title_descriptions(self):\n    titleDescription_pp = ctypes.POINTER(TitleDescription)()\n    n = libvlc_media_player_get_full_title_descriptions(self, ctypes.byref(titleDescription_pp))\n    info = ctypes.cast(ctypes.titleDescription_pp, ctypes.POINTER(ctypes.POINTER(TitleDescription) * n))\n    return info\n',
+    'MediaPlayer.get_fullscreen': 'def get_fullscreen(self):\n    return libvlc_get_fullscreen(self)\n',
+    'MediaPlayer.get_hwnd': 'def get_hwnd(self):\n    return libvlc_media_player_get_hwnd(self)\n',
+    'MediaPlayer.get_instance': 'def get_instance(self):\n    return self._instance  #PYCHOK expected\n',
+    'MediaPlayer.get_length': 'def get_length(self):\n    return libvlc_media_player_get_length(self)\n',
+    'MediaPlayer.get_media': 'def get_media(self):\n    return libvlc_media_player_get_media(self)\n',
+    'MediaPlayer.get_nsobject': 'def get_nsobject(self):\n    return libvlc_media_player_get_nsobject(self)\n',
+    'MediaPlayer.get_position': 'def get_position(self):\n    return libvlc_media_player_get_position(self)\n',
+    'MediaPlayer.get_rate': 'def get_rate(self):\n    return libvlc_media_player_get_rate(self)\n',
+    'MediaPlayer.get_role': 'def get_role(self):\n    return libvlc_media_player_get_role(self)\n',
+    'MediaPlayer.get_state': 'def get_state(self):\n    return libvlc_media_player_get_state(self)\n',
+    'MediaPlayer.get_time': 'def get_time(self):\n    return libvlc_media_player_get_time(self)\n',
+    'MediaPlayer.get_title': 'def get_title(self):\n    return libvlc_media_player_get_title(self)\n',
+    'MediaPlayer.get_title_count': 'def get_title_count(self):\n    return libvlc_media_player_get_title_count(self)\n',
+    'MediaPlayer.get_xwindow': 'def get_xwindow(self):\n    return libvlc_media_player_get_xwindow(self)\n',
+    'MediaPlayer.has_vout': 'def has_vout(self):\n    return libvlc_media_player_has_vout(self)\n',
+    'MediaPlayer.is_playing': 'def is_playing(self):\n    return libvlc_media_player_is_playing(self)\n',
+    'MediaPlayer.is_seekable': 'def is_seekable(self):\n    return libvlc_media_player_is_seekable(self)\n',
+    'MediaPlayer.navigate': 'def navigate(self, navigate):\n    return libvlc_media_player_navigate(self, navigate)\n',
+    'MediaPlayer.next_chapter': 'def next_chapter(self):\n    return libvlc_media_player_next_chapter(self)\n',
+    'MediaPlayer.next_frame': 'def next_frame(self):\n    return libvlc_media_player_next_frame(self)\n',
+    'MediaPlayer.pause': 'def pause(self):\n    return libvlc_media_player_pause(self)\n',
+    'MediaPlayer.play': 'def play(self):\n    return libvlc_media_player_play(self)\n',
+    'MediaPlayer.previous_chapter': 'def previous_chapter(self):\n    return libvlc_media_player_previous_chapter(self)\n',
+    'MediaPlayer.program_scrambled': 'def program_scrambled(self):\n    return libvlc_media_player_program_scrambled(self)\n',
+    'MediaPlayer.release': 'def release(self):\n    return libvlc_media_player_release(self)\n',
+    'MediaPlayer.retain': 'def retain(self):\n    return libvlc_media_player_retain(self)\n',
+    'MediaPlayer.set_agl': 'def set_agl(self, drawable):\n    return libvlc_media_player_set_agl(self, drawable)\n',
+    'MediaPlayer.set_android_context': 'def set_android_context(self, p_awindow_handler):\n    return libvlc_media_player_set_android_context(self, p_awindow_handler)\n',
+    'MediaPlayer.set_chapter': 'def set_chapter(self, i_chapter):\n    return libvlc_media_player_set_chapter(self, i_chapter)\n',
+    'MediaPlayer.set_equalizer': 'def set_equalizer(self, p_equalizer):\n    return libvlc_media_player_set_equalizer(self, p_equalizer)\n',
+    'MediaPlayer.set_evas_object': 'def set_evas_object(self, p_evas_object):\n    return libvlc_media_player_set_evas_object(self, p_evas_object)\n',
+    'MediaPlayer.set_fullscreen': 'def set_fullscreen(self, b_fullscreen):\n    return libvlc_set_fullscreen(self, b_fullscreen)\n',
+    'MediaPlayer.set_hwnd': 'def set_hwnd(self, drawable):\n    if not isinstance(drawable, ctypes.c_void_p):\n        drawable = ctypes.c_void_p(int(drawable))\n    libvlc_media_player_set_hwnd(self, drawable)\n',
+    'MediaPlayer.set_media': 'def set_media(self, p_md):\n    return libvlc_media_player_set_media(self, p_md)\n',
+    'MediaPlayer.set_mrl': 'def set_mrl(self, mrl, *options):\n    m = self.get_instance().media_new(mrl, *options)\n    self.set_media(m)\n    return m\n',
+    'MediaPlayer.set_nsobject': 'def set_nsobject(self, drawable):\n    return libvlc_media_player_set_nsobject(self, drawable)\n',
+    'MediaPlayer.set_pause': 'def set_pause(self, do_pause):\n    return libvlc_media_player_set_pause(self, do_pause)\n',
+    'MediaPlayer.set_position': 'def set_position(self, f_pos):\n    return libvlc_media_player_set_position(self, f_pos)\n',
+    'MediaPlayer.set_rate': 'def set_rate(self, rate):\n    return libvlc_media_player_set_rate(self, rate)\n',
+    'MediaPlayer.set_renderer': 'def set_renderer(self, p_item):\n    return libvlc_media_player_set_renderer(self, p_item)\n',
+    'MediaPlayer.set_role': 'def set_role(self, role):\n    return libvlc_media_player_set_role(self, role)\n',
+    'MediaPlayer.set_time': 'def set_time(self, i_time):\n    return libvlc_media_player_set_time(self, i_time)\n',
+    'MediaPlayer.set_title': 'def set_title(self, i_title):\n    return libvlc_media_player_set_title(self, i_title)\n',
+    'MediaPlayer.set_video_title_display': 'def set_video_title_display(self, position, timeout):\n    return libvlc_media_player_set_video_title_display(self, position, timeout)\n',
+    'MediaPlayer.set_xwindow': 'def set_xwindow(self, drawable):\n    return libvlc_media_player_set_xwindow(self, drawable)\n',
+    'MediaPlayer.stop': 'def stop(self):\n    return libvlc_media_player_stop(self)\n',
+    'MediaPlayer.toggle_fullscreen': 'def toggle_fullscreen(self):\n    return libvlc_toggle_fullscreen(self)\n',
+    'MediaPlayer.toggle_teletext': 'def toggle_teletext(self):\n    return libvlc_toggle_teletext(self)\n',
+    'MediaPlayer.video_get_adjust_float': 'def video_get_adjust_float(self, option):\n    return libvlc_video_get_adjust_float(self, option)\n',
+    'MediaPlayer.video_get_adjust_int': 'def video_get_adjust_int(self, option):\n    return libvlc_video_get_adjust_int(self, option)\n',
+    'MediaPlayer.video_get_aspect_ratio': 'def video_get_aspect_ratio(self):\n    return libvlc_video_get_aspect_ratio(self)\n',
+    'MediaPlayer.video_get_chapter_description': 'def video_get_chapter_description(self, title):\n    return track_description_list(libvlc_video_get_chapter_description(self, title))\n',
+    'MediaPlayer.video_get_crop_geometry': 'def video_get_crop_geometry(self):\n    return libvlc_video_get_crop_geometry(self)\n',
+    'MediaPlayer.video_get_cursor': "def video_get_cursor(self, num=0):\n    r = libvlc_video_get_cursor(self, num)\n    if isinstance(r, tuple) and len(r) == 2:\n        return r\n    raise VLCException('invalid video number (%s)' % (num,))\n",
+    'MediaPlayer.video_get_height': 'def video_get_height(self, num=0):\n    return self.video_get_size(num)[1]\n',
+    'MediaPlayer.video_get_logo_int': 'def video_get_logo_int(self, option):\n    return libvlc_video_get_logo_int(self, option)\n',
+    'MediaPlayer.video_get_marquee_int': 'def video_get_marquee_int(self, option):\n    return libvlc_video_get_marquee_int(self, option)\n',
+    'MediaPlayer.video_get_marquee_string': 'def video_get_marquee_string(self, option):\n    return libvlc_video_get_marquee_string(self, option)\n',
+    'MediaPlayer.video_get_scale': 'def video_get_scale(self):\n    return libvlc_video_get_scale(self)\n',
+    'MediaPlayer.video_get_size': "def video_get_size(self, num=0):\n    r = libvlc_video_get_size(self, num)\n    if isinstance(r, tuple) and len(r) == 2:\n        return r\n    else:\n        raise VLCException('invalid video number (%s)' % (num,))\n",
+    'MediaPlayer.video_get_spu': 'def video_get_spu(self):\n    return libvlc_video_get_spu(self)\n',
+    'MediaPlayer.video_get_spu_count': 'def video_get_spu_count(self):\n    return libvlc_video_get_spu_count(self)\n',
+    'MediaPlayer.video_get_spu_delay': 'def video_get_spu_delay(self):\n    return libvlc_video_get_spu_delay(self)\n',
+    'MediaPlayer.video_get_spu_description': 'def video_get_spu_description(self):\n    return track_description_list(libvlc_video_get_spu_description(self))\n',
+    'MediaPlayer.video_get_teletext': 'def video_get_teletext(self):\n    return libvlc_video_get_teletext(self)\n',
+    'MediaPlayer.video_get_title_description': 'def video_get_title_description(self):\n    return track_description_list(libvlc_video_get_title_description(self))\n',
+    'MediaPlayer.video_get_track': 'def video_get_track(self):\n    return libvlc_video_get_track(self)\n',
+    'MediaPlayer.video_get_track_count': 'def video_get_track_count(self):\n    return libvlc_video_get_track_count(self)\n',
+    'MediaPlayer.video_get_track_description': 'def video_get_track_description(self):\n    return track_description_list(libvlc_video_get_track_description(self))\n',
+    'MediaPlayer.video_get_width': 'def video_get_width(self, num=0):\n    return self.video_get_size(num)[0]\n',
+    'MediaPlayer.video_set_adjust_float': 'def video_set_adjust_float(self, option, value):\n    return libvlc_video_set_adjust_float(self, option, value)\n',
+    'MediaPlayer.video_set_adjust_int': 'def video_set_adjust_int(self, option, value):\n    return libvlc_video_set_adjust_int(self, option, value)\n',
+    'MediaPlayer.video_set_aspect_ratio': 'def video_set_aspect_ratio(self, psz_aspect):\n    return libvlc_video_set_aspect_ratio(self, str_to_bytes(psz_aspect))\n',
+    'MediaPlayer.video_set_callbacks': 'def video_set_callbacks(self, lock, unlock, display, opaque):\n    return libvlc_video_set_callbacks(self, lock, unlock, display, opaque)\n',
+    'MediaPlayer.video_set_crop_geometry': 'def video_set_crop_geometry(self, psz_geometry):\n    return libvlc_video_set_crop_geometry(self, str_to_bytes(psz_geometry))\n',
+    'MediaPlayer.video_set_deinterlace': 'def video_set_deinterlace(self, psz_mode):\n    return libvlc_video_set_deinterlace(self, str_to_bytes(psz_mode))\n',
+    'MediaPlayer.video_set_format': 'def video_set_format(self, chroma, width, height, pitch):\n    return libvlc_video_set_format(self, str_to_bytes(chroma), width, height, pitch)\n',
+    'MediaPlayer.video_set_format_callbacks': 'def video_set_format_callbacks(self, setup, cleanup):\n    return libvlc_video_set_format_callbacks(self, setup, cleanup)\n',
+    'MediaPlayer.video_set_key_input': 'def video_set_key_input(self, on):\n    return libvlc_video_set_key_input(self, on)\n',
+    'MediaPlayer.video_set_logo_int': 'def video_set_logo_int(self, option, value):\n    return libvlc_video_set_logo_int(self, option, value)\n',
+    'MediaPlayer.video_set_logo_string': 'def video_set_logo_string(self, option, psz_value):\n    return libvlc_video_set_logo_string(self, option, str_to_bytes(psz_value))\n',
+    'MediaPlayer.video_set_marquee_int': 'def video_set_marquee_int(self, option, i_val):\n    return libvlc_video_set_marquee_int(self, option, i_val)\n',
+    'MediaPlayer.video_set_marquee_string': 'def video_set_marquee_string(self, option, psz_text):\n    return libvlc_video_set_marquee_string(self, option, str_to_bytes(psz_text))\n',
+    'MediaPlayer.video_set_mouse_input': 'def video_set_mouse_input(self, on):\n    return libvlc_video_set_mouse_input(self, on)\n',
+    'MediaPlayer.video_set_scale': 'def video_set_scale(self, f_factor):\n    return libvlc_video_set_scale(self, f_factor)\n',
+    'MediaPlayer.video_set_spu': 'def video_set_spu(self, i_spu):\n    return libvlc_video_set_spu(self, i_spu)\n',
+    'MediaPlayer.video_set_spu_delay': 'def video_set_spu_delay(self, i_delay):\n    return libvlc_video_set_spu_delay(self, i_delay)\n',
+    'MediaPlayer.video_set_subtitle_file': 'def video_set_subtitle_file(self, psz_subtitle):\n    return libvlc_video_set_subtitle_file(self, str_to_bytes(psz_subtitle))\n',
+    'MediaPlayer.video_set_teletext': 'def video_set_teletext(self, i_page):\n    return libvlc_video_set_teletext(self, i_page)\n',
+    'MediaPlayer.video_set_track': 'def video_set_track(self, i_track):\n    return libvlc_video_set_track(self, i_track)\n',
+    'MediaPlayer.video_take_snapshot': 'def video_take_snapshot(self, num, psz_filepath, i_width, i_height):\n    return libvlc_video_take_snapshot(self, num, str_to_bytes(psz_filepath), i_width, i_height)\n',
+    'MediaPlayer.video_update_viewpoint': 'def video_update_viewpoint(self, p_viewpoint, b_absolute):\n    return libvlc_video_update_viewpoint(self, p_viewpoint, b_absolute)\n',
+    'MediaPlayer.will_play': 'def will_play(self):\n    return libvlc_media_player_will_play(self)\n',
+}
+
+for _name in _bindings:
+    _Globals[_name] = _Binding(_name)
+del _name